@@ -5,6 +5,8 @@
 #              are available and how they're implemented.
 #              Don't modify the contents of this file.
 
+import os
+from bisect import bisect_left, bisect_right
 
 # -------------- Used by both HashMaps (SC & OA)  -------------- #
 
@@ -78,6 +80,16 @@ class DynamicArray:
         return len(self._data)
 
 
+def as_list(items) -> list:
+    """
+    Return the elements of a DynamicArray or any other iterable as a list,
+    for batch operations that accept either.
+    """
+    if isinstance(items, DynamicArray):
+        return [items.get_at_index(index) for index in range(items.length())]
+    return list(items)
+
+
 def hash_function_1(key: str) -> int:
     """Sample Hash function #1 to be used with HashMap implementation"""
     hash = 0
@@ -96,6 +108,116 @@ def hash_function_2(key: str) -> int:
     return hash
 
 
+# Seeded hash functions: hash_function_1 collides for any permutation of the
+# same characters, so a chosen (or merely unlucky) key set can put every key
+# in one chain or probe sequence. These keep each key's hash dependent on a
+# secret seed; pass the function they return as the HashMap `function`.
+
+_MASK_64 = (1 << 64) - 1
+
+
+def _seed_words(seed: int) -> tuple:
+    """Split a 128-bit seed into two 64-bit words (random if seed is None)."""
+    if seed is None:
+        seed = int.from_bytes(os.urandom(16), 'little')
+    return seed & _MASK_64, (seed >> 64) & _MASK_64
+
+
+def siphash(k0: int, k1: int, data: bytes) -> int:
+    """
+    SipHash-2-4 of data under the 128-bit key (k0, k1), as a 64-bit integer.
+    A keyed hash designed against hash flooding: without the key, inputs
+    that collide cannot be found faster than by brute force.
+    """
+    v0 = k0 ^ 0x736f6d6570736575
+    v1 = k1 ^ 0x646f72616e646f6d
+    v2 = k0 ^ 0x6c7967656e657261
+    v3 = k1 ^ 0x7465646279746573
+
+    # Little-endian 8-byte words; the last one carries the length byte
+    end = len(data) - len(data) % 8
+    words = [int.from_bytes(data[start:start + 8], 'little')
+             for start in range(0, end, 8)]
+    words.append(int.from_bytes(data[end:], 'little')
+                 | ((len(data) & 0xFF) << 56))
+
+    # Two SipRounds per word, then four to finalize
+    for word in words + [None]:
+        if word is None:
+            v2 ^= 0xFF
+            count = 4
+        else:
+            v3 ^= word
+            count = 2
+
+        for _ in range(count):
+            v0 = (v0 + v1) & _MASK_64
+            v1 = ((v1 << 13) | (v1 >> 51)) & _MASK_64 ^ v0
+            v0 = ((v0 << 32) | (v0 >> 32)) & _MASK_64
+            v2 = (v2 + v3) & _MASK_64
+            v3 = ((v3 << 16) | (v3 >> 48)) & _MASK_64 ^ v2
+            v0 = (v0 + v3) & _MASK_64
+            v3 = ((v3 << 21) | (v3 >> 43)) & _MASK_64 ^ v0
+            v2 = (v2 + v1) & _MASK_64
+            v1 = ((v1 << 17) | (v1 >> 47)) & _MASK_64 ^ v2
+            v2 = ((v2 << 32) | (v2 >> 32)) & _MASK_64
+
+        if word is not None:
+            v0 ^= word
+
+    return v0 ^ v1 ^ v2 ^ v3
+
+
+def make_siphash_function(seed: int = None) -> callable:
+    """
+    Return a hash function for HashMap that applies SipHash-2-4 to the
+    UTF-8 encoding of the key.
+
+    :param seed:    128-bit integer key; None draws one from os.urandom
+    :return:        callable(str) -> int
+    """
+    k0, k1 = _seed_words(seed)
+
+    def siphash_function(key: str) -> int:
+        """Keyed SipHash-2-4 of the key."""
+        return siphash(k0, k1, key.encode('utf-8'))
+
+    return siphash_function
+
+
+def make_fnv_function(seed: int = None) -> callable:
+    """
+    Return a fast, seeded, non-cryptographic hash function for HashMap:
+    FNV-1a applied to 8-byte words of the UTF-8 encoded key instead of
+    single bytes, followed by the xxHash64 avalanche so that every output
+    bit depends on every input bit. It spreads ordinary keys well and
+    varies with the seed, but unlike make_siphash_function it does not
+    stand up to an attacker who studies its outputs.
+
+    :param seed:    integer seed; None draws one from os.urandom
+    :return:        callable(str) -> int
+    """
+    k0, k1 = _seed_words(seed)
+    basis = 0xCBF29CE484222325 ^ k0 ^ k1
+
+    def fnv_function(key: str) -> int:
+        """Seeded word-wise FNV-1a of the key."""
+        data = key.encode('utf-8')
+        hash = basis ^ len(data)
+        for start in range(0, len(data), 8):
+            hash ^= int.from_bytes(data[start:start + 8], 'little')
+            hash = (hash * 0x100000001B3) & _MASK_64
+
+        # xxHash64 avalanche
+        hash ^= hash >> 33
+        hash = (hash * 0xC2B2AE3D27D4EB4F) & _MASK_64
+        hash ^= hash >> 29
+        hash = (hash * 0x165667B19E3779F9) & _MASK_64
+        return hash ^ (hash >> 32)
+
+    return fnv_function
+
+
 # --------- For use in Separate Chaining (SC) HashMap  --------- #
 
 class SLNode:
@@ -103,11 +225,18 @@ class SLNode:
     Singly Linked List node for use in a hash map
     """
 
-    def __init__(self, key: str, value: object, next: "SLNode" = None) -> None:
-        """Initialize node given a key and value."""
+    __slots__ = ('key', 'value', 'next', 'hash')
+
+    def __init__(self, key: str, value: object, next: "SLNode" = None,
+                 hash: int = None) -> None:
+        """
+        Initialize node given a key and value. The full (unreduced) hash of
+        the key is kept so the node can be rehashed without hashing the key.
+        """
         self.key = key
         self.value = value
         self.next = next
+        self.hash = hash
 
     def __str__(self) -> str:
         """Override string method to provide more readable output."""
@@ -119,6 +248,8 @@ class LinkedListIterator:
     Separate iterator class for LinkedList
     """
 
+    __slots__ = ('_node',)
+
     def __init__(self, current_node: SLNode) -> None:
         """Initialize the iterator with a node."""
         self._node = current_node
@@ -144,6 +275,8 @@ class LinkedList:
     Supported methods are: insert, remove, contains, length, iterator
     """
 
+    __slots__ = ('_head', '_size')
+
     def __init__(self) -> None:
         """
         Initialize new linked list;
@@ -152,6 +285,17 @@ class LinkedList:
         self._head = None
         self._size = 0
 
+    @classmethod
+    def from_chain(cls, head: SLNode, size: int) -> "LinkedList":
+        """
+        Return a list whose nodes are an existing chain of size nodes
+        starting at head. The chain is shared, not copied.
+        """
+        chain = cls()
+        chain._head = head
+        chain._size = size
+        return chain
+
     def __str__(self) -> str:
         """Override string method to provide more readable output."""
         if not self._head:
@@ -168,16 +312,26 @@ class LinkedList:
         """Return an iterator for the list, starting at the head."""
         return LinkedListIterator(self._head)
 
-    def insert(self, key: str, value: object) -> None:
+    def insert(self, key: str, value: object, hash: int = None) -> None:
         """Insert new node at front of the list."""
-        self._head = SLNode(key, value, self._head)
+        self._head = SLNode(key, value, self._head, hash)
         self._size += 1
 
-    def remove(self, key: str) -> bool:
+    def insert_node(self, node: SLNode) -> None:
+        """Link an existing node at front of the list."""
+        node.next = self._head
+        self._head = node
+        self._size += 1
+
+    def remove(self, key: str, hash: int = None) -> bool:
         """
         Remove first node with matching key.
+        If the key's hash is given, it is compared before the key itself.
         Return True if removal was successful, False otherwise.
         """
+        if hash is not None:
+            return self.remove_node(key, hash) is not None
+
         previous, node = None, self._head
         while node:
 
@@ -192,9 +346,61 @@ class LinkedList:
             previous, node = node, node.next
         return False
 
-    def contains(self, key: str) -> SLNode:
-        """Return node with matching key, or None if no match"""
+    def remove_node(self, key: str, hash: int,
+                    counter: list = None) -> SLNode:
+        """
+        Unlink first node with matching hash and key in a single pass.
+        Return the unlinked node, or None if no match.
+        If counter (a one-element list) is given, the number of nodes
+        visited is added to counter[0].
+        """
+        previous, node = None, self._head
+        if counter is None:
+            while node and not (node.hash == hash and node.key == key):
+                previous, node = node, node.next
+        else:
+            visited = 0
+            while node:
+                visited += 1
+                if node.hash == hash and node.key == key:
+                    break
+                previous, node = node, node.next
+            counter[0] += visited
+
+        if node:
+            if previous:
+                previous.next = node.next
+            else:
+                self._head = node.next
+            self._size -= 1
+        return node
+
+    def contains(self, key: str, hash: int = None,
+                 counter: list = None) -> SLNode:
+        """
+        Return node with matching key, or None if no match.
+        If the key's hash is given, it is compared before the key itself.
+        If counter (a one-element list) is given, the number of nodes
+        visited is added to counter[0].
+        """
         node = self._head
+        if counter is not None:
+            visited = 0
+            while node:
+                visited += 1
+                if (hash is None or node.hash == hash) and node.key == key:
+                    break
+                node = node.next
+            counter[0] += visited
+            return node
+
+        if hash is not None:
+            while node:
+                if node.hash == hash and node.key == key:
+                    return node
+                node = node.next
+            return node
+
         while node:
             if node.key == key:
                 return node
@@ -206,14 +412,144 @@ class LinkedList:
         return self._size
 
 
+def _bucket_order(node: SLNode) -> tuple:
+    """Sort key of a node in a SortedBucket: full hash, then key text."""
+    return node.hash, str(node.key)
+
+
+class SortedBucket:
+    """
+    Bucket for long chains in a hash map, with the same methods as
+    LinkedList. Nodes are kept in a list sorted by (hash, str(key)), so
+    contains, insert and remove find a key by binary search instead of a
+    linear scan. Every node must carry its full hash.
+    """
+
+    __slots__ = ('_order', '_nodes')
+
+    def __init__(self, nodes=()) -> None:
+        """Initialize bucket holding the given nodes (e.g. a LinkedList)."""
+        self._nodes = sorted(nodes, key=_bucket_order)
+        self._order = [_bucket_order(node) for node in self._nodes]
+
+    def __str__(self) -> str:
+        """Override string method to provide more readable output."""
+        return 'SortedBucket [' + \
+            ' -> '.join(str(node) for node in self._nodes) + ']'
+
+    def __iter__(self):
+        """Return an iterator over the nodes, in sorted order."""
+        return iter(self._nodes)
+
+    def _locate(self, key: str, hash: int, counter: list = None) -> int:
+        """
+        Return the position of the node with matching key, or -1.
+        If counter (a one-element list) is given, the binary search runs in
+        Python and its comparisons, plus the nodes checked after it, are
+        added to counter[0].
+        """
+        order = (hash, str(key))
+        if counter is None:
+            index = bisect_left(self._order, order)
+        else:
+            # Same search as bisect_left, counting each comparison
+            low, high = 0, len(self._order)
+            while low < high:
+                middle = (low + high) // 2
+                if self._order[middle] < order:
+                    low = middle + 1
+                else:
+                    high = middle
+                counter[0] += 1
+            index = low
+
+        # Distinct keys may share both hash and text (e.g. 1 and '1')
+        while index < len(self._order) and self._order[index] == order:
+            if counter is not None:
+                counter[0] += 1
+            if self._nodes[index].key == key:
+                return index
+            index += 1
+        return -1
+
+    def insert(self, key: str, value: object, hash: int = None) -> None:
+        """Insert new node in sorted position."""
+        self.insert_node(SLNode(key, value, None, hash))
+
+    def insert_node(self, node: SLNode) -> None:
+        """Insert an existing node in sorted position."""
+        node.next = None
+        order = _bucket_order(node)
+        index = bisect_right(self._order, order)
+        self._order.insert(index, order)
+        self._nodes.insert(index, node)
+
+    def remove(self, key: str, hash: int = None) -> bool:
+        """
+        Remove node with matching key.
+        Return True if removal was successful, False otherwise.
+        """
+        if hash is None:
+            node = self.contains(key)
+            if node is None:
+                return False
+            hash = node.hash
+        return self.remove_node(key, hash) is not None
+
+    def remove_node(self, key: str, hash: int,
+                    counter: list = None) -> SLNode:
+        """
+        Remove node with matching hash and key.
+        Return the removed node, or None if no match.
+        If counter is given, the search is counted as in _locate.
+        """
+        index = self._locate(key, hash, counter)
+        if index == -1:
+            return None
+
+        del self._order[index]
+        return self._nodes.pop(index)
+
+    def contains(self, key: str, hash: int = None,
+                 counter: list = None) -> SLNode:
+        """
+        Return node with matching key, or None if no match.
+        Without the key's hash, every node is scanned.
+        If counter is given, the search is counted as in _locate.
+        """
+        if hash is None:
+            for visited, node in enumerate(self._nodes, 1):
+                if node.key == key:
+                    break
+            else:
+                visited, node = len(self._nodes), None
+            if counter is not None:
+                counter[0] += visited
+            return node
+
+        index = self._locate(key, hash, counter)
+        return self._nodes[index] if index != -1 else None
+
+    def length(self) -> int:
+        """Return the number of nodes in the bucket."""
+        return len(self._nodes)
+
+
 # ---------- For use in Open Addressing (OA) HashMap  ---------- #
 
 class HashEntry:
 
-    def __init__(self, key: str, value: object) -> None:
-        """Initialize an entry for use in a hash map."""
+    __slots__ = ('key', 'value', 'hash', 'is_tombstone')
+
+    def __init__(self, key: str, value: object, hash: int = None) -> None:
+        """
+        Initialize an entry for use in a hash map. The full (unreduced) hash
+        of the key is kept so the entry can be rehashed without hashing
+        the key, and probes can compare hashes before comparing keys.
+        """
         self.key = key
         self.value = value
+        self.hash = hash
 
         # Set this value to True when you "delete" a HashEntry
         self.is_tombstone = False
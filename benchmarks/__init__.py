@@ -0,0 +1,2 @@
+# Benchmarks for the HashMap implementations.
+# Run from the repository root, e.g. `python -m benchmarks.bench_resize`.
@@ -0,0 +1,69 @@
+# Description: Adversarial keys against each hash function. Every key is a
+#              permutation of the same letters, so hash_function_1 gives all
+#              of them the same value. Reports the longest separate chaining
+#              chain, the longest open addressing probe sequence and the put
+#              cost per key; with the seeded functions from a6_include both
+#              lengths stay small.
+
+import argparse
+import itertools
+import time
+
+import hash_map_oa
+import hash_map_sc
+from a6_include import (hash_function_1, hash_function_2, make_fnv_function,
+                        make_siphash_function)
+from benchmarks.common import print_table
+
+
+def probe_length(m, key: str) -> int:
+    """Return the number of slots an open addressing get(key) examines."""
+    capacity = m.get_capacity()
+    initial_index = m._hash_function(key) % capacity
+    j = 0
+    while m._buckets.get_at_index((initial_index + j * j) % capacity).key \
+            != key:
+        j += 1
+    return j + 1
+
+
+def timed_load(cls, function, keys: list):
+    """Return a map holding every key and the seconds spent filling it."""
+    start = time.perf_counter()
+    m = cls(11, function)
+    for key in keys:
+        m.put(key, key)
+    return m, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--letters', default='abcdefg',
+                        help='keys are all permutations of these letters')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    keys = [''.join(p) for p in itertools.permutations(args.letters)]
+    functions = (
+        ('hash_function_1', hash_function_1),
+        ('hash_function_2', hash_function_2),
+        ('fnv (seeded)', make_fnv_function(args.seed)),
+        ('siphash (seeded)', make_siphash_function(args.seed)),
+    )
+
+    rows = []
+    for name, function in functions:
+        sc, sc_seconds = timed_load(hash_map_sc.HashMap, function, keys)
+        chain = max(sc._buckets.get_at_index(index).length()
+                    for index in range(sc.get_capacity()))
+        oa, oa_seconds = timed_load(hash_map_oa.HashMap, function, keys)
+        probes = max(probe_length(oa, key) for key in keys)
+        rows.append((name, len(keys), chain,
+                     f"{sc_seconds / len(keys) * 1e6:.1f}", probes,
+                     f"{oa_seconds / len(keys) * 1e6:.1f}"))
+    print_table(('function', 'keys', 'SC max chain', 'SC us/put',
+                 'OA max probes', 'OA us/put'), rows)
+
+
+if __name__ == '__main__':
+    main()
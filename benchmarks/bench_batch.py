@@ -0,0 +1,57 @@
+# Description: Compares put_many/get_many with the equivalent loops of
+#              put()/get() calls on both HashMaps. With hash_function_1 or
+#              hash_function_2 the batch calls also hash every key in one
+#              NumPy pass when NumPy is installed.
+
+import argparse
+
+import hash_map_oa
+import hash_map_sc
+from a6_include import hash_function_1, hash_function_2
+from benchmarks.common import best_of, make_keys, print_table, spread_hash
+
+FUNCTIONS = {
+    'spread': spread_hash,
+    'hash_function_1': hash_function_1,
+    'hash_function_2': hash_function_2,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--keys', type=int, default=1_000_000)
+    parser.add_argument('--function', choices=FUNCTIONS, default='spread')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    function = FUNCTIONS[args.function]
+    keys = make_keys(args.keys)
+    pairs = [(key, index) for index, key in enumerate(keys)]
+    rows = []
+    for module in (hash_map_sc, hash_map_oa):
+        def put_loop():
+            m = module.HashMap(11, function)
+            for key, value in pairs:
+                m.put(key, value)
+
+        def put_many():
+            module.HashMap(11, function).put_many(pairs)
+
+        loaded = module.HashMap(11, function)
+        loaded.put_many(pairs)
+
+        timings = (best_of(put_loop, args.repeat),
+                   best_of(put_many, args.repeat),
+                   best_of(lambda: [loaded.get(key) for key in keys],
+                           args.repeat),
+                   best_of(lambda: loaded.get_many(keys), args.repeat))
+        rows.append((module.__name__, args.keys,
+                     *(f"{seconds:.2f}" for seconds in timings),
+                     f"{timings[0] / timings[1]:.2f}x",
+                     f"{timings[2] / timings[3]:.2f}x"))
+    print_table(('map', 'keys', 'put loop s', 'put_many s', 'get loop s',
+                 'get_many s', 'put speedup', 'get speedup'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+# Description: Churn workload for both HashMaps: repeated bursts that insert
+#              many keys and then remove almost all of them. Compares the
+#              default policy (never shrinks) with a ResizePolicy that
+#              shrinks after removals, reporting the time for the bursts,
+#              the capacity left behind and the cost of scanning the
+#              nearly empty map with get_keys_and_values().
+
+import argparse
+
+import hash_map_oa
+import hash_map_sc
+from benchmarks.common import best_of, make_keys, print_table, spread_hash
+from resize_policy import ResizePolicy
+
+POLICIES = {
+    hash_map_sc: ResizePolicy(grow_at=1.0, shrink_at=0.2),
+    hash_map_oa: ResizePolicy(grow_at=0.5, shrink_at=0.1),
+}
+
+
+def churn(m, keys: list, bursts: int, keep: int) -> None:
+    """Insert every key, then remove all but `keep` of them, `bursts` times."""
+    for _ in range(bursts):
+        for key in keys:
+            m.put(key, key)
+        for key in keys[keep:]:
+            m.remove(key)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--keys', type=int, default=200_000)
+    parser.add_argument('--bursts', type=int, default=3)
+    parser.add_argument('--keep', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    keys = make_keys(args.keys)
+    rows = []
+    for module in (hash_map_sc, hash_map_oa):
+        for name, policy in (('default', None),
+                             ('shrinking', POLICIES[module])):
+            m = module.HashMap(11, spread_hash, policy=policy)
+            seconds = best_of(lambda: churn(m, keys, args.bursts, args.keep),
+                              1)
+            scan = best_of(m.get_keys_and_values, args.repeat)
+            rows.append((module.__name__, name, m.get_size(),
+                         m.get_capacity(), f"{seconds:.2f}",
+                         f"{scan * 1e3:.2f}"))
+    print_table(('map', 'policy', 'size', 'capacity', 'churn s', 'scan ms'),
+                rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+# Description: Compares the object-per-slot open addressing map with the
+#              columnar one: bytes retained per entry (keys and values are
+#              created up front, so only the table itself is counted) and
+#              throughput of hit and miss lookups.
+
+import argparse
+
+import hash_map_columnar
+import hash_map_oa
+from benchmarks.common import (best_of, make_keys, print_table, spread_hash,
+                               traced_bytes)
+
+MAPS = (
+    ('HashMap (OA)', hash_map_oa.HashMap),
+    ('ColumnarHashMap', hash_map_columnar.ColumnarHashMap),
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--keys', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    keys = make_keys(args.keys)
+    misses = make_keys(args.keys, prefix='missing')
+    value = object()
+    rows = []
+    for name, cls in MAPS:
+        def build():
+            m = cls(11, spread_hash)
+            for key in keys:
+                m.put(key, value)
+            return m
+
+        m, retained = traced_bytes(build)
+        hit = best_of(lambda: [m.get(key) for key in keys], args.repeat)
+        miss = best_of(lambda: [m.get(key) for key in misses], args.repeat)
+        rows.append((name, args.keys, f"{retained / args.keys:.1f}",
+                     f"{args.keys / hit / 1e6:.2f}",
+                     f"{args.keys / miss / 1e6:.2f}"))
+    print_table(('map', 'entries', 'bytes/entry', 'hit Mops/s',
+                 'miss Mops/s'), rows)
+
+
+if __name__ == '__main__':
+    main()
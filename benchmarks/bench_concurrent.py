@@ -0,0 +1,163 @@
+# Description: Multi-threaded throughput of ConcurrentHashMap against one
+#              HashMap guarded by a single lock. Every thread runs the same
+#              mix of get/put/remove on a shared key set. Under the GIL only
+#              one thread runs Python code at a time, so sharding mainly
+#              shortens lock waits; on a free-threaded CPython build (3.13t
+#              or later) threads on different shards run truly in parallel.
+#              --free-threaded re-runs this benchmark under such a build
+#              when one is found on PATH.
+#
+#                  python -m benchmarks.bench_concurrent --threads 1 2 4 8
+
+import argparse
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+from threading import Barrier, Lock, Thread
+
+import hash_map_oa
+import hash_map_sc
+from benchmarks.common import make_keys, print_table, spread_hash
+from concurrent_hash_map import ConcurrentHashMap
+
+# Interpreters tried by --free-threaded, newest first
+FREE_THREADED_PYTHONS = ('python3.14t', 'python3.13t')
+
+MAP_CLASSES = {'sc': hash_map_sc.HashMap, 'oa': hash_map_oa.HashMap}
+
+
+class LockedHashMap:
+    """Baseline: one HashMap behind one lock, as a shared map is used today."""
+
+    def __init__(self, map_class: type) -> None:
+        self._map = map_class(11, spread_hash)
+        self._lock = Lock()
+
+    def get(self, key: str) -> object:
+        with self._lock:
+            return self._map.get(key)
+
+    def put(self, key: str, value: object) -> None:
+        with self._lock:
+            self._map.put(key, value)
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            self._map.remove(key)
+
+
+def make_operations(keys: list, count: int, reads: float,
+                    seed: int) -> list:
+    """
+    Return count (operation, key) pairs: a reads fraction of gets, the rest
+    split evenly between puts and removes.
+    """
+    rng = random.Random(seed)
+    writes = (1 - reads) / 2
+    return [(rng.choices(('get', 'put', 'remove'),
+                         (reads, writes, writes))[0], rng.choice(keys))
+            for _ in range(count)]
+
+
+def run_threads(target, operations: list) -> float:
+    """
+    Run one thread per list of operations against target, all released at
+    once, and return the wall-clock seconds until the last one finished.
+    """
+    barrier = Barrier(len(operations) + 1)
+
+    def work(ops: list) -> None:
+        get, put, remove = target.get, target.put, target.remove
+        barrier.wait()
+        for operation, key in ops:
+            if operation == 'get':
+                get(key)
+            elif operation == 'put':
+                put(key, key)
+            else:
+                remove(key)
+
+    threads = [Thread(target=work, args=(ops,)) for ops in operations]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def measure(factory: callable, keys: list, threads: int, per_thread: int,
+            reads: float, repeat: int) -> float:
+    """Return the best operations per second of a fresh, preloaded map."""
+    operations = [make_operations(keys, per_thread, reads, 261 + thread)
+                  for thread in range(threads)]
+    best = 0.0
+    for _ in range(repeat):
+        target = factory()
+        for key in keys[::2]:
+            target.put(key, key)
+        seconds = run_threads(target, operations)
+        best = max(best, threads * per_thread / seconds)
+    return best
+
+
+def rerun_free_threaded() -> None:
+    """Run this benchmark again under a free-threaded interpreter."""
+    for name in FREE_THREADED_PYTHONS:
+        python = shutil.which(name)
+        if python is not None:
+            argv = [arg for arg in sys.argv[1:] if arg != '--free-threaded']
+            subprocess.run([python, '-X', 'gil=0', '-m',
+                            'benchmarks.bench_concurrent', *argv], check=True)
+            return
+    print("\nNo free-threaded Python (" + ', '.join(FREE_THREADED_PYTHONS)
+          + ") found on PATH")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Multi-threaded ConcurrentHashMap throughput.')
+    parser.add_argument('--keys', type=int, default=50_000)
+    parser.add_argument('--ops', type=int, default=200_000,
+                        help='operations per thread')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--shards', type=int, nargs='+', default=[4, 16, 64])
+    parser.add_argument('--reads', type=float, default=0.8,
+                        help='fraction of operations that are gets')
+    parser.add_argument('--map', choices=MAP_CLASSES, default='sc')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--free-threaded', action='store_true',
+                        help='also run under a free-threaded CPython build')
+    args = parser.parse_args()
+
+    keys = make_keys(args.keys)
+    map_class = MAP_CLASSES[args.map]
+    variants = [('single lock', lambda: LockedHashMap(map_class))]
+    for shards in args.shards:
+        variants.append((f"{shards} shards",
+                         lambda shards=shards: ConcurrentHashMap(
+                             11, spread_hash, shards, map_class)))
+
+    rows = []
+    for threads in args.threads:
+        for name, factory in variants:
+            ops_per_sec = measure(factory, keys, threads, args.ops,
+                                  args.reads, args.repeat)
+            rows.append((threads, name, f"{ops_per_sec:,.0f}"))
+
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL "
+          f"{'enabled' if gil else 'disabled'}, {os.cpu_count()} CPUs, "
+          f"{args.map} shards, {args.reads:.0%} reads")
+    print_table(('threads', 'map', 'ops/sec'), rows)
+
+    if args.free_threaded:
+        rerun_free_threaded()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+# Description: Per-operation put() latency with and without incremental
+#              resizing. With the default mode the put that crosses the load
+#              threshold rebuilds the whole table, which shows up in the
+#              p99.9/max columns; incremental mode spreads that work out.
+
+import argparse
+import gc
+import time
+
+import hash_map_oa
+import hash_map_sc
+from benchmarks.common import make_keys, percentile, print_table, spread_hash
+
+
+def put_latencies(m, keys: list) -> list:
+    """Return sorted per-put latencies in microseconds."""
+    samples = []
+    clock = time.perf_counter_ns
+    gc.collect()
+    gc.disable()
+    try:
+        for key in keys:
+            start = clock()
+            m.put(key, key)
+            samples.append((clock() - start) / 1000)
+    finally:
+        gc.enable()
+    samples.sort()
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--keys', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    keys = make_keys(args.keys)
+    rows = []
+    for module in (hash_map_sc, hash_map_oa):
+        for incremental in (False, True):
+            m = module.HashMap(11, spread_hash, incremental_resize=incremental)
+            samples = put_latencies(m, keys)
+            rows.append((module.__name__,
+                         'incremental' if incremental else 'stop-the-world',
+                         *(f"{percentile(samples, p):.1f}"
+                           for p in (0.5, 0.99, 0.999, 0.9999)),
+                         f"{samples[-1]:.0f}"))
+    print_table(('map', 'mode', 'p50 us', 'p99 us', 'p99.9 us',
+                 'p99.99 us', 'max us'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+# Description: Bytes retained per entry by each HashMap, measured with
+#              tracemalloc. Keys and values are created before the map, so
+#              only the map's own structures (buckets, nodes, entries) are
+#              counted. Also reports the separate chaining map's node pool
+#              after a remove/re-insert churn cycle.
+
+import argparse
+
+import hash_map_columnar
+import hash_map_oa
+import hash_map_sc
+from benchmarks.common import make_keys, print_table, spread_hash, traced_bytes
+
+MAPS = (
+    ('HashMap (SC)', hash_map_sc.HashMap),
+    ('HashMap (OA)', hash_map_oa.HashMap),
+    ('ColumnarHashMap', hash_map_columnar.ColumnarHashMap),
+)
+
+
+def build(cls, keys: list, value: object):
+    """Return a map holding every key."""
+    m = cls(11, spread_hash)
+    for key in keys:
+        m.put(key, value)
+    return m
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--keys', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    keys = make_keys(args.keys)
+    value = object()
+    rows = []
+    for name, cls in MAPS:
+        m, retained = traced_bytes(lambda: build(cls, keys, value))
+        rows.append((name, args.keys, f"{retained / args.keys:.1f}"))
+        del m
+    print_table(('map', 'entries', 'bytes/entry'), rows)
+
+    # Remove half of the keys, then measure what re-inserting them allocates
+    print()
+    rows = []
+    half = keys[:args.keys // 2]
+    for pool in (0, len(half)):
+        m = hash_map_sc.HashMap(11, spread_hash, node_pool=pool)
+        for key in keys:
+            m.put(key, value)
+        for key in half:
+            m.remove(key)
+
+        def reinsert():
+            for key in half:
+                m.put(key, value)
+
+        _, allocated = traced_bytes(reinsert)
+        rows.append(('HashMap (SC)', pool, len(half),
+                     f"{allocated / len(half):.1f}"))
+    print_table(('map', 'node_pool', 're-inserted', 'new bytes/entry'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+# Description: Scaling of parallel_find_mode with the number of worker
+#              processes, against the single-process find_mode. Each worker
+#              count runs on a pool started beforehand, so the timings cover
+#              counting, pickling and merging but not process start-up.
+#              Speedup can only approach the worker count on a machine with
+#              that many free cores.
+
+import argparse
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from a6_include import DynamicArray
+from benchmarks.common import best_of, print_table
+from hash_map_sc import find_mode
+from parallel_mode import parallel_find_mode
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=2_000_000)
+    parser.add_argument('--distinct', type=int, default=1_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[2, 4, 8])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(261)
+    da = DynamicArray(['key' + str(rng.randrange(args.distinct))
+                       for _ in range(args.items)])
+
+    serial = best_of(lambda: find_mode(da), args.repeat)
+    rows = [('find_mode', 1, f"{serial:.2f}", '1.0x')]
+    for workers in args.workers:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            seconds = best_of(
+                lambda: parallel_find_mode(da, workers, executor=executor),
+                args.repeat)
+        rows.append(('parallel_find_mode', workers, f"{seconds:.2f}",
+                     f"{serial / seconds:.1f}x"))
+
+    print(f"{args.items:,} items, {args.distinct:,} distinct, "
+          f"{os.cpu_count()} CPUs")
+    print_table(('function', 'workers', 'seconds', 'speedup'), rows)
+
+
+if __name__ == '__main__':
+    main()
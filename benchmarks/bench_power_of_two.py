@@ -0,0 +1,59 @@
+# Description: Compares prime capacities with the power_of_two mode of both
+#              HashMaps (mixed hash, mask indexing, triangular probing in
+#              open addressing) for put and get. With hash_function_1 the
+#              prime tables suffer from its clustered values, which mixing
+#              spreads out.
+
+import argparse
+
+import hash_map_oa
+import hash_map_sc
+from a6_include import hash_function_1, hash_function_2
+from benchmarks.common import best_of, make_keys, print_table, spread_hash
+
+FUNCTIONS = {
+    'spread': spread_hash,
+    'hash_function_1': hash_function_1,
+    'hash_function_2': hash_function_2,
+}
+
+
+def bench_map(module, function, keys: list, repeat: int) -> list:
+    """Return result rows for one HashMap module, one per capacity mode."""
+    rows = []
+    for power_of_two in (False, True):
+        def load():
+            m = module.HashMap(11, function, power_of_two=power_of_two)
+            for key in keys:
+                m.put(key, key)
+            return m
+
+        m = load()
+        put = best_of(load, repeat)
+        get = best_of(lambda: [m.get(key) for key in keys], repeat)
+        rows.append((module.__name__,
+                     'power of two' if power_of_two else 'prime',
+                     m.get_capacity(),
+                     f"{put / len(keys) * 1e9:.0f}",
+                     f"{get / len(keys) * 1e9:.0f}"))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--keys', type=int, default=200_000)
+    parser.add_argument('--function', choices=FUNCTIONS, default='spread')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    keys = make_keys(args.keys)
+    rows = []
+    for module in (hash_map_sc, hash_map_oa):
+        rows.extend(bench_map(module, FUNCTIONS[args.function], keys,
+                              args.repeat))
+    print_table(('map', 'capacity', 'slots', 'put ns/key', 'get ns/key'),
+                rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+# Description: Measures resize_table on both HashMaps. The time per entry
+#              should stay flat as the table grows (linear resize), and the
+#              dedicated rehash path is compared against rebuilding the same
+#              table through put(), which is what resize_table used to do.
+
+import argparse
+
+import hash_map_oa
+import hash_map_sc
+from benchmarks.common import best_of, make_keys, print_table, spread_hash
+
+
+def bench_map(module, sizes: list, repeat: int) -> list:
+    """Return result rows for one HashMap module."""
+    rows = []
+    for size in sizes:
+        keys = make_keys(size)
+        m = module.HashMap(size, spread_hash)
+        for key in keys:
+            m.put(key, key)
+
+        target = 2 * m.get_capacity()
+        resize = best_of(lambda: m.resize_table(target), repeat)
+
+        def rebuild():
+            rebuilt = module.HashMap(m.get_capacity(), spread_hash)
+            for key in keys:
+                rebuilt.put(key, key)
+
+        put_loop = best_of(rebuild, repeat)
+        rows.append((module.__name__, size,
+                     f"{resize * 1e3:.1f}",
+                     f"{resize / size * 1e9:.0f}",
+                     f"{put_loop / size * 1e9:.0f}",
+                     f"{put_loop / resize:.1f}x"))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for module in (hash_map_sc, hash_map_oa):
+        rows.extend(bench_map(module, args.sizes, args.repeat))
+    print_table(('map', 'entries', 'resize ms', 'ns/entry',
+                 'put ns/entry', 'speedup'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+# Description: Separate chaining lookups under heavy collisions. Keys that
+#              are permutations of the same digits all share one
+#              hash_function_1 value, so plain chains are scanned linearly
+#              while treeified buckets use binary search.
+
+import argparse
+import itertools
+
+import hash_map_sc
+from a6_include import hash_function_1
+from benchmarks.common import best_of, print_table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--digits', type=int, nargs='+', default=[4, 5, 6])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for digits in args.digits:
+        keys = ['str' + ''.join(p)
+                for p in itertools.permutations('123456789'[:digits])]
+        timings = []
+        for treeify in (False, True):
+            m = hash_map_sc.HashMap(11, hash_function_1, treeify=treeify)
+            for key in keys:
+                m.put(key, key)
+            timings.append(best_of(lambda: [m.get(key) for key in keys],
+                                   args.repeat))
+        rows.append((len(keys),
+                     f"{timings[0] / len(keys) * 1e6:.1f}",
+                     f"{timings[1] / len(keys) * 1e6:.1f}",
+                     f"{timings[0] / timings[1]:.1f}x"))
+    print_table(('colliding keys', 'chain us/get', 'treeified us/get',
+                 'speedup'), rows)
+
+
+if __name__ == '__main__':
+    main()
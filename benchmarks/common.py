@@ -0,0 +1,99 @@
+# Description: Small helpers shared by the benchmark scripts.
+
+import gc
+import time
+
+from a6_include import make_fnv_function
+
+
+def best_of(function: callable, repeat: int = 3) -> float:
+    """
+    Run a zero-argument callable several times and return the fastest
+    wall-clock time in seconds. Like timeit, the cyclic garbage collector
+    is paused while timing.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            function()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def make_keys(count: int, prefix: str = 'key') -> list:
+    """Return a list of distinct string keys."""
+    return [prefix + str(i) for i in range(count)]
+
+
+def print_table(header: tuple, rows: list) -> None:
+    """Print rows as fixed-width, right-aligned columns."""
+    widths = [max(len(str(cell)) for cell in column)
+              for column in zip(header, *rows)]
+    for row in (header, *rows):
+        print('  '.join(str(cell).rjust(width)
+                        for cell, width in zip(row, widths)))
+
+
+# Fixed seeds, so every run and every commit sees the same bucket layouts
+SPREAD_SEED = 0x261
+SPREAD_SEED_2 = 0x262
+
+# Well distributed hash functions for benchmarks that measure the maps
+# rather than the hash. hash_function_1/hash_function_2 only produce a few
+# thousand distinct values for short keys, which turns large tables into
+# long chains and probe sequences; the builtin hash() is randomized per
+# process, which would make results differ between runs. spread_hash_2 is
+# an independent second function for maps that need two (cuckoo).
+spread_hash = make_fnv_function(SPREAD_SEED)
+spread_hash_2 = make_fnv_function(SPREAD_SEED_2)
+
+
+def percentile(sorted_samples: list, fraction: float):
+    """Return the nearest-rank percentile of an already sorted list."""
+    if not sorted_samples:
+        return 0
+    rank = min(len(sorted_samples) - 1, int(fraction * len(sorted_samples)))
+    return sorted_samples[rank]
+
+
+def traced_bytes(function: callable) -> tuple:
+    """
+    Run a zero-argument callable under tracemalloc and return its result
+    together with the number of bytes it left allocated.
+    """
+    import tracemalloc
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = function()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, after - before
+
+
+def traced_peak(function: callable) -> tuple:
+    """
+    Run a zero-argument callable under tracemalloc and return its result
+    together with the peak number of bytes allocated while it ran.
+    """
+    import tracemalloc
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, peak - before
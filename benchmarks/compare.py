@@ -0,0 +1,95 @@
+# Description: Compares two JSON result files written by benchmarks.suite
+#              and flags regressions: throughput that dropped, or p99
+#              latency or peak memory that grew, by more than a threshold.
+#              Exits with status 1 when any regression is found, so it can
+#              gate a commit.
+#
+#                  python -m benchmarks.compare base.json new.json
+
+import argparse
+import json
+import sys
+
+from benchmarks.common import print_table
+
+# Compared metrics -> True if a higher value is better
+METRICS = {
+    'ops_per_sec': True,
+    'p99_ns': False,
+    'peak_bytes': False,
+}
+
+
+def compare_results(baseline: dict, current: dict,
+                    threshold: float = 0.10) -> list:
+    """
+    Match the cases of two suite reports by map, workload and size, and
+    compute the relative change of every metric present in both.
+
+    :param baseline:    report of the earlier run
+    :param current:     report of the run being checked
+    :param threshold:   relative change counted as a regression
+    :return:            list of dicts with map, workload, size, metric,
+                        old, new, change and regression
+    """
+    def case(row):
+        return row['map'], row['workload'], row['size']
+
+    previous = {case(row): row for row in baseline['results']}
+    changes = []
+    for row in current['results']:
+        old_row = previous.get(case(row))
+        if old_row is None:
+            continue
+
+        for metric, higher_is_better in METRICS.items():
+            old, new = old_row.get(metric), row.get(metric)
+            if not old or new is None:
+                continue
+
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            changes.append({
+                'map': row['map'], 'workload': row['workload'],
+                'size': row['size'], 'metric': metric,
+                'old': old, 'new': new, 'change': change,
+                'regression': worse > threshold,
+            })
+    return changes
+
+
+def print_comparison(changes: list) -> None:
+    """Print compare_results() output, regressions marked."""
+    rows = [(change['map'], change['workload'], change['size'],
+             change['metric'], f"{change['old']:,.0f}",
+             f"{change['new']:,.0f}", f"{change['change']:+.1%}",
+             'REGRESSION' if change['regression'] else '')
+            for change in changes]
+    print_table(('map', 'workload', 'size', 'metric', 'old', 'new',
+                 'change', ''), rows)
+    regressions = sum(change['regression'] for change in changes)
+    print(f"\n{regressions} regression(s) in {len(changes)} comparisons")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Compare two benchmark suite result files.')
+    parser.add_argument('baseline')
+    parser.add_argument('current')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='relative change reported as a regression')
+    args = parser.parse_args()
+
+    reports = []
+    for path in (args.baseline, args.current):
+        with open(path, encoding='utf-8') as file:
+            reports.append(json.load(file))
+
+    changes = compare_results(*reports, args.threshold)
+    print_comparison(changes)
+    if any(change['regression'] for change in changes):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,378 @@
+# Description: Reproducible benchmark suite. Drives every registered map
+#              variant through the same standard workloads (bulk insert,
+#              uniform, Zipfian and miss-heavy reads, delete churn, resize
+#              storms, serial and parallel find_mode) at each requested
+#              size, and reports
+#              ops/sec, per-operation latency percentiles and peak traced
+#              memory. Results are written as JSON and can be compared
+#              against an earlier run to flag regressions:
+#
+#                  python -m benchmarks.suite --output base.json
+#                  python -m benchmarks.suite --baseline base.json
+#
+#              Sizes from 10^3 to 10^7 keys are supported (--sizes); the
+#              defaults stop at 10^5 so a full run takes a few minutes.
+#              Operations are generated from a fixed seed, so every
+#              variant and every run sees the same keys in the same order.
+
+import argparse
+import datetime
+import gc
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from itertools import accumulate
+
+import hash_map_oa
+import hash_map_sc
+from a6_include import DynamicArray
+from benchmarks.common import (make_keys, percentile, spread_hash,
+                               spread_hash_2, traced_peak)
+from benchmarks.compare import compare_results, print_comparison
+from hash_map_columnar import ColumnarHashMap
+from hash_map_cuckoo import CuckooHashMap
+from hash_map_rh import RobinHoodHashMap
+from parallel_mode import parallel_find_mode
+from resize_policy import ResizePolicy
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+# Fraction of miss_heavy reads that look up absent keys
+MISS_RATIO = 0.9
+
+# Exponent of the Zipfian key popularity in read_zipf and find_mode
+ZIPF_EXPONENT = 1.1
+
+
+# ----------------------- VARIANTS ----------------------------------------- #
+
+# name -> {'factory': ..., 'shrinking': ..., 'find_mode': ...,
+#          'parallel_find_mode': ...}
+VARIANTS = {}
+
+
+def register_variant(name: str, factory: callable,
+                     shrinking: callable = None,
+                     find_mode: callable = None,
+                     parallel_find_mode: callable = None) -> None:
+    """
+    Add a map implementation to the suite.
+
+    :param name:        label used in reports and JSON results
+    :param factory:     zero-argument callable returning an empty map
+    :param shrinking:   like factory, but the map also shrinks after
+                        removals (the resize_storm workload needs one)
+    :param find_mode:   optional find_mode(DynamicArray) implementation
+    :param parallel_find_mode:  optional multi-process equivalent of
+                                find_mode, called with the DynamicArray
+    """
+    VARIANTS[name] = {'factory': factory, 'shrinking': shrinking,
+                      'find_mode': find_mode,
+                      'parallel_find_mode': parallel_find_mode}
+
+
+register_variant(
+    'sc', lambda: hash_map_sc.HashMap(11, spread_hash),
+    lambda: hash_map_sc.HashMap(
+        11, spread_hash, policy=ResizePolicy(grow_at=1.0, shrink_at=0.2)),
+    hash_map_sc.find_mode, parallel_find_mode)
+register_variant(
+    'oa', lambda: hash_map_oa.HashMap(11, spread_hash),
+    lambda: hash_map_oa.HashMap(
+        11, spread_hash, policy=ResizePolicy(grow_at=0.5, shrink_at=0.1)))
+register_variant('rh', lambda: RobinHoodHashMap(11, spread_hash))
+register_variant('cuckoo',
+                 lambda: CuckooHashMap(11, spread_hash, spread_hash_2,
+                                       seed=261))
+register_variant('columnar', lambda: ColumnarHashMap(11, spread_hash))
+
+
+# ----------------------- WORKLOADS ---------------------------------------- #
+
+def _timed(operation: callable, args) -> list:
+    """
+    Call operation on every argument with the cyclic garbage collector
+    paused, and return the latency of each call in nanoseconds.
+    """
+    clock = time.perf_counter_ns
+    latencies = []
+    append = latencies.append
+    gc.collect()
+    gc.disable()
+    try:
+        for arg in args:
+            start = clock()
+            operation(arg)
+            append(clock() - start)
+    finally:
+        gc.enable()
+    return latencies
+
+
+def _filled(factory: callable, keys: list):
+    """Return a new map from factory holding every key."""
+    m = factory()
+    for key in keys:
+        m.put(key, key)
+    return m
+
+
+def _zipf_sample(items: list, count: int, rng: random.Random) -> list:
+    """Draw count items, the i-th most popular with weight 1 / i^s."""
+    weights = accumulate(1 / rank ** ZIPF_EXPONENT
+                         for rank in range(1, len(items) + 1))
+    return rng.choices(items, cum_weights=list(weights), k=count)
+
+
+def insert(variant: dict, keys: list, rng: random.Random) -> list:
+    """put() every key into an empty map, growing it from its minimum."""
+    put = variant['factory']().put
+    return _timed(lambda key: put(key, key), keys)
+
+
+def read_uniform(variant: dict, keys: list, rng: random.Random) -> list:
+    """get() keys of a full map, each key equally likely."""
+    m = _filled(variant['factory'], keys)
+    return _timed(m.get, [rng.choice(keys) for _ in keys])
+
+
+def read_zipf(variant: dict, keys: list, rng: random.Random) -> list:
+    """get() keys of a full map with Zipfian popularity."""
+    m = _filled(variant['factory'], keys)
+    return _timed(m.get, _zipf_sample(keys, len(keys), rng))
+
+
+def miss_heavy(variant: dict, keys: list, rng: random.Random) -> list:
+    """get() on a full map where most looked up keys are absent."""
+    m = _filled(variant['factory'], keys)
+    probes = ['miss' + str(index) if rng.random() < MISS_RATIO
+              else rng.choice(keys) for index in range(len(keys))]
+    return _timed(m.get, probes)
+
+
+def churn(variant: dict, keys: list, rng: random.Random) -> list:
+    """
+    On a full map, remove a random present key and put() a new one, so
+    the size stays constant; one operation is one remove plus one put.
+    """
+    m = _filled(variant['factory'], keys)
+    present = list(keys)
+
+    def step(index: int) -> None:
+        position = rng.randrange(len(present))
+        m.remove(present[position])
+        present[position] = 'churn' + str(index)
+        m.put(present[position], index)
+
+    return _timed(step, range(len(keys)))
+
+
+def resize_storm(variant: dict, keys: list, rng: random.Random) -> list:
+    """
+    Fill a shrinking map and drain it completely, twice, so every cycle
+    runs through all growth and shrink resizes. Latencies are per put or
+    remove; the slowest of them are the resizes.
+    """
+    m = variant['shrinking']()
+
+    def step(operation: tuple) -> None:
+        remove, key = operation
+        if remove:
+            m.remove(key)
+        else:
+            m.put(key, key)
+
+    cycle = [(False, key) for key in keys] + [(True, key) for key in keys]
+    return _timed(step, cycle * 2)
+
+
+def _mode_input(keys: list, rng: random.Random) -> DynamicArray:
+    """
+    Return an array of len(keys) values drawn with Zipfian popularity from
+    len(keys) // 10 distinct values.
+    """
+    return DynamicArray(
+        _zipf_sample(keys[:max(1, len(keys) // 10)], len(keys), rng))
+
+
+def find_mode(variant: dict, keys: list, rng: random.Random) -> list:
+    """
+    find_mode() over a Zipfian array of len(keys) values. Timed as one
+    call; ops/sec counts array elements.
+    """
+    return _timed(variant['find_mode'], [_mode_input(keys, rng)])
+
+
+def parallel_mode(variant: dict, keys: list, rng: random.Random) -> list:
+    """
+    The find_mode workload with the variant's parallel_find_mode, using one
+    process per CPU (arrays below parallel_mode.MIN_PARALLEL_ITEMS are
+    counted serially). Includes process start-up.
+    """
+    return _timed(variant['parallel_find_mode'], [_mode_input(keys, rng)])
+
+
+# name -> (workload, variant entry it needs, or None)
+WORKLOADS = {
+    'insert': (insert, None),
+    'read_uniform': (read_uniform, None),
+    'read_zipf': (read_zipf, None),
+    'miss_heavy': (miss_heavy, None),
+    'churn': (churn, None),
+    'resize_storm': (resize_storm, 'shrinking'),
+    'find_mode': (find_mode, 'find_mode'),
+    'parallel_find_mode': (parallel_mode, 'parallel_find_mode'),
+}
+
+
+# ----------------------- RUNNER ------------------------------------------- #
+
+def run_case(variant: dict, workload: str, size: int, seed: int,
+             repeat: int, memory: bool) -> dict:
+    """
+    Measure one workload on one variant at one size.
+
+    :return:    result dict; latency fields are None for workloads timed
+                as a single call
+    """
+    function = WORKLOADS[workload][0]
+    keys = make_keys(size)
+
+    # Keep the repetition with the highest throughput
+    best = None
+    for _ in range(repeat):
+        latencies = function(variant, keys, random.Random(seed))
+        if best is None or sum(latencies) < sum(best):
+            best = latencies
+
+    # A single latency means the whole workload was timed as one call
+    per_operation = len(best) > 1
+    ops = len(best) if per_operation else size
+    total_ns = sum(best)
+    result = {
+        'ops': ops,
+        'seconds': total_ns / 1e9,
+        'ops_per_sec': ops / total_ns * 1e9 if total_ns else None,
+    }
+
+    best.sort()
+    for name, fraction in (('p50_ns', 0.5), ('p90_ns', 0.9),
+                           ('p99_ns', 0.99), ('p999_ns', 0.999)):
+        result[name] = percentile(best, fraction) if per_operation else None
+    result['max_ns'] = best[-1] if per_operation else None
+
+    # Memory is traced in a separate run; tracemalloc slows everything down
+    result['peak_bytes'] = traced_peak(
+        lambda: function(variant, keys, random.Random(seed)))[1] \
+        if memory else None
+    return result
+
+
+def run_suite(variants: list, workloads: list, sizes: list,
+              seed: int = 261, repeat: int = 3, memory: bool = True,
+              progress: callable = None) -> dict:
+    """
+    Run every workload on every variant at every size.
+
+    :param variants:    names registered with register_variant
+    :param workloads:   names from WORKLOADS
+    :param sizes:       key counts
+    :param seed:        seed for the generated operations
+    :param repeat:      timed repetitions per case (the fastest is kept)
+    :param memory:      also measure peak traced memory per case
+    :param progress:    optional callable(result row) called as rows finish
+    :return:            dict with 'meta' and a list of 'results'
+    """
+    results = []
+    for size in sizes:
+        for workload in workloads:
+            requires = WORKLOADS[workload][1]
+            for name in variants:
+                variant = VARIANTS[name]
+                if requires is not None and variant[requires] is None:
+                    continue
+
+                row = {'map': name, 'workload': workload, 'size': size}
+                row.update(run_case(variant, workload, size, seed,
+                                    repeat, memory))
+                results.append(row)
+                if progress is not None:
+                    progress(row)
+
+    return {'meta': _metadata(seed, repeat), 'results': results}
+
+
+def _metadata(seed: int, repeat: int) -> dict:
+    """Describe the environment a run was made in."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                                capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'seed': seed,
+        'repeat': repeat,
+    }
+
+
+def _format_row(row: dict) -> str:
+    """One progress line for a finished case."""
+    def number(value, scale=1.0, digits=0):
+        return '-' if value is None else f"{value / scale:,.{digits}f}"
+
+    return (f"{row['map']:>8} {row['workload']:>18} {row['size']:>9,} "
+            f"{number(row['ops_per_sec']):>12} ops/s  "
+            f"p50 {number(row['p50_ns'], 1000, 2):>7} us  "
+            f"p99 {number(row['p99_ns'], 1000, 2):>7} us  "
+            f"max {number(row['max_ns'], 1000, 0):>7} us  "
+            f"peak {number(row['peak_bytes'], 2 ** 20, 1):>7} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Run the standard HashMap workloads.')
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=list(DEFAULT_SIZES))
+    parser.add_argument('--maps', nargs='+', choices=sorted(VARIANTS),
+                        default=list(VARIANTS))
+    parser.add_argument('--workloads', nargs='+', choices=list(WORKLOADS),
+                        default=list(WORKLOADS))
+    parser.add_argument('--seed', type=int, default=261)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--no-memory', action='store_true',
+                        help='skip the traced run measuring peak memory')
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--baseline',
+                        help='JSON results of an earlier run to compare to')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='relative change reported as a regression')
+    args = parser.parse_args()
+
+    report = run_suite(args.maps, args.workloads, args.sizes, args.seed,
+                       args.repeat, not args.no_memory,
+                       progress=lambda row: print(_format_row(row),
+                                                  flush=True))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)
+        changes = compare_results(baseline, report, args.threshold)
+        print_comparison(changes)
+        if any(change['regression'] for change in changes):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
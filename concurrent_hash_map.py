@@ -0,0 +1,283 @@
+# Course: CS261 - Data Structures
+# Assignment: 6 - HashMap Implementation
+# Description: Thread-safe HashMap built from independent shards. Keys are
+#              assigned to one of N shards (Separate Chaining or Open
+#              Addressing HashMaps) by the high bits of their mixed hash, and
+#              every shard has its own lock, so threads working on different
+#              shards never wait for each other. Each shard resizes on its
+#              own, holding only its own lock while it rehashes.
+
+from threading import Lock
+
+import hash_map_sc
+from a6_include import DynamicArray, as_list, hash_function_1
+from hash_engine import HashEngine, fold_hash
+
+
+class ConcurrentHashMap:
+    """
+    HashMap that may be shared between threads. Every single-key operation,
+    including the read-modify-write ones (setdefault, update, increment,
+    pop), is atomic. Operations over several keys lock one shard at a time,
+    so they are atomic per shard but not across the whole map; likewise
+    get_size() and get_keys_and_values() are exact only while no other
+    thread is writing.
+    """
+
+    __slots__ = ('_shards', '_locks', '_shift', '_hash_function')
+
+    def __init__(self,
+                 capacity: int = 11,
+                 function: callable = hash_function_1,
+                 shards: int = 16,
+                 map_class: type = hash_map_sc.HashMap,
+                 **options) -> None:
+        """
+        Initialize an empty map.
+
+        :param capacity:    initial capacity of the whole map, divided
+                            between the shards
+        :param function:    hash function, used both to pick the shard and
+                            inside the shards
+        :param shards:      number of shards, rounded up to a power of two
+        :param map_class:   HashMap class of the shards (hash_map_sc.HashMap,
+                            hash_map_oa.HashMap or a subclass)
+        :param options:     further keyword arguments for every shard, such
+                            as policy or expected_size (which is per shard)
+        """
+        if shards < 1:
+            raise ValueError("shards must be positive")
+        bits = (shards - 1).bit_length()
+        shard_capacity = max(capacity >> bits, 1)
+
+        # The shard index comes from the top bits of the 64-bit mixed hash;
+        # the shards index their own tables with the low bits (or the
+        # remainder), so the two choices stay independent
+        self._shift = 64 - bits
+        self._hash_function = HashEngine(function)
+        self._shards = [map_class(shard_capacity, function, **options)
+                        for _ in range(1 << bits)]
+        self._locks = [Lock() for _ in range(1 << bits)]
+
+    def _shard_index(self, key: str) -> int:
+        """Return the index of the shard that holds key."""
+        return fold_hash(self._hash_function(str(key))) >> self._shift
+
+    def _group(self, keys: list) -> dict:
+        """
+        Group keys by shard.
+
+        :param keys:    list of keys
+        :return:        dict of shard index -> list of positions in keys
+        """
+        hashes = self._hash_function.hash_many([str(key) for key in keys])
+        groups = {}
+        for position, hash in enumerate(hashes):
+            groups.setdefault(fold_hash(hash) >> self._shift,
+                              []).append(position)
+        return groups
+
+    # ------------------------------------------------------------------ #
+
+    def get_shard_count(self) -> int:
+        """Return the number of shards."""
+        return len(self._shards)
+
+    def shard_sizes(self) -> list:
+        """Return the number of keys in every shard, in shard order."""
+        return [shard.get_size() for shard in self._shards]
+
+    def get_size(self) -> int:
+        """
+        Return the number of key/value pairs, summed over the shards
+        without locking them all at once.
+        """
+        return sum(shard.get_size() for shard in self._shards)
+
+    def get_capacity(self) -> int:
+        """Return the total capacity of the shards."""
+        return sum(shard.get_capacity() for shard in self._shards)
+
+    def table_load(self) -> float:
+        """Return the load factor over all shards."""
+        return self.get_size() / self.get_capacity()
+
+    def empty_buckets(self) -> int:
+        """Return the number of empty buckets over all shards."""
+        total = 0
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                total += shard.empty_buckets()
+        return total
+
+    # ------------------------------------------------------------------ #
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Adds or updates a key/value pair.
+
+        :param key:     string type key
+        :param value:   value associated with the key
+        """
+        index = self._shard_index(key)
+        with self._locks[index]:
+            self._shards[index].put(key, value)
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value of key, or None if the key is not present.
+
+        :param key:     string type key whose value we seek to retrieve
+        :return:        matching value, or None
+        """
+        index = self._shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].get(key)
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if key is present, False otherwise.
+
+        :param key:     string type key who we are inquiring about
+        """
+        index = self._shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].contains_key(key)
+
+    def remove(self, key: str) -> None:
+        """
+        Removes key and its value, if present.
+
+        :param key:     string type key that we seek to remove
+        """
+        index = self._shard_index(key)
+        with self._locks[index]:
+            self._shards[index].remove(key)
+
+    def pop(self, key: str, default: object = None) -> object:
+        """
+        Removes key and returns its value, or default if it is not present.
+
+        :param key:     string type key that we seek to remove
+        :param default: value returned if the key is not present
+        """
+        index = self._shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].pop(key, default)
+
+    def setdefault(self, key: str, default: object = None) -> object:
+        """
+        Returns the value of key, first adding it with the default value if
+        it is not present.
+        """
+        index = self._shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].setdefault(key, default)
+
+    def update(self, key: str, function: callable,
+               default: object = None) -> object:
+        """
+        Replaces the value of key with function(value), where a missing key
+        starts from the default value. function runs while the shard is
+        locked, so it must not use this map.
+
+        :return:    new value associated with the key
+        """
+        index = self._shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].update(key, function, default)
+
+    def increment(self, key: str, amount: int = 1) -> int:
+        """
+        Adds amount to the count of key, which counts as 0 if not present.
+
+        :return:    new count associated with the key
+        """
+        index = self._shard_index(key)
+        with self._locks[index]:
+            return self._shards[index].increment(key, amount)
+
+    # ------------------------------------------------------------------ #
+
+    def put_many(self, pairs) -> None:
+        """
+        Adds or updates every (key, value) pair, locking each shard once.
+
+        :param pairs:   iterable or DynamicArray of (key, value) tuples
+        """
+        pairs = as_list(pairs)
+        groups = self._group([key for key, _ in pairs])
+        for index, positions in groups.items():
+            with self._locks[index]:
+                self._shards[index].put_many(
+                    [pairs[position] for position in positions])
+
+    def get_many(self, keys) -> DynamicArray:
+        """
+        Looks up every key, locking each shard once.
+
+        :param keys:    iterable or DynamicArray of keys
+        :return:        DynamicArray of values, None where a key is missing
+        """
+        keys = as_list(keys)
+        values = [None] * len(keys)
+        for index, positions in self._group(keys).items():
+            with self._locks[index]:
+                found = self._shards[index].get_many(
+                    [keys[position] for position in positions])
+            for position, value in zip(positions, as_list(found)):
+                values[position] = value
+        return DynamicArray(values)
+
+    def remove_many(self, keys) -> None:
+        """
+        Removes every key that is present, locking each shard once.
+
+        :param keys:    iterable or DynamicArray of keys
+        """
+        keys = as_list(keys)
+        for index, positions in self._group(keys).items():
+            with self._locks[index]:
+                self._shards[index].remove_many(
+                    [keys[position] for position in positions])
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns all key/value pairs, collected one shard at a time.
+
+        :return:    DynamicArray of (key, value) tuples
+        """
+        pairs = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                pairs.extend(as_list(shard.get_keys_and_values()))
+        return DynamicArray(pairs)
+
+    def clear(self) -> None:
+        """Removes all pairs, clearing one shard at a time."""
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                shard.clear()
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+
+if __name__ == "__main__":
+    from threading import Thread
+
+    print("\nConcurrentHashMap - example")
+    print("---------------------------")
+    m = ConcurrentHashMap(shards=8)
+
+    def work(thread: int) -> None:
+        for i in range(1000):
+            m.increment('key' + str(i % 100))
+            m.put('thread' + str(thread) + '_' + str(i), i)
+
+    threads = [Thread(target=work, args=(thread,)) for thread in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(m.get_size(), m.get('key7'), m.shard_sizes())
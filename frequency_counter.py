@@ -0,0 +1,314 @@
+# Course: CS261 - Data Structures
+# Assignment: 6 - HashMap Implementation
+# Description: Streaming frequency counter built on the Separate Chaining
+#              HashMap. Unlike find_mode it consumes any iterable (such as a
+#              generator over a log file) in fixed-size chunks, and keeps the
+#              mode(s) and a top-k heap up to date as items arrive. When the
+#              number of distinct keys exceeds a memory budget, it can switch
+#              to a bounded-memory approximate mode: a Count-Min Sketch for
+#              the counts, with the top-k heap tracking the heavy hitters.
+
+import heapq
+import math
+from array import array
+from itertools import islice
+
+from a6_include import DynamicArray, as_list, make_fnv_function
+from hash_map_sc import HashMap
+
+# Items read from the input per batch
+DEFAULT_CHUNK_SIZE = 65536
+
+
+class CountMinSketch:
+    """
+    Count-Min Sketch: depth rows of width counters. Each key increments one
+    counter per row, and its estimate is the smallest of those counters, so
+    estimates never undercount. With width = ceil(e / epsilon) and depth =
+    ceil(ln(1 / delta)), an estimate exceeds the true count by more than
+    epsilon * total with probability at most delta.
+    Counters are updated conservatively: only those below the new estimate
+    are raised, which keeps overcounting lower without losing the bound.
+    """
+
+    __slots__ = ('width', 'depth', 'total', '_rows', '_hash')
+
+    def __init__(self, width: int, depth: int, seed: int = None) -> None:
+        """
+        Initialize an empty sketch.
+
+        :param width:   counters per row
+        :param depth:   number of rows (independent hash functions)
+        :param seed:    seed of the row hash functions (None: random)
+        """
+        if width < 1 or depth < 1:
+            raise ValueError("width and depth must be positive")
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self._rows = [array('q', [0]) * width for _ in range(depth)]
+        self._hash = make_fnv_function(seed)
+
+    @classmethod
+    def from_error(cls, epsilon: float, delta: float,
+                   seed: int = None) -> "CountMinSketch":
+        """
+        Return a sketch sized for the given error bound.
+
+        :param epsilon: overcount allowed, as a fraction of all counted items
+        :param delta:   probability that an estimate exceeds that bound
+        :param seed:    seed of the row hash functions (None: random)
+        """
+        return cls(math.ceil(math.e / epsilon),
+                   math.ceil(math.log(1 / delta)), seed)
+
+    def _indexes(self, key: str) -> list:
+        """
+        Return the counter index of key in every row, derived from one
+        64-bit hash by double hashing (h1 + i * h2).
+        """
+        hash = self._hash(str(key))
+        h1, h2 = hash & 0xFFFFFFFF, (hash >> 32) | 1
+        return [(h1 + row * h2) % self.width for row in range(self.depth)]
+
+    def add(self, key: str, count: int = 1) -> int:
+        """
+        Count key count more times.
+
+        :return:    new estimated count of key
+        """
+        indexes = self._indexes(key)
+        rows = self._rows
+        estimate = min(rows[row][index]
+                       for row, index in enumerate(indexes)) + count
+        for row, index in enumerate(indexes):
+            if rows[row][index] < estimate:
+                rows[row][index] = estimate
+        self.total += count
+        return estimate
+
+    def estimate(self, key: str) -> int:
+        """Return the estimated count of key (never below the true count)."""
+        return min(self._rows[row][index]
+                   for row, index in enumerate(self._indexes(key)))
+
+
+class FrequencyCounter:
+    """
+    Counts items from any number of iterables. Counts are exact, kept in a
+    HashMap, until the counter switches to approximate mode (see
+    max_distinct); from then on they come from a CountMinSketch and the
+    top-k heap holds the estimated heavy hitters.
+    """
+
+    def __init__(self,
+                 k: int = 10,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 max_distinct: int = None,
+                 epsilon: float = 1e-4,
+                 delta: float = 1e-3,
+                 seed: int = None) -> None:
+        """
+        Initialize an empty counter.
+
+        :param k:               number of most frequent keys tracked
+        :param chunk_size:      items read from an iterable per batch
+        :param max_distinct:    memory budget, in distinct keys counted
+                                exactly; once exceeded (checked after each
+                                chunk) the counter becomes approximate.
+                                None keeps it exact.
+        :param epsilon:         sketch overcount bound, as a fraction of all
+                                items (approximate mode)
+        :param delta:           probability of exceeding that bound
+        :param seed:            seed of the sketch hash functions
+        """
+        if k < 1:
+            raise ValueError("k must be positive")
+        self._k = k
+        self._chunk_size = chunk_size
+        self._max_distinct = max_distinct
+        self._epsilon = epsilon
+        self._delta = delta
+        self._seed = seed
+
+        self._counts = HashMap()
+        self._sketch = None
+        self._total = 0
+
+        # Exact mode(s) in the order find_mode reports them
+        self._mode_keys = []
+        self._mode_count = 0
+
+        # Min-heap of [count, arrival, key] for the top k keys (arrival
+        # breaks ties without comparing keys), and the current count of
+        # every key in it; heap counts may lag behind (see _track)
+        self._heap = []
+        self._top = {}
+        self._arrivals = 0
+
+    def is_approximate(self) -> bool:
+        """Return True once counts come from the Count-Min Sketch."""
+        return self._sketch is not None
+
+    def total(self) -> int:
+        """Return the number of items counted."""
+        return self._total
+
+    def distinct(self) -> int:
+        """
+        Return the number of distinct keys counted, or None in approximate
+        mode, where keys are no longer stored.
+        """
+        return None if self._sketch is not None else self._counts.get_size()
+
+    # ------------------------------------------------------------------ #
+
+    def update(self, items) -> None:
+        """
+        Count every item of an iterable, reading it chunk_size items at a
+        time so that arbitrarily long inputs are never held in memory.
+
+        :param items:   iterable, generator or DynamicArray of keys
+        """
+        iterator = iter(as_list(items) if isinstance(items, DynamicArray)
+                        else items)
+        while True:
+            chunk = list(islice(iterator, self._chunk_size))
+            if not chunk:
+                return
+            self._count_chunk(chunk)
+
+    def add(self, key: str, count: int = 1) -> int:
+        """
+        Count one key count more times.
+
+        :return:    new (possibly estimated) count of the key
+        """
+        self._total += count
+        if self._sketch is not None:
+            new_count = self._sketch.add(key, count)
+        else:
+            new_count = self._counts.increment(key, count)
+            self._track_mode(key, new_count)
+        self._track(key, new_count)
+        self._check_budget()
+        return new_count
+
+    def _count_chunk(self, chunk: list) -> None:
+        """Count a list of keys, then enforce the memory budget."""
+        self._total += len(chunk)
+        if self._sketch is not None:
+            add = self._sketch.add
+            for key in chunk:
+                self._track(key, add(key))
+        else:
+            counts = self._counts.increment_many(chunk)
+            for key, count in zip(chunk, as_list(counts)):
+                self._track_mode(key, count)
+                self._track(key, count)
+        self._check_budget()
+
+    def _track_mode(self, key: str, count: int) -> None:
+        """Update the exact mode(s) after key reached count."""
+        if count > self._mode_count:
+            self._mode_count = count
+            self._mode_keys = [key]
+        elif count == self._mode_count:
+            self._mode_keys.append(key)
+
+    def _track(self, key: str, count: int) -> None:
+        """
+        Update the top-k heap after key reached count. Counts only grow, so
+        the heap entry of a tracked key is left stale and refreshed lazily:
+        only the minimum needs to be exact when an outsider challenges it.
+        """
+        top = self._top
+        if key in top:
+            top[key] = count
+            return
+
+        heap = self._heap
+        self._arrivals += 1
+        if len(heap) < self._k:
+            top[key] = count
+            heapq.heappush(heap, [count, self._arrivals, key])
+            return
+
+        # Bring the smallest entry up to date before comparing
+        while heap[0][0] != top[heap[0][2]]:
+            smallest = heap[0]
+            heapq.heapreplace(heap, [top[smallest[2]], smallest[1],
+                                     smallest[2]])
+
+        if count > heap[0][0]:
+            del top[heap[0][2]]
+            top[key] = count
+            heapq.heapreplace(heap, [count, self._arrivals, key])
+
+    def _check_budget(self) -> None:
+        """Switch to approximate mode if the exact map outgrew the budget."""
+        if self._sketch is None and self._max_distinct is not None \
+                and self._counts.get_size() > self._max_distinct:
+            self._sketch = CountMinSketch.from_error(
+                self._epsilon, self._delta, self._seed)
+            for key, count in as_list(self._counts.get_keys_and_values()):
+                self._sketch.add(key, count)
+            self._counts = None
+            self._mode_keys = []
+
+    # ------------------------------------------------------------------ #
+
+    def count(self, key: str) -> int:
+        """
+        Return how many times key was counted (an upper estimate in
+        approximate mode).
+        """
+        if self._sketch is not None:
+            return self._sketch.estimate(key)
+        return self._counts.get(key) or 0
+
+    def top_k(self, k: int = None) -> list:
+        """
+        Return the most frequent keys, most frequent first.
+
+        :param k:   number of keys, at most the k given to the constructor
+        :return:    list of (key, count) tuples; ties keep no fixed order
+        """
+        ranked = sorted(self._top.items(), key=lambda item: -item[1])
+        return ranked[:self._k if k is None else k]
+
+    def mode(self) -> tuple:
+        """
+        Return the mode(s) and their frequency, like find_mode. In exact
+        mode ties are listed in the order they reached the frequency; in
+        approximate mode the modes are the top heavy hitters by estimate.
+
+        :return:    tuple of a DynamicArray of keys and an integer count
+        """
+        if self._sketch is None:
+            return DynamicArray(self._mode_keys), self._mode_count
+
+        if not self._top:
+            return DynamicArray(), 0
+        frequency = max(self._top.values())
+        return DynamicArray([key for key, count in self._top.items()
+                             if count == frequency]), frequency
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+
+if __name__ == "__main__":
+    print("\nFrequencyCounter - exact example")
+    print("--------------------------------")
+    counter = FrequencyCounter(k=3)
+    counter.update(word for line in ["the cat sat", "on the mat", "the end"]
+                   for word in line.split())
+    modes, frequency = counter.mode()
+    print(modes, frequency, counter.top_k())
+
+    print("\nFrequencyCounter - approximate example")
+    print("--------------------------------------")
+    counter = FrequencyCounter(k=3, max_distinct=1000, seed=261)
+    counter.update('key' + str(i % 5 if i % 2 else i) for i in range(20000))
+    print(counter.is_approximate(), counter.top_k(), counter.total())
@@ -0,0 +1,306 @@
+# Course: CS261 - Data Structures
+# Assignment: 6 - HashMap Implementation
+# Description: Hash function quality analyzer. Given a sample of keys and a
+#              candidate hash function, reports how evenly the function
+#              spreads the keys over buckets (chi-squared against a uniform
+#              distribution), the chain lengths of a separate chaining map,
+#              the probe lengths of an open addressing map at several load
+#              factors next to the values expected from an ideal hash, and
+#              the raw hashing throughput. Usable as a module (analyze) or
+#              from the command line:
+#
+#                  python hash_analyzer.py keys.txt --function hash_function_2
+
+import argparse
+import math
+import random
+import time
+
+import hash_map_oa
+import hash_map_sc
+from a6_include import (hash_function_1, hash_function_2, make_fnv_function,
+                        make_siphash_function)
+from primes import next_prime
+
+
+# Load factors at which open addressing probe lengths are measured; the OA
+# map grows at 0.5, so these cover its whole operating range
+DEFAULT_LOADS = (0.1, 0.25, 0.4, 0.49)
+
+
+def load_keys(source, limit: int = None) -> list:
+    """
+    Return the distinct keys of a sample, in first-seen order.
+
+    :param source:  path of a text file with one key per line, or any
+                    iterable of keys (converted with str)
+    :param limit:   keep at most this many distinct keys (None: all)
+    :return:        list of distinct string keys
+    """
+    if isinstance(source, str):
+        with open(source, encoding='utf-8') as file:
+            items = [line.rstrip('\r\n') for line in file]
+    else:
+        items = map(str, source)
+
+    keys = list(dict.fromkeys(items))
+    if limit is not None:
+        keys = keys[:limit]
+    return keys
+
+
+# ----------------------- DISTRIBUTION ------------------------------------- #
+
+def bucket_counts(keys: list, function: callable, capacity: int) -> list:
+    """Return how many keys land in each of capacity buckets."""
+    counts = [0] * capacity
+    for key in keys:
+        counts[function(key) % capacity] += 1
+    return counts
+
+
+def chi_squared(counts: list) -> float:
+    """
+    Return Pearson's chi-squared statistic of bucket counts against a
+    uniform distribution of the same keys over the same buckets.
+    """
+    expected = sum(counts) / len(counts)
+    if expected == 0:
+        return 0.0
+    return sum((count - expected) ** 2 for count in counts) / expected
+
+
+def chi_squared_p_value(statistic: float, degrees: int) -> float:
+    """
+    Return the probability that a uniform hash gives a chi-squared
+    statistic at least this large, using the Wilson-Hilferty normal
+    approximation (accurate for the bucket counts used here).
+    """
+    if degrees <= 0:
+        return 1.0
+    ratio = 2 / (9 * degrees)
+    z = ((statistic / degrees) ** (1 / 3) - (1 - ratio)) / math.sqrt(ratio)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+# ----------------------- SEPARATE CHAINING -------------------------------- #
+
+def chain_report(keys: list, function: callable) -> dict:
+    """
+    Fill a separate chaining HashMap with the keys and measure its chains.
+    Mean chain length is taken over non-empty buckets, which is what a
+    successful get() walks on average.
+
+    :return:    dict with capacity, max_chain, mean_chain, empty_buckets
+                and the bucket counts used for the chi-squared test
+    """
+    m = hash_map_sc.HashMap(11, function)
+    for key in keys:
+        m.put(key, None)
+
+    counts = [m._buckets.get_at_index(index).length()
+              for index in range(m.get_capacity())]
+    used = [count for count in counts if count]
+    return {
+        'capacity': m.get_capacity(),
+        'max_chain': max(counts),
+        'mean_chain': sum(used) / len(used) if used else 0.0,
+        'empty_buckets': m.empty_buckets(),
+        'counts': counts,
+    }
+
+
+# ----------------------- OPEN ADDRESSING ---------------------------------- #
+
+def expected_probes(load: float) -> tuple:
+    """
+    Return the average number of slots examined by a successful and an
+    unsuccessful search under quadratic probing with an ideal hash
+    (Knuth's secondary clustering estimates).
+
+    :param load:    load factor, below 1
+    :return:        (hit, miss) expected probe counts
+    """
+    hit = 1 - math.log(1 - load) - load / 2
+    miss = 1 / (1 - load) - load - math.log(1 - load)
+    return hit, miss
+
+
+def absent_keys(keys: list, count: int = None, seed: int = 261) -> list:
+    """
+    Return keys that are not in the sample but look like it: random strings
+    with the lengths of sample keys, over the characters the sample uses.
+
+    :param keys:    sample of distinct keys
+    :param count:   number of keys to return (None: as many as the sample)
+    :param seed:    seed of the generator, so reports are reproducible
+    :return:        list of distinct keys, none of them in the sample
+    """
+    present = set(keys)
+    alphabet = sorted(set(''.join(keys))) or ['a']
+    count = len(keys) if count is None else count
+    rng = random.Random(seed)
+    absent = {}
+    while len(absent) < count:
+        length = len(rng.choice(keys)) if keys else 1
+        key = ''.join(rng.choices(alphabet, k=max(length, 1)))
+        while key in present or key in absent:
+            key += rng.choice(alphabet)
+        absent[key] = None
+    return list(absent)
+
+
+def _lookup_probes(m, keys: list) -> tuple:
+    """
+    Look up every key in an InstrumentedHashMap and return the mean and
+    the maximum number of slots its own probe loop examined.
+    """
+    m.reset_statistics()
+    m.contains_many(keys)
+    stats = m.statistics()
+    return stats['mean_length'], stats['max_length']
+
+
+def probe_report(keys: list, function: callable,
+                 loads: tuple = DEFAULT_LOADS,
+                 power_of_two: bool = False) -> list:
+    """
+    For each load factor, fill an open addressing HashMap sized so that
+    the keys reach that load without a resize, and compare the probe
+    lengths of successful lookups (every key of the sample) and of
+    unsuccessful ones (as many absent keys) to the ideal expectation.
+    Probes are counted by the map's own probe loop, so the report follows
+    whichever probe sequence the map uses.
+
+    :param power_of_two:    measure a power-of-two map (triangular probing
+                            over a bit mask) instead of a prime-sized one;
+                            its capacity rounds up, so loads come out lower
+    :return:    list of dicts with load, capacity, expected_hit,
+                expected_miss, mean_probes, max_probes, mean_miss_probes
+                and max_miss_probes
+    """
+    misses = absent_keys(keys)
+    rows = []
+    for load in loads:
+        m = hash_map_oa.InstrumentedHashMap(
+            next_prime(math.ceil(len(keys) / load)), function,
+            power_of_two=power_of_two)
+        m.put_many((key, None) for key in keys)
+
+        mean_probes, max_probes = _lookup_probes(m, keys)
+        mean_miss_probes, max_miss_probes = _lookup_probes(m, misses)
+        hit, miss = expected_probes(m.table_load())
+        rows.append({
+            'load': m.table_load(),
+            'capacity': m.get_capacity(),
+            'expected_hit': hit,
+            'expected_miss': miss,
+            'mean_probes': mean_probes,
+            'max_probes': max_probes,
+            'mean_miss_probes': mean_miss_probes,
+            'max_miss_probes': max_miss_probes,
+        })
+    return rows
+
+
+# ----------------------- THROUGHPUT --------------------------------------- #
+
+def throughput(keys: list, function: callable, repeat: int = 3) -> float:
+    """Return the best observed hashing rate of the function, in keys/sec."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for key in keys:
+            function(key)
+        best = min(best, time.perf_counter() - start)
+    return len(keys) / best if best > 0 else float('inf')
+
+
+# ----------------------- REPORT ------------------------------------------- #
+
+def analyze(keys, function: callable,
+            loads: tuple = DEFAULT_LOADS,
+            power_of_two: bool = False) -> dict:
+    """
+    Run every measurement of this module for one hash function.
+
+    :param keys:        sample of keys (file path or iterable), deduplicated
+    :param function:    candidate hash function, callable(str) -> int
+    :param loads:       open addressing load factors to measure
+    :param power_of_two:    measure a power-of-two open addressing map
+    :return:            dict with keys, distinct_hashes, chi_squared,
+                        degrees, p_value, chains, probes and keys_per_sec
+    """
+    keys = load_keys(keys)
+    chains = chain_report(keys, function)
+    statistic = chi_squared(chains['counts'])
+    degrees = len(chains['counts']) - 1
+    return {
+        'keys': len(keys),
+        'distinct_hashes': len(set(map(function, keys))),
+        'chi_squared': statistic,
+        'degrees': degrees,
+        'p_value': chi_squared_p_value(statistic, degrees),
+        'chains': chains,
+        'probes': probe_report(keys, function, loads, power_of_two)
+        if keys else [],
+        'keys_per_sec': throughput(keys, function),
+    }
+
+
+def print_report(name: str, report: dict) -> None:
+    """Print an analyze() result in a readable form."""
+    chains = report['chains']
+    print(f"\n{name}")
+    print('-' * len(name))
+    print(f"keys: {report['keys']}, distinct hashes: "
+          f"{report['distinct_hashes']}, "
+          f"throughput: {report['keys_per_sec']:,.0f} keys/sec")
+    print(f"chi-squared: {report['chi_squared']:.1f} over "
+          f"{report['degrees']} degrees of freedom "
+          f"(ratio {report['chi_squared'] / max(1, report['degrees']):.2f}, "
+          f"p = {report['p_value']:.3g})")
+    print(f"SC capacity {chains['capacity']}: max chain "
+          f"{chains['max_chain']}, mean chain {chains['mean_chain']:.2f}, "
+          f"empty buckets {chains['empty_buckets']}")
+    for row in report['probes']:
+        print(f"OA load {row['load']:.2f}: hit probes mean "
+              f"{row['mean_probes']:.2f} (ideal {row['expected_hit']:.2f}), "
+              f"max {row['max_probes']}; miss probes mean "
+              f"{row['mean_miss_probes']:.2f} "
+              f"(ideal {row['expected_miss']:.2f}), "
+              f"max {row['max_miss_probes']}")
+
+
+# Candidate functions selectable from the command line
+FUNCTIONS = {
+    'hash_function_1': lambda seed: hash_function_1,
+    'hash_function_2': lambda seed: hash_function_2,
+    'fnv': make_fnv_function,
+    'siphash': make_siphash_function,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Report how well hash functions spread a key sample.')
+    parser.add_argument('keys_file', help='text file with one key per line')
+    parser.add_argument('--function', action='append',
+                        choices=sorted(FUNCTIONS),
+                        help='function to analyze (repeatable; default all)')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='seed for the seeded functions')
+    parser.add_argument('--limit', type=int, default=None,
+                        help='analyze at most this many distinct keys')
+    parser.add_argument('--power-of-two', action='store_true',
+                        help='measure a power-of-two open addressing map')
+    args = parser.parse_args()
+
+    keys = load_keys(args.keys_file, args.limit)
+    for name in args.function or FUNCTIONS:
+        print_report(name, analyze(keys, FUNCTIONS[name](args.seed),
+                                   power_of_two=args.power_of_two))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,227 @@
+# Course: CS261 - Data Structures
+# Assignment: 6 - HashMap Implementation
+# Description: Hashing engine shared by both HashMaps. Produces exactly the
+#              same values as hash_function_1 and hash_function_2 from
+#              a6_include, but consumes each key as a whole (encoded bytes or
+#              a NumPy code-point matrix) instead of looping one character at
+#              a time, and memoizes recently seen keys in a bounded cache.
+
+from functools import lru_cache
+from operator import mul
+
+from a6_include import hash_function_1, hash_function_2
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batches fall back to scalar hashing
+    np = None
+
+
+# Number of recently hashed keys remembered by each engine
+DEFAULT_CACHE_SIZE = 4096
+
+# Batches smaller than this are cheaper to hash one key at a time
+NUMPY_BATCH_THRESHOLD = 64
+
+# Upper bound on the cells (rows x longest key) of one code-point matrix.
+# Every row is padded to the longest key of its chunk, so the bound is on
+# cells rather than rows: one long key shrinks the chunk instead of widening
+# thousands of short rows. 4M uint32 cells is 16 MiB (32 MiB once widened
+# to int64 for hash_function_2).
+NUMPY_MAX_CELLS = 1 << 22
+
+
+def fast_hash_function_1(key: str) -> int:
+    """
+    Bit-for-bit equivalent of hash_function_1 (sum of character codes).
+
+    :param key:     string to hash
+    :return:        integer hash value
+    """
+    if key.isascii():
+        return sum(key.encode('ascii'))
+    return sum(map(ord, key))
+
+
+def fast_hash_function_2(key: str) -> int:
+    """
+    Bit-for-bit equivalent of hash_function_2 (position weighted sum of
+    character codes).
+
+    :param key:     string to hash
+    :return:        integer hash value
+    """
+    if key.isascii():
+        return sum(map(mul, range(1, len(key) + 1), key.encode('ascii')))
+    return sum(map(mul, range(1, len(key) + 1), map(ord, key)))
+
+
+_MASK_64 = (1 << 64) - 1
+
+
+def mix_hash(hash: int) -> int:
+    """
+    Scramble a hash value with the SplitMix64 finalizer, so that nearby
+    inputs (such as character code sums) spread over all 64 bits.
+
+    :param hash:    non-negative integer hash value
+    :return:        mixed 64-bit hash value
+    """
+    z = hash & _MASK_64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return z ^ (z >> 31)
+
+
+def fold_hash(hash: int) -> int:
+    """
+    Cheaper alternative to mix_hash for indexing power-of-two tables: one
+    multiply by the 64-bit golden ratio (Fibonacci hashing), with the high
+    half folded into the low half so the low bits depend on every input
+    bit. Like mix_hash it is a bijection on 64-bit values.
+
+    :param hash:    non-negative integer hash value
+    :return:        mixed 64-bit hash value
+    """
+    z = (hash * 0x9E3779B97F4A7C15) & _MASK_64
+    return z ^ (z >> 32)
+
+
+def _code_point_matrix(keys: list):
+    """
+    Convert a list of strings into a 2D uint32 matrix of code points, one row
+    per key, right-padded with zeros. Zero padding contributes nothing to
+    either hash, so row reductions give the exact hash values.
+    """
+    array = np.array(keys, dtype=np.str_)
+    width = array.dtype.itemsize // 4
+    return array.view(np.uint32).reshape(len(keys), width)
+
+
+def _chunks(keys: list):
+    """
+    Yield (start, end) ranges that split keys into chunks whose code-point
+    matrix has at most NUMPY_MAX_CELLS cells.
+    """
+    start, width = 0, 1
+    for end, key in enumerate(keys):
+        longest = max(width, len(key))
+        if (end - start + 1) * longest > NUMPY_MAX_CELLS and end > start:
+            yield start, end
+            start, longest = end, max(len(key), 1)
+        width = longest
+    if start < len(keys):
+        yield start, len(keys)
+
+
+def _numpy_hash_1(keys: list) -> list:
+    """Vectorized hash_function_1 over a list of strings."""
+    codes = _code_point_matrix(keys)
+    return codes.sum(axis=1, dtype=np.int64).tolist()
+
+
+def _numpy_hash_2(keys: list) -> list:
+    """Vectorized hash_function_2 over a list of strings."""
+    codes = _code_point_matrix(keys)
+    weights = np.arange(1, codes.shape[1] + 1, dtype=np.int64)
+    return (codes.astype(np.int64) @ weights).tolist()
+
+
+# Known hash functions mapped to their (scalar, batch) fast kernels
+_KERNELS = {
+    hash_function_1: (fast_hash_function_1, _numpy_hash_1),
+    hash_function_2: (fast_hash_function_2, _numpy_hash_2),
+}
+
+
+def _mixed(scalar: callable) -> callable:
+    """Wrap a scalar kernel so that its results pass through fold_hash."""
+    def hash(key: str) -> int:
+        return fold_hash(scalar(key))
+    return hash
+
+
+def _mixed_batch(batch: callable) -> callable:
+    """Wrap a batch kernel so that its results pass through fold_hash."""
+    def hash_batch(keys: list) -> list:
+        return list(map(fold_hash, batch(keys)))
+    return hash_batch
+
+
+def register_kernel(function: callable,
+                    scalar: callable,
+                    batch: callable = None) -> None:
+    """
+    Register fast kernels for a hash function. Engines created afterwards for
+    that function use them instead of calling the function directly.
+
+    :param function:    hash function as passed to a HashMap constructor
+    :param scalar:      callable(str) -> int returning the same values
+    :param batch:       optional NumPy based callable(list) -> list
+    """
+    _KERNELS[function] = (scalar, batch)
+
+
+class HashEngine:
+    """
+    Callable wrapper around a HashMap hash function. Single keys are hashed
+    through a bounded LRU cache, and batches of keys are hashed in one call.
+    """
+
+    def __init__(self,
+                 function: callable = hash_function_1,
+                 cache_size: int = DEFAULT_CACHE_SIZE,
+                 mix: bool = False) -> None:
+        """
+        Initialize engine for the given hash function.
+
+        :param function:    hash function whose values the engine reproduces
+        :param cache_size:  number of recent keys memoized, 0 disables caching
+        :param mix:         pass every value through fold_hash, for tables
+                            that index with the low bits of the hash
+        """
+        self.function = function
+        scalar, batch = _KERNELS.get(function, (function, None))
+        if mix:
+            scalar = _mixed(scalar)
+            if batch is not None:
+                batch = _mixed_batch(batch)
+        self._scalar = scalar
+        self._batch = batch
+        self._cached = lru_cache(maxsize=cache_size)(scalar) if cache_size \
+            else scalar
+
+    def __call__(self, key: str) -> int:
+        """Return the hash of a single key."""
+        return self._cached(key)
+
+    def hash_many(self, keys: list) -> list:
+        """
+        Return the hashes of a list of string keys, in order.
+
+        :param keys:    list of strings to hash
+        :return:        list of integer hash values
+        """
+        if self._batch is None or np is None \
+                or len(keys) < NUMPY_BATCH_THRESHOLD:
+            return list(map(self._cached, keys))
+
+        hashes = []
+        for start, end in _chunks(keys):
+            # A single key too long for the matrix is hashed on its own
+            if end - start == 1 and len(keys[start]) > NUMPY_MAX_CELLS:
+                hashes.append(self._cached(keys[start]))
+            else:
+                hashes.extend(self._batch(keys[start:end]))
+        return hashes
+
+    def cache_info(self):
+        """Return hit/miss statistics of the memoization cache, if enabled."""
+        if self._cached is self._scalar:
+            return None
+        return self._cached.cache_info()
+
+    def cache_clear(self) -> None:
+        """Forget all memoized hashes."""
+        if self._cached is not self._scalar:
+            self._cached.cache_clear()
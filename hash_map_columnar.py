@@ -0,0 +1,343 @@
+# Course: CS261 - Data Structures
+# Assignment: 6 - HashMap Implementation
+# Description: Open Addressing HashMap with quadratic probing (same behaviour
+#              and API as hash_map_oa.HashMap) that stores its slots as
+#              parallel columns instead of one HashEntry object per slot:
+#              an array('q') of key hashes, with sentinel values for empty
+#              and deleted slots, plus plain lists of keys and values.
+#              Probing reads machine integers from one contiguous buffer and
+#              only touches a key when the hashes already match.
+
+from array import array
+
+from a6_include import (DynamicArray, HashEntry,
+                        hash_function_1, hash_function_2)
+from hash_engine import HashEngine
+from primes import next_prime
+
+# Slot markers in the hash column; stored hashes are always non-negative
+EMPTY = -1
+TOMBSTONE = -2
+
+# Stored hashes are truncated to fit a signed 64-bit column
+_HASH_MASK = (1 << 63) - 1
+
+
+class ColumnarHashMap:
+    __slots__ = ('_hashes', '_keys', '_values', '_capacity',
+                 '_hash_function', '_size', '_tombstones', '_tombstone_limit')
+
+    def __init__(self, capacity: int, function,
+                 tombstone_limit: float = 0.25) -> None:
+        """
+        Initialize new HashMap that uses quadratic probing for collision
+        resolution over columnar storage.
+
+        :param capacity:        initial capacity, rounded up to a prime
+        :param function:        hash function applied to str(key)
+        :param tombstone_limit: fraction of slots that may hold tombstones
+                                before the table is compacted (None: never)
+        """
+        self._hash_function = HashEngine(function)
+        self._size = 0
+        self._tombstones = 0
+        self._tombstone_limit = tombstone_limit
+        self._allocate(next_prime(capacity))
+
+    def __str__(self) -> str:
+        """Override string method to provide more readable output."""
+        out = ''
+        for i in range(self._capacity):
+            hash = self._hashes[i]
+            if hash == EMPTY:
+                out += str(i) + ': None\n'
+            else:
+                out += (str(i) + ': K: ' + str(self._keys[i]) + ' V: '
+                        + str(self._values[i]) + ' TS: '
+                        + str(hash == TOMBSTONE) + '\n')
+        return out
+
+    def get_size(self) -> int:
+        """Return size of map."""
+        return self._size
+
+    def get_capacity(self) -> int:
+        """Return capacity of map."""
+        return self._capacity
+
+    # ------------------------------------------------------------------ #
+
+    def _allocate(self, capacity: int) -> None:
+        """Install empty columns of the given capacity."""
+        self._capacity = capacity
+        self._hashes = array('q', [EMPTY]) * capacity
+        self._keys = [None] * capacity
+        self._values = [None] * capacity
+
+    def _find_index(self, key: str, hash: int) -> int:
+        """
+        Return the slot holding the given key, or -1 if not present.
+
+        :param key:     key to search for
+        :param hash:    stored (masked) hash of the key
+        :return:        slot index, or -1
+        """
+        hashes = self._hashes
+        capacity = self._capacity
+
+        # Perform quadratic probing
+        initial_index = hash % capacity
+        index = initial_index
+        slot_hash = hashes[index]
+        j = 0
+        while slot_hash != EMPTY and j < capacity:
+            # Tombstones never match a stored hash
+            if slot_hash == hash and self._keys[index] == key:
+                return index
+
+            j += 1
+            index = (initial_index + j * j) % capacity
+            slot_hash = hashes[index]
+
+        return -1
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Updates specified key/value pair in the HashMap. If the key/value pair
+        doesn't exist, it is added to the HashMap.
+
+        :param key:     string representation of a key to be added or updated
+        :param value:   object representation of a value, corresponding to the
+                        specified key, to be added or updated
+        """
+        # Check load factor and resize if needed
+        if self.table_load() >= 0.5:
+            self.resize_table(2 * self._capacity)
+
+        hash = self._hash_function(str(key)) & _HASH_MASK
+        hashes = self._hashes
+        capacity = self._capacity
+
+        # Single pass: remember the first tombstone, but keep probing until
+        # an empty slot proves the key absent
+        initial_index = hash % capacity
+        index = initial_index
+        slot_hash = hashes[index]
+        free_index = -1
+        j = 0
+        while slot_hash != EMPTY and j < capacity:
+            if slot_hash == TOMBSTONE:
+                if free_index == -1:
+                    free_index = index
+
+            # Match found
+            elif slot_hash == hash and self._keys[index] == key:
+                self._values[index] = value
+                return
+
+            j += 1
+            index = (initial_index + j * j) % capacity
+            slot_hash = hashes[index]
+
+        if free_index != -1:
+            index = free_index
+            self._tombstones -= 1
+
+        # Probe sequence exhausted without a free slot
+        elif slot_hash != EMPTY:
+            self.resize_table(2 * self._capacity)
+            self.put(key, value)
+            return
+
+        hashes[index] = hash
+        self._keys[index] = key
+        self._values[index] = value
+        self._size += 1
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Changes the capacity of the columns to the next prime number at or
+        above new_capacity (grown further to keep the load factor below 0.5)
+        and reinserts every entry using its stored hash.
+
+        :param new_capacity:    integer describing new column size
+        """
+        # Validate new_capacity
+        if new_capacity < self._size:
+            return
+
+        new_capacity = next_prime(new_capacity)
+        while self._size > 0 and (self._size - 1) / new_capacity >= 0.5:
+            new_capacity = next_prime(2 * new_capacity)
+
+        self._rehash(new_capacity)
+
+    def _rehash(self, new_capacity: int) -> None:
+        """
+        Move every live slot into new columns of the given capacity.
+        Keys are unique and the new columns hold no tombstones, so each
+        entry only probes for the first empty slot.
+
+        :param new_capacity:    integer describing new column size
+        """
+        old_hashes, old_keys, old_values = \
+            self._hashes, self._keys, self._values
+        self._allocate(new_capacity)
+        hashes, keys, values = self._hashes, self._keys, self._values
+
+        for old_index in range(len(old_hashes)):
+            hash = old_hashes[old_index]
+            if hash < 0:
+                continue
+
+            initial_index = hash % new_capacity
+            index = initial_index
+            j = 0
+            while hashes[index] != EMPTY:
+                j += 1
+                index = (initial_index + j * j) % new_capacity
+            hashes[index] = hash
+            keys[index] = old_keys[old_index]
+            values[index] = old_values[old_index]
+
+        self._tombstones = 0
+
+    def table_load(self) -> float:
+        """
+        Return the current hash table load factor.
+
+        :return:    float representation of the current load factor
+        """
+        return self._size / self._capacity
+
+    def occupied_load(self) -> float:
+        """
+        Return the fraction of slots that are not empty, counting tombstones.
+
+        :return:    float representation of the occupied load factor
+        """
+        return (self._size + self._tombstones) / self._capacity
+
+    def empty_buckets(self) -> int:
+        """
+        Returns the number of empty buckets in the HashMap.
+
+        :return:    integer representation of the number of empty buckets
+        """
+        return self._capacity - self._size - self._tombstones
+
+    def tombstone_count(self) -> int:
+        """
+        Returns the number of tombstones in the HashMap.
+
+        :return:    integer count of removed entries still occupying slots
+        """
+        return self._tombstones
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value associated with the specified key, or None
+        if the key is not contained in the HashMap.
+
+        :param key:     string type key whose value we seek to retrieve
+        :return:        object representation of the matching value,
+                        or None if not present
+        """
+        index = self._find_index(
+            key, self._hash_function(str(key)) & _HASH_MASK)
+        if index == -1:
+            return None
+
+        return self._values[index]
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Uses Boolean logic to express whether a specified key is present.
+
+        :param key:     string type key who we are inquiring about
+        :return:        Boolean logic describing whether the specified key
+                        is in the HashMap (True) or not (False)
+        """
+        return self._find_index(
+            key, self._hash_function(str(key)) & _HASH_MASK) != -1
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the specified key-value pair from HashMap, if they exist.
+
+        :param key:     string type key that we seek to remove
+        """
+        index = self._find_index(
+            key, self._hash_function(str(key)) & _HASH_MASK)
+        if index == -1:
+            return
+
+        self._hashes[index] = TOMBSTONE
+        self._keys[index] = None
+        self._values[index] = None
+        self._size -= 1
+        self._tombstones += 1
+
+        # Compact once tombstones make up too much of the table
+        if (self._tombstone_limit is not None
+                and self._tombstones > self._tombstone_limit * self._capacity):
+            self._rehash(self._capacity)
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Extracts all key-value pairs from the HashMap and stores them
+        in a DynamicArray (in no particular order).
+
+        :return:    DynamicArray containing all key-value pairs in HashMap
+        """
+        output_array = DynamicArray()
+        for index in range(self._capacity):
+            if self._hashes[index] >= 0:
+                output_array.append((self._keys[index], self._values[index]))
+
+        return output_array
+
+    def clear(self) -> None:
+        """
+        Clears the contents of the HashMap, while maintaining the same capacity.
+        """
+        self._allocate(self._capacity)
+        self._size = 0
+        self._tombstones = 0
+
+    def __iter__(self):
+        """
+        Iterator for the HashMap. Entries are materialized as HashEntry
+        objects on the fly; updating them does not change the map.
+
+        :return     iterator over HashEntry objects
+        """
+        for index in range(self._capacity):
+            hash = self._hashes[index]
+            if hash >= 0:
+                yield HashEntry(self._keys[index], self._values[index], hash)
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+
+if __name__ == "__main__":
+    print("\nColumnar - put example")
+    print("----------------------")
+    m = ColumnarHashMap(53, hash_function_1)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+        if i % 25 == 24:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(),
+                  m.get_capacity())
+
+    print("\nColumnar - __iter__() example")
+    print("-----------------------------")
+    m = ColumnarHashMap(10, hash_function_2)
+    for i in range(5):
+        m.put(str(i), str(i * 24))
+    m.remove('0')
+    m.remove('4')
+    print(m)
+    for item in m:
+        print('K:', item.key, 'V:', item.value)
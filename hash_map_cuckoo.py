@@ -0,0 +1,367 @@
+# Course: CS261 - Data Structures
+# Assignment: 6 - HashMap Implementation
+# Description: Implementation of a HashMap using cuckoo hashing. Every key
+#              has exactly two candidate slots, derived from hash_function_1
+#              and hash_function_2 mixed with per-table random seeds, plus a
+#              small stash for keys that could not be placed. get, contains_key
+#              and remove therefore inspect at most 2 + stash_size entries.
+#              Insertion evicts occupants to their alternate slot; when that
+#              cycles, the table is rebuilt with fresh seeds, and when seeds
+#              alone do not help, with a keyed second hash of the keys.
+
+import random
+
+from a6_include import (DynamicArray, HashEntry, hash_function_1,
+                        hash_function_2, make_siphash_function)
+from hash_engine import HashEngine, mix_hash
+from primes import next_prime
+
+
+class CuckooEntry(HashEntry):
+    """HashEntry that also keeps the key's second hash."""
+
+    __slots__ = ('hash2',)
+
+    def __init__(self, key: str, value: object, hash: int,
+                 hash2: int) -> None:
+        """Initialize an entry with both full hashes of its key."""
+        super().__init__(key, value, hash)
+        self.hash2 = hash2
+
+
+class CuckooHashMap:
+    __slots__ = ('_buckets', '_capacity', '_hash_function', '_hash_function2',
+                 '_size', '_stash', '_stash_size', '_seed1', '_seed2',
+                 '_max_kicks', '_random', '_rebuilds')
+
+    # Highest load factor before the table grows; two-choice cuckoo hashing
+    # starts failing to place keys shortly above 0.5
+    MAX_LOAD = 0.45
+
+    # Rebuilds with fresh seeds attempted before the table is also grown
+    REBUILDS_PER_GROWTH = 3
+
+    def __init__(self, capacity: int,
+                 function: callable = hash_function_1,
+                 function2: callable = hash_function_2,
+                 stash_size: int = 4,
+                 seed: int = None) -> None:
+        """
+        Initialize new HashMap that uses cuckoo hashing.
+
+        :param capacity:    initial number of slots, rounded up to a prime
+        :param function:    hash function for each key's first slot
+        :param function2:   hash function for each key's second slot
+        :param stash_size:  number of keys that may live outside the table
+        :param seed:        seed for the slot seeds, for reproducible layouts
+        """
+        self._random = random.Random(seed)
+        self._hash_function = HashEngine(function)
+        self._hash_function2 = HashEngine(function2)
+        self._stash_size = stash_size
+        self._size = 0
+        self._rebuilds = 0
+        self._reset(next_prime(capacity))
+
+    def __str__(self) -> str:
+        """Override string method to provide more readable output."""
+        out = ''
+        for i in range(self._buckets.length()):
+            out += str(i) + ': ' + str(self._buckets[i]) + '\n'
+        for entry in self._stash:
+            out += 'stash: ' + str(entry) + '\n'
+        return out
+
+    def get_size(self) -> int:
+        """Return size of map."""
+        return self._size
+
+    def get_capacity(self) -> int:
+        """Return capacity of map."""
+        return self._capacity
+
+    def rebuild_count(self) -> int:
+        """Return how many times the table was rebuilt after a failed insert."""
+        return self._rebuilds
+
+    # ------------------------------------------------------------------ #
+
+    def _reset(self, capacity: int) -> None:
+        """Install an empty table of the given capacity with fresh seeds."""
+        self._capacity = capacity
+        self._buckets = DynamicArray([None] * capacity)
+        self._stash = []
+        self._seed1 = self._random.getrandbits(64)
+        self._seed2 = self._random.getrandbits(64)
+        self._max_kicks = max(16, 3 * capacity.bit_length())
+
+    def _rekey(self, entries: list) -> None:
+        """
+        Replace the second hash function with SipHash under a fresh random
+        key and recompute the second hash of every entry. Keys that share
+        both hashes of the original functions (anagrams such as 'abba' and
+        'baab' under hash_function_1 and hash_function_2) are sent to the
+        same two slots by any seeds; a keyed hash of the key itself gives
+        them independent second slots, so the stash never has to grow.
+
+        :param entries: list of every CuckooEntry to be reinserted
+        """
+        self._hash_function2 = HashEngine(
+            make_siphash_function(self._random.getrandbits(128)))
+        for entry in entries:
+            entry.hash2 = self._hash_function2(str(entry.key))
+
+    def _slots(self, hash: int, hash2: int) -> tuple:
+        """Return the two candidate slots for a pair of key hashes."""
+        return (mix_hash(hash ^ self._seed1) % self._capacity,
+                mix_hash(hash2 ^ self._seed2) % self._capacity)
+
+    def _find(self, key: str, hash: int, hash2: int) -> CuckooEntry:
+        """
+        Return the entry with matching key, or None. Looks at the two
+        candidate slots and the stash only.
+        """
+        index1, index2 = self._slots(hash, hash2)
+        entry = self._buckets.get_at_index(index1)
+        if entry is not None and entry.hash == hash and entry.key == key:
+            return entry
+
+        entry = self._buckets.get_at_index(index2)
+        if entry is not None and entry.hash == hash and entry.key == key:
+            return entry
+
+        for entry in self._stash:
+            if entry.hash == hash and entry.key == key:
+                return entry
+
+        return None
+
+    def _place(self, entry: CuckooEntry) -> CuckooEntry:
+        """
+        Insert an entry whose key is known to be absent, evicting occupants
+        to their alternate slot as needed, or stashing the last one evicted.
+
+        :param entry:   CuckooEntry to insert
+        :return:        entry left without a slot, or None on success
+        """
+        buckets = self._buckets
+        index1, index2 = self._slots(entry.hash, entry.hash2)
+        if buckets.get_at_index(index1) is None:
+            buckets.set_at_index(index1, entry)
+            return None
+        if buckets.get_at_index(index2) is None:
+            buckets.set_at_index(index2, entry)
+            return None
+
+        index = index1
+        for _ in range(self._max_kicks):
+            occupant = buckets.get_at_index(index)
+            buckets.set_at_index(index, entry)
+            if occupant is None:
+                return None
+
+            # Send the evicted entry to its other slot
+            entry = occupant
+            index1, index2 = self._slots(entry.hash, entry.hash2)
+            index = index2 if index == index1 else index1
+
+        if len(self._stash) < self._stash_size:
+            self._stash.append(entry)
+            return None
+        return entry
+
+    def _rebuild(self, capacity: int, extra: CuckooEntry = None) -> None:
+        """
+        Reinsert every entry into a table of the given capacity with new
+        seeds, retrying with more seeds (and eventually more capacity and a
+        keyed second hash) until every entry has a place. The stash keeps
+        its size.
+
+        :param capacity:    capacity of the new table
+        :param extra:       entry not currently stored that must be included
+        """
+        entries = [entry for entry in self]
+        if extra is not None:
+            entries.append(extra)
+
+        attempts = 0
+        while True:
+            self._reset(capacity)
+            for entry in entries:
+                if self._place(entry) is not None:
+                    break
+            else:
+                return
+
+            attempts += 1
+            self._rebuilds += 1
+            if attempts % self.REBUILDS_PER_GROWTH == 0:
+                capacity = next_prime(2 * capacity)
+                # Keys sharing both hashes can never be separated by seeds
+                self._rekey(entries)
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Updates specified key/value pair in the HashMap. If the key/value pair
+        doesn't exist, it is added to the HashMap.
+
+        :param key:     string representation of a key to be added or updated
+        :param value:   object representation of a value, corresponding to the
+                        specified key, to be added or updated
+        """
+        string_key = str(key)
+        hash = self._hash_function(string_key)
+        hash2 = self._hash_function2(string_key)
+
+        # Match found
+        entry = self._find(key, hash, hash2)
+        if entry is not None:
+            entry.value = value
+            return
+
+        # Check load factor and resize if needed
+        if (self._size + 1) / self._capacity > self.MAX_LOAD:
+            self._rebuild(next_prime(2 * self._capacity))
+
+        homeless = self._place(CuckooEntry(key, value, hash, hash2))
+        self._size += 1
+        if homeless is not None:
+            self._rebuild(self._capacity, homeless)
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Changes the capacity to the next prime number at or above
+        new_capacity (grown further if needed to respect MAX_LOAD) and
+        reinserts all entries.
+
+        :param new_capacity:    integer describing new DynamicArray size
+        """
+        # Validate new_capacity
+        if new_capacity < self._size:
+            return
+
+        new_capacity = next_prime(new_capacity)
+        while self._size / new_capacity > self.MAX_LOAD:
+            new_capacity = next_prime(2 * new_capacity)
+        self._rebuild(new_capacity)
+
+    def table_load(self) -> float:
+        """
+        Return the current hash table load factor.
+
+        :return:    float representation of the current load factor
+        """
+        return self._size / self._capacity
+
+    def empty_buckets(self) -> int:
+        """
+        Returns the number of empty buckets in the HashMap.
+        Stashed entries do not occupy a bucket.
+
+        :return:    integer representation of the number of empty buckets
+        """
+        return self._capacity - self._size + len(self._stash)
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value associated with the specified key, or None
+        if the key is not contained in the HashMap.
+
+        :param key:     string type key whose value we seek to retrieve
+        :return:        object representation of the matching value,
+                        or None if not present
+        """
+        string_key = str(key)
+        entry = self._find(key, self._hash_function(string_key),
+                           self._hash_function2(string_key))
+        if entry is None:
+            return None
+
+        return entry.value
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Uses Boolean logic to express whether a specified key is present.
+
+        :param key:     string type key who we are inquiring about
+        :return:        Boolean logic describing whether the specified key
+                        is in the HashMap (True) or not (False)
+        """
+        string_key = str(key)
+        return self._find(key, self._hash_function(string_key),
+                          self._hash_function2(string_key)) is not None
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the specified key-value pair from HashMap, if they exist.
+
+        :param key:     string type key that we seek to remove
+        """
+        string_key = str(key)
+        hash = self._hash_function(string_key)
+        hash2 = self._hash_function2(string_key)
+
+        for index in self._slots(hash, hash2):
+            entry = self._buckets.get_at_index(index)
+            if entry is not None and entry.hash == hash and entry.key == key:
+                self._buckets.set_at_index(index, None)
+                self._size -= 1
+                return
+
+        for position, entry in enumerate(self._stash):
+            if entry.hash == hash and entry.key == key:
+                self._stash.pop(position)
+                self._size -= 1
+                return
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Extracts all key-value pairs from the HashMap and stores them
+        in a DynamicArray (in no particular order).
+
+        :return:    DynamicArray containing all key-value pairs in HashMap
+        """
+        output_array = DynamicArray()
+        for entry in self:
+            output_array.append((entry.key, entry.value))
+
+        return output_array
+
+    def clear(self) -> None:
+        """
+        Clears the contents of the HashMap, while maintaining the same capacity.
+        """
+        self._buckets = DynamicArray([None] * self._capacity)
+        self._stash = []
+        self._size = 0
+
+    def __iter__(self):
+        """
+        Iterator for the HashMap, yielding table entries then stashed ones
+
+        :return     iterator over the CuckooEntry objects
+        """
+        for index in range(self._capacity):
+            entry = self._buckets.get_at_index(index)
+            if entry is not None:
+                yield entry
+        yield from list(self._stash)
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+
+if __name__ == "__main__":
+    print("\nCuckoo - put example")
+    print("--------------------")
+    m = CuckooHashMap(53, seed=261)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+        if i % 25 == 24:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(),
+                  m.get_capacity(), m.rebuild_count())
+
+    print("\nCuckoo - get example")
+    print("--------------------")
+    for i in range(145, 152):
+        print('str' + str(i), m.get('str' + str(i)))
@@ -11,7 +11,11 @@
 
 from typing import Tuple, Any
 from a6_include import (DynamicArray, DynamicArrayException, HashEntry,
-                        hash_function_1, hash_function_2)
+                        as_list, hash_function_1, hash_function_2)
+from hash_engine import HashEngine
+from map_stats import MapStats
+from primes import is_prime, next_prime
+from resize_policy import ResizePolicy
 
 
 class HashMapIterator:
@@ -19,6 +23,8 @@ class HashMapIterator:
     Separate iterator class for HashMap implementation with Open Addressing
     """
 
+    __slots__ = ('_buckets', '_index')
+
     def __init__(self, current_buckets: DynamicArray) -> None:
         """Initialize the iterator with an entry."""
         self._buckets = current_buckets
@@ -30,6 +36,9 @@ class HashMapIterator:
 
     def __next__(self) -> HashEntry:
         """Obtain next valid entry and advance iterator."""
+        if self._index >= self._buckets.length():
+            raise StopIteration
+
         current_entry = self._buckets.get_at_index(self._index)
         while current_entry is None or current_entry.is_tombstone:
             self._index += 1
@@ -44,22 +53,81 @@ class HashMapIterator:
         return current_entry
 
 
+# Left in old table slots whose entry was moved by an incremental resize,
+# so probe sequences through those slots keep going
+_MIGRATED = HashEntry(None, None)
+_MIGRATED.is_tombstone = True
+
+# Placeholder value of an entry merge() has just added
+_ABSENT = object()
+
+
 class HashMap:
-    def __init__(self, capacity: int, function) -> None:
+    __slots__ = ('_buckets', '_capacity', '_hash_function', '_size',
+                 '_tombstones', '_tombstone_limit',
+                 '_incremental', '_old_buckets', '_old_capacity',
+                 '_migrate_index', '_power_of_two',
+                 '_policy')
+
+    # Old slots moved to the new table per operation in incremental mode
+    MIGRATE_SLOTS = 8
+
+    # Probe counter ([count]) that probe loops add to; only
+    # InstrumentedHashMap sets one, so plain maps skip the counting
+    _probes = None
+
+    def __init__(self, capacity: int, function,
+                 incremental_resize: bool = False,
+                 tombstone_limit: float = 0.25,
+                 expected_size: int = 0,
+                 power_of_two: bool = False,
+                 policy: ResizePolicy = None) -> None:
         """
         Initialize new HashMap that uses
-        quadratic probing for collision resolution
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        quadratic probing for collision resolution.
+        Keys are hashed through a HashEngine, which reproduces the values
+        of the given hash function and caches recently seen keys.
+        With incremental_resize, growing the table migrates a few slots
+        per operation instead of rehashing everything inside one put().
+        Once tombstones fill more than tombstone_limit of the capacity, the
+        table is rehashed at its current capacity to reclaim them
+        (None disables compaction).
+        expected_size raises the initial capacity so that this many keys
+        can be added without any resize (see reserve()).
+        With power_of_two, capacities are powers of two instead of primes:
+        hashes are scrambled with fold_hash, reduced with a bit mask and
+        probed at triangular offsets (1, 3, 6, ...), which visit every slot.
+        policy.grow_at may not exceed 0.5 for prime capacities (1 for powers
+        of two), or an insert could find every slot in its reach taken.
         """
+        self._power_of_two = power_of_two
+        self._policy = policy if policy is not None \
+            else ResizePolicy(grow_at=0.5)
+
+        # Quadratic probing on a prime table reaches only (capacity + 1) / 2
+        # slots, which holds a free one only while the table is half empty
+        if self._policy.grow_at > (1 if power_of_two else 0.5):
+            raise ValueError("grow_at must be at most 0.5 with prime "
+                             "capacities and at most 1 with powers of two")
         self._buckets = DynamicArray()
 
-        # capacity must be a prime number
-        self._capacity = self._next_prime(capacity)
+        # capacity must be a prime number (or a power of two)
+        capacity = max(capacity, self._policy.capacity_for(expected_size))
+        self._capacity = self._round_capacity(capacity) if power_of_two \
+            else self._next_prime(capacity)
         for _ in range(self._capacity):
             self._buckets.append(None)
 
-        self._hash_function = function
+        self._hash_function = HashEngine(function, mix=power_of_two)
         self._size = 0
+        self._tombstones = 0
+        self._tombstone_limit = tombstone_limit
+
+        # Incremental resize state; _old_buckets is None unless migrating
+        self._incremental = incremental_resize
+        self._old_buckets = None
+        self._old_capacity = 0
+        self._migrate_index = 0
 
     def __str__(self) -> str:
         """
@@ -73,36 +141,31 @@ class HashMap:
 
     def _next_prime(self, capacity: int) -> int:
         """
-        Increment from given number to find the closest prime number
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Return the closest prime number at or above the given number
+        (see primes.next_prime)
         """
-        if capacity % 2 == 0:
-            capacity += 1
-
-        while not self._is_prime(capacity):
-            capacity += 2
-
-        return capacity
+        return next_prime(capacity)
 
     @staticmethod
     def _is_prime(capacity: int) -> bool:
         """
         Determine if given integer is a prime number and return boolean
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        (see primes.is_prime)
         """
-        if capacity == 2 or capacity == 3:
-            return True
-
-        if capacity == 1 or capacity % 2 == 0:
-            return False
+        return is_prime(capacity)
 
-        factor = 3
-        while factor ** 2 <= capacity:
-            if capacity % factor == 0:
-                return False
-            factor += 2
+    def _round_capacity(self, capacity: int) -> int:
+        """
+        Return the capacity the table actually uses for a requested one:
+        the given number if prime, else the next prime, or in power_of_two
+        mode the next power of two.
+        """
+        if self._power_of_two:
+            return 1 << (max(capacity, 1) - 1).bit_length()
 
-        return True
+        if not self._is_prime(capacity):
+            capacity = self._next_prime(capacity)
+        return capacity
 
     def get_size(self) -> int:
         """
@@ -128,36 +191,93 @@ class HashMap:
         :param value:   object representation of a value, corresponding to the
                         specified key, to be added or updated
         """
+        self._make_room()
+        self._find_or_insert(key, self._hash_function(str(key)),
+                             value).value = value
+
+    def _make_room(self, pending: int = 1) -> None:
+        """
+        Advance any incremental resize and grow the table if the load factor
+        calls for it. Called before every operation that may add a key.
+
+        :param pending:     number of keys the caller may still add; a
+                            growth makes room for all of them at once
+        """
+        if self._old_buckets is not None:
+            self._migrate(self.MIGRATE_SLOTS)
+
         # Check load factor and resize if needed
-        if self.table_load() >= 0.5:
-            self.resize_table(2 * self._capacity)
+        if self.table_load() >= self._policy.grow_at:
+            capacity = max(self._policy.grown_capacity(self._capacity),
+                           self._policy.capacity_for(self._size + pending))
+            if self._incremental:
+                self._start_migration(capacity)
+            else:
+                self.resize_table(capacity)
 
-        # Calculate initial index from hash function
-        initial_index = self._hash_function(str(key)) % self._capacity
+    def _find_or_insert(self, key: str, hash: int,
+                        value: object) -> HashEntry:
+        """
+        Returns the live entry holding key, first adding one with the given
+        value if the key is absent, in a single probe sequence.
 
-        # Perform quadratic probing
+        :param key:     key to find or add
+        :param hash:    full (unreduced) hash of the key
+        :param value:   value of the entry added for an absent key
+        :return:        HashEntry holding the key
+        """
+        # Keys that have not been migrated yet are used in place
+        if self._old_buckets is not None:
+            entry = self._probe(self._old_buckets, self._old_capacity,
+                                key, hash)
+            if entry is not None:
+                return entry
+
+        # Perform quadratic probing in a single pass: remember the first
+        # tombstone, but keep going until an empty slot proves the key absent
+        mask = self._capacity - 1 if self._power_of_two else 0
+        initial_index = hash & mask if mask else hash % self._capacity
         index = initial_index
         entry = self._buckets.get_at_index(index)
+        free_index = None
         j = 0
 
-        while j < self._capacity:
-            # Replace None and tombstone values
-            if entry is None or entry.is_tombstone:
-                new_entry = HashEntry(key, value)
-                self._buckets.set_at_index(index, new_entry)
-                self._size += 1
-                return
+        while entry is not None and j < self._capacity:
+            if entry.is_tombstone:
+                if free_index is None:
+                    free_index = index
 
             # Match found
-            elif entry.key == key:
-                entry.value = value
-                return
+            elif entry.hash == hash and entry.key == key:
+                if self._probes is not None:
+                    self._probes[0] += j + 1
+                return entry
 
             # Continue probing
+            j += 1
+            if mask:
+                index = (index + j) & mask
             else:
-                j += 1
                 index = (initial_index + (j ** 2)) % self._capacity
-                entry = self._buckets.get_at_index(index)
+            entry = self._buckets.get_at_index(index)
+
+        if self._probes is not None:
+            self._probes[0] += min(j + 1, self._capacity)
+
+        # Prefer the earliest tombstone, which also shortens the chain
+        if free_index is not None:
+            index = free_index
+            self._tombstones -= 1
+
+        # Probe sequence exhausted without a free slot
+        elif entry is not None:
+            self.resize_table(self._policy.grown_capacity(self._capacity))
+            return self._find_or_insert(key, hash, value)
+
+        entry = HashEntry(key, value, hash)
+        self._buckets.set_at_index(index, entry)
+        self._size += 1
+        return entry
 
     def resize_table(self, new_capacity: int) -> None:
         """
@@ -171,29 +291,181 @@ class HashMap:
         if new_capacity < self._size:
             return
 
-        if not self._is_prime(new_capacity):
-            new_capacity = self._next_prime(new_capacity)
+        self._finish_migration()
+
+        new_capacity = self._round_capacity(new_capacity)
+
+        # Grow the target the same way put() would while reinserting
+        while self._size > 0 and \
+                (self._size - 1) / new_capacity >= self._policy.grow_at:
+            new_capacity = self._round_capacity(
+                self._policy.grown_capacity(new_capacity))
+
+        self._rehash(new_capacity)
+
+    def reserve(self, count: int) -> None:
+        """
+        Grows the table, with a single rehash, so that it can hold count
+        keys in total without resizing again. Never shrinks the table.
+
+        :param count:   total number of keys the map should hold
+        """
+        capacity = self._policy.capacity_for(count)
+        if self._capacity < capacity:
+            self.resize_table(capacity)
+
+    def _rehash(self, new_capacity: int) -> None:
+        """
+        Moves every live entry into a new DynamicArray of the given capacity.
+        Existing HashEntry objects are placed directly using their stored
+        hashes; keys are unique and the new table holds no tombstones, so
+        each entry only needs to probe for the first empty slot.
 
+        :param new_capacity:    integer describing new DynamicArray size
+        """
         # Create new DynamicArray
-        new_buckets = DynamicArray()
-        for _ in range(new_capacity):
-            new_buckets.append(None)
+        new_buckets = DynamicArray([None] * new_capacity)
 
-        # Store old values and create new ones
+        # Place old entries into new DynamicArray
         old_buckets = self._buckets
-        old_capacity = self._capacity
+        for index in range(self._capacity):
+            entry = old_buckets.get_at_index(index)
+            if entry is None or entry.is_tombstone:
+                continue
+
+            self._place_entry(new_buckets, new_capacity, entry)
+
         self._buckets = new_buckets
         self._capacity = new_capacity
-        self._size = 0
+        self._tombstones = 0
 
-        # Rehash old keys and insert into new DynamicArray
-        for index in range(old_capacity):
-            old_entry = old_buckets.get_at_index(index)
+    def _place_entry(self, buckets: DynamicArray, capacity: int,
+                     entry: HashEntry) -> HashEntry:
+        """
+        Store an entry whose key is known to be absent from the table in the
+        first free slot of its probe sequence.
 
-            if old_entry is not None and not old_entry.is_tombstone:
-                current_key = old_entry.key
-                current_value = old_entry.value
-                self.put(current_key, current_value)
+        :param buckets:     DynamicArray to place the entry in
+        :param capacity:    capacity of that DynamicArray
+        :param entry:       HashEntry to place
+        :return:            tombstone that was overwritten, or None
+        """
+        # Perform quadratic probing for a free slot
+        mask = capacity - 1 if self._power_of_two else 0
+        initial_index = entry.hash & mask if mask else entry.hash % capacity
+        index = initial_index
+        current = buckets.get_at_index(index)
+        j = 0
+        while current is not None and not current.is_tombstone:
+            j += 1
+            if mask:
+                index = (index + j) & mask
+            else:
+                index = (initial_index + (j ** 2)) % capacity
+            current = buckets.get_at_index(index)
+        buckets.set_at_index(index, entry)
+        return current
+
+    def _probe(self, buckets: DynamicArray, capacity: int,
+               key: str, hash: int) -> HashEntry:
+        """
+        Return the live entry with matching key, or None if not present.
+
+        :param buckets:     DynamicArray to search
+        :param capacity:    capacity of that DynamicArray
+        :param key:         key to search for
+        :param hash:        full (unreduced) hash of the key
+        :return:            matching HashEntry, or None
+        """
+        # Perform quadratic probing
+        mask = capacity - 1 if self._power_of_two else 0
+        initial_index = hash & mask if mask else hash % capacity
+        index = initial_index
+        entry = buckets.get_at_index(index)
+        found = None
+        j = 0
+        while j < capacity:
+            # Match not found
+            if entry is None:
+                break
+
+            # Match found
+            elif (entry.hash == hash and entry.key == key
+                  and not entry.is_tombstone):
+                found = entry
+                break
+
+            # Continue probing
+            j += 1
+            if mask:
+                index = (index + j) & mask
+            else:
+                index = (initial_index + (j ** 2)) % capacity
+            entry = buckets.get_at_index(index)
+
+        if self._probes is not None:
+            self._probes[0] += min(j + 1, capacity)
+        return found
+
+    def _find_entry(self, key: str, hash: int) -> HashEntry:
+        """
+        Return the live entry with matching key, looking in the old table
+        too while an incremental resize is in progress.
+        """
+        if self._old_buckets is not None:
+            self._migrate(self.MIGRATE_SLOTS)
+
+        entry = self._probe(self._buckets, self._capacity, key, hash)
+        if entry is None and self._old_buckets is not None:
+            entry = self._probe(self._old_buckets, self._old_capacity,
+                                key, hash)
+        return entry
+
+    def _start_migration(self, new_capacity: int) -> None:
+        """
+        Begin an incremental resize: install an empty DynamicArray of the new
+        (prime) capacity and keep the old one until it has been moved.
+
+        :param new_capacity:    integer describing new DynamicArray size
+        """
+        self._finish_migration()
+        new_capacity = self._round_capacity(new_capacity)
+
+        self._old_buckets = self._buckets
+        self._old_capacity = self._capacity
+        self._buckets = DynamicArray([None] * new_capacity)
+        self._capacity = new_capacity
+        self._migrate_index = 0
+        self._tombstones = 0
+
+    def _migrate(self, count: int) -> None:
+        """
+        Move live entries from the next `count` old slots into the new table.
+        Moved slots are marked so old probe sequences stay unbroken.
+
+        :param count:   number of old slots to move
+        """
+        old_buckets = self._old_buckets
+        start = self._migrate_index
+        end = min(start + count, self._old_capacity)
+
+        for index in range(start, end):
+            entry = old_buckets.get_at_index(index)
+            if entry is not None:
+                if not entry.is_tombstone and self._place_entry(
+                        self._buckets, self._capacity, entry) is not None:
+                    self._tombstones -= 1
+                old_buckets.set_at_index(index, _MIGRATED)
+        self._migrate_index = end
+
+        if end == self._old_capacity:
+            self._old_buckets = None
+            self._old_capacity = 0
+
+    def _finish_migration(self) -> None:
+        """Complete any incremental resize in progress."""
+        if self._old_buckets is not None:
+            self._migrate(self._old_capacity)
 
     def table_load(self) -> float:
         """
@@ -212,7 +484,25 @@ class HashMap:
 
         :return:    integer representation of the number of empty buckets
         """
-        return self._capacity - self._size
+        self._finish_migration()
+        return self._capacity - self._size - self._tombstones
+
+    def tombstone_count(self) -> int:
+        """
+        Returns the number of tombstones in the HashMap.
+
+        :return:    integer count of removed entries still occupying slots
+        """
+        return self._tombstones
+
+    def occupied_load(self) -> float:
+        """
+        Return the fraction of slots that are not empty, counting tombstones.
+        This, not table_load(), is what determines probe lengths for misses.
+
+        :return:    float representation of the occupied load factor
+        """
+        return (self._size + self._tombstones) / self._capacity
 
     def get(self, key: str) -> object:
         """
@@ -223,28 +513,11 @@ class HashMap:
         :return:        object representation of the matching value,
                         or None if not present
         """
-        # Identify where value should be
-        initial_index = self._hash_function(str(key)) % self._capacity
-
-        # Perform quadratic probing
-        index = initial_index
-        entry = self._buckets.get_at_index(index)
-        j = 0
-        while j < self._capacity:
-            # Match not found
-            if entry is None:
-                return None
-
-            # Match found
-            elif entry.key == key and not entry.is_tombstone:
-                return entry.value
+        entry = self._find_entry(key, self._hash_function(str(key)))
+        if entry is None:
+            return None
 
-            # Continue probing
-            j += 1
-            index = (initial_index + (j ** 2)) % self._capacity
-            entry = self._buckets.get_at_index(index)
-
-        return None
+        return entry.value
 
     def contains_key(self, key: str) -> bool:
         """
@@ -254,28 +527,8 @@ class HashMap:
         :return:        Boolean logic describing whether the specified key
                         is in the HashMap (True) or not (False)
         """
-        # Identify where value should be
-        initial_index = self._hash_function(str(key)) % self._capacity
-
-        # Perform quadratic probing
-        index = initial_index
-        entry = self._buckets.get_at_index(index)
-        j = 0
-        while j < self._capacity:
-            # Match not found
-            if entry is None:
-                return False
-
-            # Match found
-            elif entry.key == key and not entry.is_tombstone:
-                return True
-
-            # Continue probing
-            j += 1
-            index = (initial_index + (j ** 2)) % self._capacity
-            entry = self._buckets.get_at_index(index)
-
-        return False
+        entry = self._find_entry(key, self._hash_function(str(key)))
+        return entry is not None
 
     def remove(self, key: str) -> None:
         """
@@ -283,27 +536,69 @@ class HashMap:
 
         :param key:     string type key that we seek to remove
         """
-        initial_index = self._hash_function(str(key)) % self._capacity
+        hash = self._hash_function(str(key))
+        if self._old_buckets is not None:
+            self._migrate(self.MIGRATE_SLOTS)
 
-        # Perform quadratic probing
-        index = initial_index
-        entry = self._buckets.get_at_index(index)
-        j = 0
-        while j < self._capacity:
-            # Match not found
-            if entry is None:
-                return
+        self._remove_hashed(key, hash)
+        self._shrink_if_needed()
 
-            # Match found
-            elif entry.key == key and not entry.is_tombstone:
+    def _remove_hashed(self, key: str, hash: int,
+                       default: object = None) -> object:
+        """
+        Removes a key whose full hash is already known, if it exists.
+
+        :param key:     key to be removed
+        :param hash:    full (unreduced) hash of the key
+        :param default: value returned if the key is absent
+        :return:        value of the removed key, or default
+        """
+        entry = self._probe(self._buckets, self._capacity, key, hash)
+        if entry is not None:
+            entry.is_tombstone = True
+            self._size -= 1
+            self._tombstones += 1
+            self._compact_if_needed()
+            return entry.value
+
+        # Entries left in the old table are dropped when it is migrated
+        if self._old_buckets is not None:
+            entry = self._probe(self._old_buckets, self._old_capacity,
+                                key, hash)
+            if entry is not None:
                 entry.is_tombstone = True
                 self._size -= 1
-                return
+                return entry.value
 
-            # Continue probing
-            j += 1
-            index = (initial_index + (j ** 2)) % self._capacity
-            entry = self._buckets.get_at_index(index)
+        return default
+
+    def _compact_if_needed(self) -> None:
+        """
+        Rehash at the current capacity once tombstones exceed the configured
+        fraction of slots, so probe sequences shrink back.
+        """
+        if (self._tombstone_limit is not None
+                and self._old_buckets is None
+                and self._tombstones > self._tombstone_limit * self._capacity):
+            self._rehash(self._capacity)
+
+    def _shrink_if_needed(self) -> None:
+        """
+        Shrink the table once removals take the load factor below the
+        policy's shrink threshold (incrementally in incremental mode).
+        """
+        if not self._policy.should_shrink(self._size, self._capacity):
+            return
+
+        new_capacity = self._round_capacity(
+            self._policy.shrunk_capacity(self._size))
+        if new_capacity >= self._capacity:
+            return
+
+        if self._incremental:
+            self._start_migration(new_capacity)
+        else:
+            self.resize_table(new_capacity)
 
     def get_keys_and_values(self) -> DynamicArray:
         """
@@ -312,6 +607,7 @@ class HashMap:
 
         :return:    DynamicArray containing all key-value pairs in HashMap
         """
+        self._finish_migration()
         output_array = DynamicArray()
 
         # Iterate over all buckets in HashMap
@@ -330,6 +626,9 @@ class HashMap:
         for _ in range(self._capacity):
             self._buckets.append(None)
         self._size = 0
+        self._tombstones = 0
+        self._old_buckets = None
+        self._old_capacity = 0
 
     def __iter__(self) -> HashMapIterator:
         """
@@ -337,8 +636,273 @@ class HashMap:
 
         :return     DynamicArray to iterate over
         """
+        self._finish_migration()
         return HashMapIterator(self._buckets)
 
+    # -------------------- Single-pass updates --------------------------- #
+
+    def pop(self, key: str, default: object = None) -> object:
+        """
+        Removes the specified key and returns its value, hashing the key
+        once and locating it once.
+
+        :param key:     string type key that we seek to remove
+        :param default: value returned if the key is not present
+        :return:        value of the removed key, or default
+        """
+        hash = self._hash_function(str(key))
+        if self._old_buckets is not None:
+            self._migrate(self.MIGRATE_SLOTS)
+        value = self._remove_hashed(key, hash, default)
+        self._shrink_if_needed()
+        return value
+
+    def setdefault(self, key: str, default: object = None) -> object:
+        """
+        Returns the value of the specified key, first adding the key with
+        the default value if it is not present.
+
+        :param key:     string type key to look up or add
+        :param default: value stored if the key is not present
+        :return:        value associated with the key
+        """
+        self._make_room()
+        return self._find_or_insert(key, self._hash_function(str(key)),
+                                    default).value
+
+    def update(self, key: str, function: callable,
+               default: object = None) -> object:
+        """
+        Replaces the value of the specified key with function(value), where
+        a missing key starts from the default value. The key is hashed and
+        located only once.
+
+        :param key:         string type key whose value is updated
+        :param function:    callable mapping the current value to the new one
+        :param default:     value passed to function if the key is not present
+        :return:            new value associated with the key
+        """
+        self._make_room()
+        item = self._find_or_insert(key, self._hash_function(str(key)),
+                                    default)
+        item.value = function(item.value)
+        return item.value
+
+    def increment(self, key: str, amount: int = 1) -> int:
+        """
+        Adds amount to the value of the specified key, which counts as 0 if
+        the key is not present.
+
+        :param key:     string type key whose count is incremented
+        :param amount:  number added to the count
+        :return:        new count associated with the key
+        """
+        self._make_room()
+        item = self._find_or_insert(key, self._hash_function(str(key)), 0)
+        item.value += amount
+        return item.value
+
+    # ---------------------- Batch operations ---------------------------- #
+
+    def put_many(self, pairs) -> None:
+        """
+        Adds or updates every (key, value) pair. All keys are hashed in a
+        single pass. The table grows at the same load factor as with put(),
+        but then straight to a capacity that fits every pair still to come:
+        a batch of new keys causes a single resize (or, in an incremental
+        map, a single migration), and a batch of updates grows the table
+        only where put() would.
+
+        :param pairs:   iterable or DynamicArray of (key, value) tuples
+        """
+        pairs = as_list(pairs)
+        if not pairs:
+            return
+
+        hashes = self._hash_function.hash_many([str(key) for key, _ in pairs])
+
+        remaining = len(pairs)
+        for (key, value), hash in zip(pairs, hashes):
+            self._make_room(remaining)
+            remaining -= 1
+            self._find_or_insert(key, hash, value).value = value
+
+    def get_many(self, keys) -> DynamicArray:
+        """
+        Looks up every key, hashing them all in a single pass.
+
+        :param keys:    iterable or DynamicArray of keys
+        :return:        DynamicArray of values, None where a key is missing
+        """
+        keys = as_list(keys)
+        hashes = self._hash_function.hash_many([str(key) for key in keys])
+
+        values = []
+        for key, hash in zip(keys, hashes):
+            entry = self._find_entry(key, hash)
+            values.append(entry.value if entry is not None else None)
+        return DynamicArray(values)
+
+    def contains_many(self, keys) -> DynamicArray:
+        """
+        Checks every key for membership, hashing them all in a single pass.
+
+        :param keys:    iterable or DynamicArray of keys
+        :return:        DynamicArray of booleans, one per key
+        """
+        keys = as_list(keys)
+        hashes = self._hash_function.hash_many([str(key) for key in keys])
+
+        found = []
+        for key, hash in zip(keys, hashes):
+            found.append(self._find_entry(key, hash) is not None)
+        return DynamicArray(found)
+
+    def remove_many(self, keys) -> None:
+        """
+        Removes every key that is present, hashing them all in a single pass.
+
+        :param keys:    iterable or DynamicArray of keys
+        """
+        keys = as_list(keys)
+        hashes = self._hash_function.hash_many([str(key) for key in keys])
+        for key, hash in zip(keys, hashes):
+            if self._old_buckets is not None:
+                self._migrate(self.MIGRATE_SLOTS)
+            self._remove_hashed(key, hash)
+        self._shrink_if_needed()
+
+    def increment_many(self, keys, amount: int = 1) -> DynamicArray:
+        """
+        Adds amount to the count of every key (a key seen several times is
+        incremented each time), hashing them all in a single pass. Missing
+        keys count as 0.
+
+        :param keys:    iterable or DynamicArray of keys
+        :param amount:  number added per occurrence
+        :return:        DynamicArray of the count of each key right after
+                        its increment
+        """
+        keys = as_list(keys)
+        hashes = self._hash_function.hash_many([str(key) for key in keys])
+
+        counts = []
+        for key, hash in zip(keys, hashes):
+            self._make_room()
+            item = self._find_or_insert(key, hash, 0)
+            item.value += amount
+            counts.append(item.value)
+        return DynamicArray(counts)
+
+    def merge(self, other, function: callable = None) -> None:
+        """
+        Adds every key/value pair of another map, or of an iterable or
+        DynamicArray of (key, value) tuples, hashing the keys in a single
+        pass. Keys already present get function(current, incoming), or the
+        incoming value if function is None.
+
+        :param other:       map with get_keys_and_values(), or pairs
+        :param function:    callable combining the current and incoming
+                            values of a key present in both
+        """
+        pairs = as_list(other.get_keys_and_values()
+                        if hasattr(other, 'get_keys_and_values') else other)
+        if not pairs:
+            return
+
+        hashes = self._hash_function.hash_many([str(key) for key, _ in pairs])
+        remaining = len(pairs)
+        for (key, value), hash in zip(pairs, hashes):
+            self._make_room(remaining)
+            remaining -= 1
+            item = self._find_or_insert(key, hash, _ABSENT)
+            if item.value is _ABSENT or function is None:
+                item.value = value
+            else:
+                item.value = function(item.value, value)
+
+
+class InstrumentedHashMap(HashMap):
+    """
+    HashMap that records statistics about its own operations: the number
+    of slots probed by every lookup, insert and removal, hits and misses,
+    resizes with their durations, and tombstone compactions. Takes the same
+    arguments as HashMap. Probes are counted inside HashMap's own probe
+    loops, which only check once per search whether a counter is set, so
+    the plain HashMap pays next to nothing for them.
+    """
+
+    __slots__ = ('_stats', '_probes')
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the map, then start with empty statistics."""
+        self._stats = MapStats()
+        self._probes = [0]
+        super().__init__(*args, **kwargs)
+
+    def statistics(self) -> dict:
+        """
+        Return a snapshot of the statistics recorded so far (see
+        MapStats.snapshot), with the map's current size, capacity, load
+        factor and tombstone count.
+
+        :return:    dict of counters, histograms and gauges
+        """
+        return self._stats.snapshot(size=self._size,
+                                    capacity=self._capacity,
+                                    load=self.table_load(),
+                                    tombstones=self._tombstones)
+
+    def reset_statistics(self) -> None:
+        """Forget all recorded statistics."""
+        self._stats.reset()
+
+    def _find_entry(self, key: str, hash: int) -> HashEntry:
+        """Find an entry as HashMap does, recording the slots probed."""
+        self._probes[0] = 0
+        entry = super()._find_entry(key, hash)
+        self._stats.record_lookup(self._probes[0], entry is not None)
+        return entry
+
+    def _find_or_insert(self, key: str, hash: int,
+                        value: object) -> HashEntry:
+        """Find or add an entry as HashMap does, recording the slots probed."""
+        self._probes[0] = 0
+        size = self._size
+        entry = super()._find_or_insert(key, hash, value)
+        self._stats.record_lookup(self._probes[0], self._size == size)
+        return entry
+
+    def _remove_hashed(self, key: str, hash: int,
+                       default: object = None) -> object:
+        """Remove a key as HashMap does, recording the slots probed."""
+        self._probes[0] = 0
+        size = self._size
+        value = super()._remove_hashed(key, hash, default)
+        self._stats.record_lookup(self._probes[0], self._size != size)
+        return value
+
+    def _rehash(self, new_capacity: int) -> None:
+        """Rehash as HashMap does, recording the resize and its duration."""
+        old_capacity = self._capacity
+        start = self._stats.clock()
+        super()._rehash(new_capacity)
+        self._stats.record_resize(old_capacity, new_capacity,
+                                  self._stats.clock() - start)
+
+    def _start_migration(self, new_capacity: int) -> None:
+        """
+        Start an incremental resize as HashMap does, recording it. Only the
+        setup is timed; the migration itself is spread over later operations.
+        """
+        self._finish_migration()
+        old_capacity = self._capacity
+        start = self._stats.clock()
+        super()._start_migration(new_capacity)
+        self._stats.record_resize(old_capacity, self._capacity,
+                                  self._stats.clock() - start)
+
+
 # ------------------- BASIC TESTING ---------------------------------------- #
 
 
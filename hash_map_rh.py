@@ -0,0 +1,334 @@
+# Course: CS261 - Data Structures
+# Assignment: 6 - HashMap Implementation
+# Description: Implementation of a HashMap using Open Addressing with linear
+#              probing and Robin Hood displacement: an entry being inserted
+#              takes the slot of any entry that is closer to its own home
+#              slot, which keeps probe lengths short and even at loads up to
+#              0.9. An insert that carries an entry too far from its home
+#              slot grows the table as well, which bounds probe lengths.
+#              Removal shifts the following entries back instead of
+#              leaving tombstones. Same public API as hash_map_oa.HashMap.
+
+from a6_include import (DynamicArray, HashEntry,
+                        hash_function_1, hash_function_2)
+from hash_engine import HashEngine
+from hash_map_oa import HashMapIterator
+from primes import next_prime
+
+
+class RobinHoodHashMap:
+    __slots__ = ('_buckets', '_capacity', '_hash_function', '_size',
+                 '_max_load')
+
+    # An insert that leaves an entry more than PROBE_LIMIT * log2(capacity)
+    # slots from its home slot grows the table, unless the load is already
+    # below MIN_PROBE_GROWTH_LOAD: keys with identical hashes stay in one
+    # cluster at any capacity, and growing for them would never end
+    PROBE_LIMIT = 2
+    MIN_PROBE_GROWTH_LOAD = 0.25
+
+    def __init__(self, capacity: int, function,
+                 max_load: float = 0.9) -> None:
+        """
+        Initialize new HashMap that uses linear probing with
+        Robin Hood displacement for collision resolution.
+
+        :param capacity:    initial capacity, rounded up to a prime
+        :param function:    hash function applied to str(key); its values
+                            are scrambled with fold_hash, so functions
+                            whose values cluster (hash_function_1) still
+                            spread over the whole table
+        :param max_load:    load factor above which the table grows,
+                            strictly between 0 and 1
+        """
+        if not 0 < max_load < 1:
+            raise ValueError("max_load must be between 0 and 1")
+
+        # capacity must be a prime number
+        self._capacity = next_prime(capacity)
+        self._buckets = DynamicArray([None] * self._capacity)
+
+        self._hash_function = HashEngine(function, mix=True)
+        self._size = 0
+        self._max_load = max_load
+
+    def __str__(self) -> str:
+        """Override string method to provide more readable output."""
+        out = ''
+        for i in range(self._buckets.length()):
+            out += str(i) + ': ' + str(self._buckets[i]) + '\n'
+        return out
+
+    def get_size(self) -> int:
+        """Return size of map."""
+        return self._size
+
+    def get_capacity(self) -> int:
+        """Return capacity of map."""
+        return self._capacity
+
+    # ------------------------------------------------------------------ #
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Updates specified key/value pair in the HashMap. If the key/value pair
+        doesn't exist, it is added to the HashMap.
+
+        :param key:     string representation of a key to be added or updated
+        :param value:   object representation of a value, corresponding to the
+                        specified key, to be added or updated
+        """
+        # Check load factor and resize if needed
+        if (self._size + 1) / self._capacity > self._max_load:
+            self.resize_table(2 * self._capacity)
+
+        hash = self._hash_function(str(key))
+        capacity = self._capacity
+        index = hash % capacity
+        distance = 0
+
+        # Walk the cluster until the key is found, or an entry closer to its
+        # home slot proves the key absent (Robin Hood invariant)
+        entry = self._buckets.get_at_index(index)
+        while entry is not None:
+            entry_distance = (index - entry.hash) % capacity
+            if entry_distance < distance:
+                break
+
+            # Match found
+            if entry.hash == hash and entry.key == key:
+                entry.value = value
+                return
+
+            index = (index + 1) % capacity
+            distance += 1
+            entry = self._buckets.get_at_index(index)
+
+        longest = self._insert_from(HashEntry(key, value, hash), index,
+                                    distance)
+        self._size += 1
+
+        # Grow when displacement gets too long for the capacity
+        if longest > self.PROBE_LIMIT * capacity.bit_length() and \
+                self.table_load() >= self.MIN_PROBE_GROWTH_LOAD:
+            self.resize_table(2 * capacity)
+
+    def _insert_from(self, carried: HashEntry, index: int,
+                     distance: int) -> int:
+        """
+        Place an entry whose key is known to be absent, starting at the given
+        slot and probe distance. Richer entries are displaced and carried
+        forward until an empty slot is reached.
+
+        :param carried:     HashEntry to place
+        :param index:       slot at which to start
+        :param distance:    probe distance of that slot from carried's home
+        :return:            longest probe distance of any entry placed
+        """
+        capacity = self._capacity
+        buckets = self._buckets
+        longest = 0
+        entry = buckets.get_at_index(index)
+        while entry is not None:
+            entry_distance = (index - entry.hash) % capacity
+            if entry_distance < distance:
+                buckets.set_at_index(index, carried)
+                longest = max(longest, distance)
+                carried, distance = entry, entry_distance
+
+            index = (index + 1) % capacity
+            distance += 1
+            entry = buckets.get_at_index(index)
+
+        buckets.set_at_index(index, carried)
+        return max(longest, distance)
+
+    def _find_index(self, key: str) -> int:
+        """
+        Return the slot holding the given key, or -1 if not present.
+
+        :param key:     key to search for
+        :return:        slot index, or -1
+        """
+        hash = self._hash_function(str(key))
+        capacity = self._capacity
+        index = hash % capacity
+        distance = 0
+
+        entry = self._buckets.get_at_index(index)
+        while entry is not None:
+            if entry.hash == hash and entry.key == key:
+                return index
+
+            # Any match would have displaced this entry
+            if (index - entry.hash) % capacity < distance:
+                return -1
+
+            index = (index + 1) % capacity
+            distance += 1
+            entry = self._buckets.get_at_index(index)
+
+        return -1
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Changes the capacity of the underlying DynamicArray to the next prime
+        number at or above new_capacity, growing it further if needed to
+        stay within the maximum load factor, and rehashes all entries.
+
+        :param new_capacity:    integer describing new DynamicArray size
+        """
+        # Validate new_capacity
+        if new_capacity < self._size:
+            return
+
+        new_capacity = next_prime(new_capacity)
+        while self._size / new_capacity > self._max_load:
+            new_capacity = next_prime(2 * new_capacity)
+
+        old_buckets = self._buckets
+        old_capacity = self._capacity
+        self._buckets = DynamicArray([None] * new_capacity)
+        self._capacity = new_capacity
+
+        # Reinsert existing entries using their stored hashes
+        for index in range(old_capacity):
+            entry = old_buckets.get_at_index(index)
+            if entry is not None:
+                self._insert_from(entry, entry.hash % new_capacity, 0)
+
+    def table_load(self) -> float:
+        """
+        Return the current hash table load factor.
+
+        :return:    float representation of the current load factor
+        """
+        return self._size / self._capacity
+
+    def empty_buckets(self) -> int:
+        """
+        Returns the number of empty buckets in the HashMap.
+        There are no tombstones, so every unused slot is empty.
+
+        :return:    integer representation of the number of empty buckets
+        """
+        return self._capacity - self._size
+
+    def max_probe_length(self) -> int:
+        """
+        Return the longest distance of any entry from its home slot.
+
+        :return:    integer maximum probe distance
+        """
+        longest = 0
+        for index in range(self._capacity):
+            entry = self._buckets.get_at_index(index)
+            if entry is not None:
+                longest = max(longest, (index - entry.hash) % self._capacity)
+        return longest
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value associated with the specified key, or None
+        if the key is not contained in the HashMap.
+
+        :param key:     string type key whose value we seek to retrieve
+        :return:        object representation of the matching value,
+                        or None if not present
+        """
+        index = self._find_index(key)
+        if index == -1:
+            return None
+
+        return self._buckets.get_at_index(index).value
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Uses Boolean logic to express whether a specified key is present.
+
+        :param key:     string type key who we are inquiring about
+        :return:        Boolean logic describing whether the specified key
+                        is in the HashMap (True) or not (False)
+        """
+        return self._find_index(key) != -1
+
+    def remove(self, key: str) -> None:
+        """
+        Removes the specified key-value pair from HashMap, if they exist.
+        Following entries of the cluster are shifted back one slot until an
+        empty slot or an entry already in its home slot is reached.
+
+        :param key:     string type key that we seek to remove
+        """
+        index = self._find_index(key)
+        if index == -1:
+            return
+
+        capacity = self._capacity
+        buckets = self._buckets
+        next_index = (index + 1) % capacity
+        entry = buckets.get_at_index(next_index)
+        while entry is not None and (next_index - entry.hash) % capacity > 0:
+            buckets.set_at_index(index, entry)
+            index = next_index
+            next_index = (index + 1) % capacity
+            entry = buckets.get_at_index(next_index)
+
+        buckets.set_at_index(index, None)
+        self._size -= 1
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Extracts all key-value pairs from the HashMap and stores them
+        in a DynamicArray (in no particular order).
+
+        :return:    DynamicArray containing all key-value pairs in HashMap
+        """
+        output_array = DynamicArray()
+
+        for index in range(self._capacity):
+            entry = self._buckets.get_at_index(index)
+            if entry is not None:
+                output_array.append((entry.key, entry.value))
+
+        return output_array
+
+    def clear(self) -> None:
+        """
+        Clears the contents of the HashMap, while maintaining the same capacity.
+        """
+        self._buckets = DynamicArray([None] * self._capacity)
+        self._size = 0
+
+    def __iter__(self) -> HashMapIterator:
+        """
+        Iterator for the HashMap
+
+        :return     iterator over the HashEntry objects
+        """
+        return HashMapIterator(self._buckets)
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+
+if __name__ == "__main__":
+    print("\nRobin Hood - put example")
+    print("------------------------")
+    m = RobinHoodHashMap(53, hash_function_1)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+        if i % 25 == 24:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(),
+                  m.get_capacity(), m.max_probe_length())
+
+    print("\nRobin Hood - remove example")
+    print("---------------------------")
+    m = RobinHoodHashMap(11, hash_function_2)
+    for i in range(1, 6):
+        m.put(str(i), str(i * 10))
+    m.remove('1')
+    m.remove('4')
+    print(m)
+    for item in m:
+        print('K:', item.key, 'V:', item.value)
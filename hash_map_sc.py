@@ -11,29 +11,88 @@
 #              contains a standalone function, find_mode, for determining mode.
 
 
-from a6_include import (DynamicArray, LinkedList,
-                        hash_function_1, hash_function_2)
+from a6_include import (DynamicArray, LinkedList, SLNode, SortedBucket,
+                        as_list, hash_function_1, hash_function_2)
+from hash_engine import HashEngine
+from map_stats import MapStats
+from primes import is_prime, next_prime
+from resize_policy import ResizePolicy
+
+# Placeholder value of a node merge() has just added
+_ABSENT = object()
 
 
 class HashMap:
+    __slots__ = ('_buckets', '_capacity', '_hash_function', '_size',
+                 '_incremental', '_old_buckets', '_old_capacity',
+                 '_migrate_index', '_fill_index',
+                 '_node_pool', '_node_pool_limit', '_power_of_two',
+                 '_policy', '_treeify')
+
+    # Old buckets moved to the new table per operation in incremental mode
+    MIGRATE_BUCKETS = 8
+
+    # With treeify, chains longer than this become SortedBuckets, and
+    # SortedBuckets that shrink to UNTREEIFY_THRESHOLD become chains again
+    TREEIFY_THRESHOLD = 8
+    UNTREEIFY_THRESHOLD = 6
+
+    # Node visit counter ([count]) that bucket walks add to; only
+    # InstrumentedHashMap sets one, so plain maps skip the counting
+    _probes = None
+
     def __init__(self,
                  capacity: int = 11,
-                 function: callable = hash_function_1) -> None:
+                 function: callable = hash_function_1,
+                 incremental_resize: bool = False,
+                 node_pool: int = 0,
+                 expected_size: int = 0,
+                 power_of_two: bool = False,
+                 policy: ResizePolicy = None,
+                 treeify: bool = False) -> None:
         """
         Initialize new HashMap that uses
-        separate chaining for collision resolution
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        separate chaining for collision resolution.
+        Keys are hashed through a HashEngine, which reproduces the values
+        of the given hash function and caches recently seen keys.
+        With incremental_resize, growing the table migrates a few buckets
+        per operation instead of rehashing everything inside one put().
+        node_pool is the number of removed or cleared SLNodes kept for
+        reuse by later inserts (0 disables pooling).
+        expected_size raises the initial capacity so that this many keys
+        can be added without any resize (see reserve()).
+        With power_of_two, capacities are powers of two instead of primes:
+        hashes are scrambled with fold_hash and reduced with a bit mask.
+        With treeify, long chains are converted to SortedBuckets, which find
+        keys by binary search, and back to chains when they shrink.
         """
+        self._power_of_two = power_of_two
+        self._treeify = treeify
+        self._policy = policy if policy is not None \
+            else ResizePolicy(grow_at=1)
         self._buckets = DynamicArray()
 
-        # capacity must be a prime number
-        self._capacity = self._next_prime(capacity)
+        # capacity must be a prime number (or a power of two)
+        capacity = max(capacity, self._policy.capacity_for(expected_size))
+        self._capacity = self._round_capacity(capacity) if power_of_two \
+            else self._next_prime(capacity)
         for _ in range(self._capacity):
             self._buckets.append(LinkedList())
 
-        self._hash_function = function
+        self._hash_function = HashEngine(function, mix=power_of_two)
         self._size = 0
 
+        # Incremental resize state; _old_buckets is None unless migrating
+        self._incremental = incremental_resize
+        self._old_buckets = None
+        self._old_capacity = 0
+        self._migrate_index = 0
+        self._fill_index = 0
+
+        # Free list of unlinked nodes, reused by _find_or_insert
+        self._node_pool = []
+        self._node_pool_limit = node_pool
+
     def __str__(self) -> str:
         """
         Override string method to provide more readable output
@@ -46,36 +105,37 @@ class HashMap:
 
     def _next_prime(self, capacity: int) -> int:
         """
-        Increment from given number and the find the closest prime number
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        Return the closest prime number at or above the given number
+        (see primes.next_prime)
         """
-        if capacity % 2 == 0:
-            capacity += 1
-
-        while not self._is_prime(capacity):
-            capacity += 2
-
-        return capacity
+        return next_prime(capacity)
 
     @staticmethod
     def _is_prime(capacity: int) -> bool:
         """
         Determine if given integer is a prime number and return boolean
-        DO NOT CHANGE THIS METHOD IN ANY WAY
+        (see primes.is_prime)
         """
-        if capacity == 2 or capacity == 3:
-            return True
+        return is_prime(capacity)
 
-        if capacity == 1 or capacity % 2 == 0:
-            return False
+    def _round_capacity(self, capacity: int) -> int:
+        """
+        Return the capacity the table actually uses for a requested one:
+        the given number if prime, else the next prime, or in power_of_two
+        mode the next power of two.
+        """
+        if self._power_of_two:
+            return 1 << (max(capacity, 1) - 1).bit_length()
 
-        factor = 3
-        while factor ** 2 <= capacity:
-            if capacity % factor == 0:
-                return False
-            factor += 2
+        if not self._is_prime(capacity):
+            capacity = self._next_prime(capacity)
+        return capacity
 
-        return True
+    def _index(self, hash: int, capacity: int) -> int:
+        """Return the bucket index of a full hash in a table of capacity."""
+        if self._power_of_two:
+            return hash & (capacity - 1)
+        return hash % capacity
 
     def get_size(self) -> int:
         """
@@ -102,23 +162,68 @@ class HashMap:
         :param value:   object representation of a value, corresponding to the
                         specified key, to be added or updated
         """
+        self._make_room()
+        self._find_or_insert(key, self._hash_function(str(key)),
+                             value).value = value
+
+    def _make_room(self, pending: int = 1) -> None:
+        """
+        Advance any incremental resize and grow the table if the load factor
+        calls for it. Called before every operation that may add a key.
+
+        :param pending:     number of keys the caller may still add; a
+                            growth makes room for all of them at once
+        """
+        if self._old_buckets is not None:
+            self._migrate(self.MIGRATE_BUCKETS)
+
         # Check load factor and resize if needed
-        if self.table_load() >= 1:
-            self.resize_table(2 * self._capacity)
+        if self.table_load() >= self._policy.grow_at:
+            capacity = max(self._policy.grown_capacity(self._capacity),
+                           self._policy.capacity_for(self._size + pending))
+            if self._incremental:
+                self._start_migration(capacity)
+            else:
+                self.resize_table(capacity)
+
+    def _find_or_insert(self, key: str, hash: int, value: object) -> SLNode:
+        """
+        Returns the node holding key, first adding one with the given value
+        if the key is absent, in a single walk of the key's bucket.
 
-        # Calculate index from hash function
-        index = self._hash_function(str(key)) % self._capacity
-        bucket = self._buckets.get_at_index(index)
+        :param key:     key to find or add
+        :param hash:    full (unreduced) hash of the key
+        :param value:   value of the node added for an absent key
+        :return:        SLNode holding the key
+        """
+        bucket = self._bucket_for(hash)
 
-        # Modify key-value pair in existing bucket
-        node = bucket.contains(key)
-        if node:
-            node.value = value
+        # Existing key-value pair in bucket
+        node = bucket.contains(key, hash, self._probes)
+        if node is not None:
+            return node
 
         # If key not found, add key to HashMap via LinkedList
+        if self._node_pool:
+            node = self._node_pool.pop()
+            node.key = key
+            node.value = value
+            node.hash = hash
         else:
-            bucket.insert(key, value)
-            self._size += 1
+            node = SLNode(key, value, None, hash)
+        bucket.insert_node(node)
+        self._size += 1
+
+        if self._treeify and type(bucket) is LinkedList \
+                and bucket.length() > self.TREEIFY_THRESHOLD:
+            self._replace_bucket(hash, SortedBucket(bucket))
+        return node
+
+    def _recycle(self, node: SLNode) -> None:
+        """Return an unlinked node to the pool, if the pool has room."""
+        if len(self._node_pool) < self._node_pool_limit:
+            node.key = node.value = node.next = None
+            self._node_pool.append(node)
 
     def resize_table(self, new_capacity: int) -> None:
         """
@@ -131,29 +236,163 @@ class HashMap:
         if new_capacity < 1:
             return
 
-        if not self._is_prime(new_capacity):
-            new_capacity = self._next_prime(new_capacity)
+        self._finish_migration()
+
+        new_capacity = self._round_capacity(new_capacity)
+
+        # Grow the target the same way put() would while reinserting
+        while self._size > 0 and \
+                (self._size - 1) / new_capacity >= self._policy.grow_at:
+            new_capacity = self._round_capacity(
+                self._policy.grown_capacity(new_capacity))
+
+        self._rehash(new_capacity)
+
+    def reserve(self, count: int) -> None:
+        """
+        Grows the table, with a single rehash, so that it can hold count
+        keys in total without resizing again. Never shrinks the table.
+
+        :param count:   total number of keys the map should hold
+        """
+        capacity = self._policy.capacity_for(count)
+        if self._capacity < capacity:
+            self.resize_table(capacity)
 
+    def _rehash(self, new_capacity: int) -> None:
+        """
+        Moves every node into a new DynamicArray of the given capacity.
+        Existing SLNode objects are relinked using their stored hashes, so
+        no keys are hashed, compared or reallocated.
+
+        :param new_capacity:    integer describing new DynamicArray size
+        """
         # Create new DynamicArray
-        new_buckets = DynamicArray()
-        for _ in range(new_capacity):
-            new_buckets.append(LinkedList())
+        new_buckets = DynamicArray([LinkedList() for _ in range(new_capacity)])
 
-        # Store old values and create new ones
+        # Relink old nodes into new DynamicArray
         old_buckets = self._buckets
-        old_capacity = self._capacity
+        for index in range(self._capacity):
+            # Iterator advances before the node is relinked
+            for node in old_buckets.get_at_index(index):
+                bucket = new_buckets.get_at_index(
+                    self._index(node.hash, new_capacity))
+                bucket.insert_node(node)
+
+        if self._treeify:
+            for index in range(new_capacity):
+                self._treeify_at(new_buckets, index)
+
         self._buckets = new_buckets
         self._capacity = new_capacity
-        self._size = 0
 
-        # Rehash old keys and insert into new DynamicArray
-        for index in range(old_capacity):
-            old_bucket = old_buckets.get_at_index(index)
-            # Use iterator to traverse LinkedList
-            for node in old_bucket:
-                current_key = node.key
-                current_value = node.value
-                self.put(current_key, current_value)
+    def _bucket_for(self, hash: int) -> LinkedList:
+        """
+        Return the bucket that holds, or would hold, a key with given hash.
+        While migrating, keys whose old bucket has not been moved yet still
+        live in the old table; everything else lives in the new one.
+
+        :param hash:    full (unreduced) hash of the key
+        :return:        LinkedList bucket for the key
+        """
+        if self._old_buckets is None:
+            return self._buckets.get_at_index(
+                self._index(hash, self._capacity))
+
+        old_index = self._index(hash, self._old_capacity)
+        if old_index >= self._migrate_index:
+            return self._old_buckets.get_at_index(old_index)
+        return self._new_bucket(self._index(hash, self._capacity))
+
+    def _find_node(self, key: str, hash: int) -> SLNode:
+        """
+        Return the node holding key, or None, after advancing any
+        incremental resize by one step.
+        """
+        if self._old_buckets is not None:
+            self._migrate(self.MIGRATE_BUCKETS)
+        return self._bucket_for(hash).contains(key, hash, self._probes)
+
+    def _replace_bucket(self, hash: int, bucket) -> None:
+        """
+        Store a new bucket where _bucket_for(hash) found the current one.
+
+        :param hash:    full (unreduced) hash of a key in the bucket
+        :param bucket:  LinkedList or SortedBucket holding the same nodes
+        """
+        if self._old_buckets is not None:
+            old_index = self._index(hash, self._old_capacity)
+            if old_index >= self._migrate_index:
+                self._old_buckets.set_at_index(old_index, bucket)
+                return
+
+        self._buckets.set_at_index(self._index(hash, self._capacity), bucket)
+
+    def _treeify_at(self, buckets: DynamicArray, index: int) -> None:
+        """Convert the chain at index to a SortedBucket if it is too long."""
+        bucket = buckets.get_at_index(index)
+        if type(bucket) is LinkedList \
+                and bucket.length() > self.TREEIFY_THRESHOLD:
+            buckets.set_at_index(index, SortedBucket(bucket))
+
+    def _new_bucket(self, index: int) -> LinkedList:
+        """Return bucket of the new table, creating it if not filled yet."""
+        bucket = self._buckets.get_at_index(index)
+        if bucket is None:
+            bucket = LinkedList()
+            self._buckets.set_at_index(index, bucket)
+        return bucket
+
+    def _start_migration(self, new_capacity: int) -> None:
+        """
+        Begin an incremental resize: install an unfilled DynamicArray of the
+        new (prime) capacity and keep the old one until it has been moved.
+
+        :param new_capacity:    integer describing new DynamicArray size
+        """
+        self._finish_migration()
+        new_capacity = self._round_capacity(new_capacity)
+
+        self._old_buckets = self._buckets
+        self._old_capacity = self._capacity
+        self._buckets = DynamicArray([None] * new_capacity)
+        self._capacity = new_capacity
+        self._migrate_index = 0
+        self._fill_index = 0
+
+    def _migrate(self, count: int) -> None:
+        """
+        Move the next `count` old buckets into the new table, and create the
+        new table's empty buckets at a matching rate, so both finish together.
+
+        :param count:   number of old buckets to move
+        """
+        old_buckets = self._old_buckets
+        start = self._migrate_index
+        end = min(start + count, self._old_capacity)
+
+        for index in range(start, end):
+            for node in old_buckets.get_at_index(index):
+                new_index = self._index(node.hash, self._capacity)
+                self._new_bucket(new_index).insert_node(node)
+                if self._treeify:
+                    self._treeify_at(self._buckets, new_index)
+            old_buckets.set_at_index(index, None)
+        self._migrate_index = end
+
+        fill_end = end * self._capacity // self._old_capacity
+        for index in range(self._fill_index, fill_end):
+            self._new_bucket(index)
+        self._fill_index = fill_end
+
+        if end == self._old_capacity:
+            self._old_buckets = None
+            self._old_capacity = 0
+
+    def _finish_migration(self) -> None:
+        """Complete any incremental resize in progress."""
+        if self._old_buckets is not None:
+            self._migrate(self._old_capacity)
 
     def table_load(self) -> float:
         """
@@ -172,6 +411,7 @@ class HashMap:
 
         :return:    integer representation of the number of empty buckets
         """
+        self._finish_migration()
         count = 0
         for index in range(self._capacity):
             current_bucket = self._buckets.get_at_index(index)
@@ -189,12 +429,7 @@ class HashMap:
         :return:        object representation of the matching value,
                         or None if not present
         """
-        # Identify where value should be
-        index = self._hash_function(str(key)) % self._capacity
-        bucket = self._buckets.get_at_index(index)
-
-        # Iterate over bucket to find value
-        node = bucket.contains(key)
+        node = self._find_node(key, self._hash_function(str(key)))
         if not node:
             return None
 
@@ -208,12 +443,7 @@ class HashMap:
         :return:        Boolean logic describing whether the specified key
                         is in the HashMap (True) or not (False)
         """
-        # Identify where value should be
-        index = self._hash_function(str(key)) % self._capacity
-        bucket = self._buckets.get_at_index(index)
-
-        # Iterate over bucket to find value
-        node = bucket.contains(key)
+        node = self._find_node(key, self._hash_function(str(key)))
         if not node:
             return False
 
@@ -225,16 +455,57 @@ class HashMap:
 
         :param key:     string type key that we seek to remove
         """
-        index = self._hash_function(str(key)) % self._capacity
-        bucket = self._buckets.get_at_index(index)
+        hash = self._hash_function(str(key))
+        if self._old_buckets is not None:
+            self._migrate(self.MIGRATE_BUCKETS)
+        self._remove_hashed(key, hash)
+        self._shrink_if_needed()
+
+    def _remove_hashed(self, key: str, hash: int,
+                       default: object = None) -> object:
+        """
+        Removes a key whose full hash is already known, if it exists.
 
-        # Exit if node doesn't exist
-        if not bucket.contains(key):
-            return
+        :param key:     key to be removed
+        :param hash:    full (unreduced) hash of the key
+        :param default: value returned if the key is absent
+        :return:        value of the removed key, or default
+        """
+        # Unlink node if it exists
+        bucket = self._bucket_for(hash)
+        node = bucket.remove_node(key, hash, self._probes)
+        if node is None:
+            return default
 
-        # Remove node if it exists
-        bucket.remove(key)
+        value = node.value
         self._size -= 1
+        if type(bucket) is SortedBucket \
+                and bucket.length() <= self.UNTREEIFY_THRESHOLD:
+            chain = LinkedList()
+            for remaining in bucket:
+                chain.insert_node(remaining)
+            self._replace_bucket(hash, chain)
+        if self._node_pool_limit:
+            self._recycle(node)
+        return value
+
+    def _shrink_if_needed(self) -> None:
+        """
+        Shrink the table once removals take the load factor below the
+        policy's shrink threshold (incrementally in incremental mode).
+        """
+        if not self._policy.should_shrink(self._size, self._capacity):
+            return
+
+        new_capacity = self._round_capacity(
+            self._policy.shrunk_capacity(self._size))
+        if new_capacity >= self._capacity:
+            return
+
+        if self._incremental:
+            self._start_migration(new_capacity)
+        else:
+            self.resize_table(new_capacity)
 
     def get_keys_and_values(self) -> DynamicArray:
         """
@@ -243,6 +514,7 @@ class HashMap:
 
         :return:    DynamicArray containing all key-value pairs in HashMap
         """
+        self._finish_migration()
         output_array = DynamicArray()
 
         # Iterate over all buckets in HashMap
@@ -258,10 +530,283 @@ class HashMap:
         """
         Clears the contents of the HashMap, while maintaining the same capacity.
         """
+        if self._node_pool_limit:
+            self._finish_migration()
+            for index in range(self._capacity):
+                for node in self._buckets.get_at_index(index):
+                    if len(self._node_pool) >= self._node_pool_limit:
+                        break
+                    self._recycle(node)
+
         self._buckets = DynamicArray()
         for _ in range(self._capacity):
             self._buckets.append(LinkedList())
         self._size = 0
+        self._old_buckets = None
+        self._old_capacity = 0
+
+    # -------------------- Single-pass updates --------------------------- #
+
+    def pop(self, key: str, default: object = None) -> object:
+        """
+        Removes the specified key and returns its value, hashing the key
+        once and locating it once.
+
+        :param key:     string type key that we seek to remove
+        :param default: value returned if the key is not present
+        :return:        value of the removed key, or default
+        """
+        hash = self._hash_function(str(key))
+        if self._old_buckets is not None:
+            self._migrate(self.MIGRATE_BUCKETS)
+        value = self._remove_hashed(key, hash, default)
+        self._shrink_if_needed()
+        return value
+
+    def setdefault(self, key: str, default: object = None) -> object:
+        """
+        Returns the value of the specified key, first adding the key with
+        the default value if it is not present.
+
+        :param key:     string type key to look up or add
+        :param default: value stored if the key is not present
+        :return:        value associated with the key
+        """
+        self._make_room()
+        return self._find_or_insert(key, self._hash_function(str(key)),
+                                    default).value
+
+    def update(self, key: str, function: callable,
+               default: object = None) -> object:
+        """
+        Replaces the value of the specified key with function(value), where
+        a missing key starts from the default value. The key is hashed and
+        located only once.
+
+        :param key:         string type key whose value is updated
+        :param function:    callable mapping the current value to the new one
+        :param default:     value passed to function if the key is not present
+        :return:            new value associated with the key
+        """
+        self._make_room()
+        item = self._find_or_insert(key, self._hash_function(str(key)),
+                                    default)
+        item.value = function(item.value)
+        return item.value
+
+    def increment(self, key: str, amount: int = 1) -> int:
+        """
+        Adds amount to the value of the specified key, which counts as 0 if
+        the key is not present.
+
+        :param key:     string type key whose count is incremented
+        :param amount:  number added to the count
+        :return:        new count associated with the key
+        """
+        self._make_room()
+        item = self._find_or_insert(key, self._hash_function(str(key)), 0)
+        item.value += amount
+        return item.value
+
+    # ---------------------- Batch operations ---------------------------- #
+
+    def put_many(self, pairs) -> None:
+        """
+        Adds or updates every (key, value) pair. All keys are hashed in a
+        single pass. The table grows at the same load factor as with put(),
+        but then straight to a capacity that fits every pair still to come:
+        a batch of new keys causes a single resize (or, in an incremental
+        map, a single migration), and a batch of updates grows the table
+        only where put() would.
+
+        :param pairs:   iterable or DynamicArray of (key, value) tuples
+        """
+        pairs = as_list(pairs)
+        if not pairs:
+            return
+
+        hashes = self._hash_function.hash_many([str(key) for key, _ in pairs])
+
+        remaining = len(pairs)
+        for (key, value), hash in zip(pairs, hashes):
+            self._make_room(remaining)
+            remaining -= 1
+            self._find_or_insert(key, hash, value).value = value
+
+    def get_many(self, keys) -> DynamicArray:
+        """
+        Looks up every key, hashing them all in a single pass.
+
+        :param keys:    iterable or DynamicArray of keys
+        :return:        DynamicArray of values, None where a key is missing
+        """
+        keys = as_list(keys)
+        hashes = self._hash_function.hash_many([str(key) for key in keys])
+
+        values = []
+        for key, hash in zip(keys, hashes):
+            node = self._find_node(key, hash)
+            values.append(node.value if node else None)
+        return DynamicArray(values)
+
+    def contains_many(self, keys) -> DynamicArray:
+        """
+        Checks every key for membership, hashing them all in a single pass.
+
+        :param keys:    iterable or DynamicArray of keys
+        :return:        DynamicArray of booleans, one per key
+        """
+        keys = as_list(keys)
+        hashes = self._hash_function.hash_many([str(key) for key in keys])
+
+        found = []
+        for key, hash in zip(keys, hashes):
+            found.append(self._find_node(key, hash) is not None)
+        return DynamicArray(found)
+
+    def remove_many(self, keys) -> None:
+        """
+        Removes every key that is present, hashing them all in a single pass.
+
+        :param keys:    iterable or DynamicArray of keys
+        """
+        keys = as_list(keys)
+        hashes = self._hash_function.hash_many([str(key) for key in keys])
+        for key, hash in zip(keys, hashes):
+            if self._old_buckets is not None:
+                self._migrate(self.MIGRATE_BUCKETS)
+            self._remove_hashed(key, hash)
+        self._shrink_if_needed()
+
+    def increment_many(self, keys, amount: int = 1) -> DynamicArray:
+        """
+        Adds amount to the count of every key (a key seen several times is
+        incremented each time), hashing them all in a single pass. Missing
+        keys count as 0.
+
+        :param keys:    iterable or DynamicArray of keys
+        :param amount:  number added per occurrence
+        :return:        DynamicArray of the count of each key right after
+                        its increment
+        """
+        keys = as_list(keys)
+        hashes = self._hash_function.hash_many([str(key) for key in keys])
+
+        counts = []
+        for key, hash in zip(keys, hashes):
+            self._make_room()
+            item = self._find_or_insert(key, hash, 0)
+            item.value += amount
+            counts.append(item.value)
+        return DynamicArray(counts)
+
+    def merge(self, other, function: callable = None) -> None:
+        """
+        Adds every key/value pair of another map, or of an iterable or
+        DynamicArray of (key, value) tuples, hashing the keys in a single
+        pass. Keys already present get function(current, incoming), or the
+        incoming value if function is None.
+
+        :param other:       map with get_keys_and_values(), or pairs
+        :param function:    callable combining the current and incoming
+                            values of a key present in both
+        """
+        pairs = as_list(other.get_keys_and_values()
+                        if hasattr(other, 'get_keys_and_values') else other)
+        if not pairs:
+            return
+
+        hashes = self._hash_function.hash_many([str(key) for key, _ in pairs])
+        remaining = len(pairs)
+        for (key, value), hash in zip(pairs, hashes):
+            self._make_room(remaining)
+            remaining -= 1
+            item = self._find_or_insert(key, hash, _ABSENT)
+            if item.value is _ABSENT or function is None:
+                item.value = value
+            else:
+                item.value = function(item.value, value)
+
+
+class InstrumentedHashMap(HashMap):
+    """
+    HashMap that records statistics about its own operations: the number
+    of chain nodes visited by every lookup, insert and removal, hits and
+    misses, and resizes with their durations. Takes the same arguments as
+    HashMap. Nodes are counted inside the buckets' own searches (a
+    treeified bucket counts its binary search comparisons), which only
+    check once per search whether a counter is set, so the plain HashMap
+    pays next to nothing for them.
+    """
+
+    __slots__ = ('_stats', '_probes')
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the map, then start with empty statistics."""
+        self._stats = MapStats()
+        self._probes = [0]
+        super().__init__(*args, **kwargs)
+
+    def statistics(self) -> dict:
+        """
+        Return a snapshot of the statistics recorded so far (see
+        MapStats.snapshot), with the map's current size, capacity and load
+        factor.
+
+        :return:    dict of counters, histograms and gauges
+        """
+        return self._stats.snapshot(size=self._size,
+                                    capacity=self._capacity,
+                                    load=self.table_load())
+
+    def reset_statistics(self) -> None:
+        """Forget all recorded statistics."""
+        self._stats.reset()
+
+    def _find_node(self, key: str, hash: int) -> SLNode:
+        """Find a node as HashMap does, recording the nodes visited."""
+        self._probes[0] = 0
+        node = super()._find_node(key, hash)
+        self._stats.record_lookup(self._probes[0], node is not None)
+        return node
+
+    def _find_or_insert(self, key: str, hash: int, value: object) -> SLNode:
+        """Find or add a node as HashMap does, recording the nodes visited."""
+        self._probes[0] = 0
+        size = self._size
+        node = super()._find_or_insert(key, hash, value)
+        self._stats.record_lookup(self._probes[0], self._size == size)
+        return node
+
+    def _remove_hashed(self, key: str, hash: int,
+                       default: object = None) -> object:
+        """Remove a key as HashMap does, recording the nodes visited."""
+        self._probes[0] = 0
+        size = self._size
+        value = super()._remove_hashed(key, hash, default)
+        self._stats.record_lookup(self._probes[0], self._size != size)
+        return value
+
+    def _rehash(self, new_capacity: int) -> None:
+        """Rehash as HashMap does, recording the resize and its duration."""
+        old_capacity = self._capacity
+        start = self._stats.clock()
+        super()._rehash(new_capacity)
+        self._stats.record_resize(old_capacity, new_capacity,
+                                  self._stats.clock() - start)
+
+    def _start_migration(self, new_capacity: int) -> None:
+        """
+        Start an incremental resize as HashMap does, recording it. Only the
+        setup is timed; the migration itself is spread over later operations.
+        """
+        self._finish_migration()
+        old_capacity = self._capacity
+        start = self._stats.clock()
+        super()._start_migration(new_capacity)
+        self._stats.record_resize(old_capacity, self._capacity,
+                                  self._stats.clock() - start)
+
 
 def find_mode(da: DynamicArray) -> tuple[DynamicArray, int]:
     """
@@ -282,15 +827,8 @@ def find_mode(da: DynamicArray) -> tuple[DynamicArray, int]:
     # Store frequencies of values in DynamicArray into HashMap
     for index in range(da.length()):
         key = da.get_at_index(index)
-        frequency = map.get(key)
-        # Increment frequency of existing key
-        if frequency:
-            frequency += 1
-            map.put(key, frequency)
-        # Add new key to HashMap
-        else:
-            frequency = 1
-            map.put(key, frequency)
+        # Count key with a single hash and bucket walk
+        frequency = map.increment(key)
 
         # Extract highest frequency value and store key
         if frequency > max_frequency:
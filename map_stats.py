@@ -0,0 +1,96 @@
+# Course: CS261 - Data Structures
+# Assignment: 6 - HashMap Implementation
+# Description: Statistics collected by the InstrumentedHashMap variants of
+#              both HashMaps: a histogram of lookup lengths (slots probed by
+#              open addressing, nodes walked by separate chaining), hit and
+#              miss counts, and the count and duration of every resize.
+#              The plain HashMap classes never touch this module, so maps
+#              created without instrumentation pay nothing for it.
+
+import time
+
+
+class MapStats:
+    """
+    Counters for one instrumented map. Lookup lengths are kept as a
+    histogram (length -> number of lookups) so memory stays bounded no
+    matter how many operations are recorded.
+    """
+
+    __slots__ = ('lengths', 'hits', 'misses', 'resizes', 'durations',
+                 'compactions', 'clock')
+
+    def __init__(self, clock: callable = time.perf_counter) -> None:
+        """
+        Initialize empty statistics.
+
+        :param clock:   zero-argument callable returning seconds, used to
+                        time resizes
+        """
+        self.clock = clock
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        self.lengths = {}
+        self.hits = 0
+        self.misses = 0
+        self.resizes = []
+        self.durations = {}
+        self.compactions = 0
+
+    def record_lookup(self, length: int, found: bool) -> None:
+        """
+        Record one operation that searched for a key.
+
+        :param length:  slots probed or chain nodes visited
+        :param found:   whether the key was present
+        """
+        self.lengths[length] = self.lengths.get(length, 0) + 1
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def record_resize(self, old_capacity: int, new_capacity: int,
+                      seconds: float) -> None:
+        """
+        Record a rehash. A rehash to the same capacity only reclaims
+        tombstones and is counted as a compaction instead.
+        """
+        if old_capacity == new_capacity:
+            self.compactions += 1
+            return
+        self.resizes.append((old_capacity, new_capacity, seconds))
+
+        # Bucketed by the power of ten of microseconds above the duration,
+        # so key 1000 counts resizes that took 100 to 999 microseconds
+        bucket = 10 ** len(str(int(seconds * 1e6)))
+        self.durations[bucket] = self.durations.get(bucket, 0) + 1
+
+    def snapshot(self, **gauges) -> dict:
+        """
+        Return a copy of the statistics as plain data.
+
+        :param gauges:  current values of the map (size, capacity, ...)
+                        merged into the result
+        :return:        dict of counters, histograms and gauges
+        """
+        lookups = self.hits + self.misses
+        total = sum(length * count for length, count in self.lengths.items())
+        snapshot = {
+            'lookups': lookups,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+            'length_histogram': dict(sorted(self.lengths.items())),
+            'mean_length': total / lookups if lookups else 0.0,
+            'max_length': max(self.lengths, default=0),
+            'resizes': len(self.resizes),
+            'resize_history': list(self.resizes),
+            'resize_total_seconds': sum(entry[2] for entry in self.resizes),
+            'resize_us_histogram': dict(sorted(self.durations.items())),
+            'compactions': self.compactions,
+        }
+        snapshot.update(gauges)
+        return snapshot
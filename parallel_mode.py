@@ -0,0 +1,205 @@
+# Course: CS261 - Data Structures
+# Assignment: 6 - HashMap Implementation
+# Description: Parallel find_mode over a process pool. The input (a
+#              DynamicArray or a file with one key per line) is split into
+#              contiguous slices; each worker counts its slice in a
+#              Separate Chaining HashMap and hash-partitions the distinct
+#              keys. A second round of workers merges each partition from
+#              every slice with HashMap.merge and reports that partition's
+#              mode candidates. The result, including the order of tied
+#              modes, is the same as hash_map_sc.find_mode.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from a6_include import (DynamicArray, as_list, hash_function_1,
+                        make_fnv_function)
+from hash_map_sc import HashMap, find_mode
+
+# Slices per worker, so a slow slice does not hold up the whole pool
+SLICES_PER_WORKER = 4
+
+# Inputs shorter than this are counted in the calling process
+MIN_PARALLEL_ITEMS = 100_000
+
+# Keys are partitioned with a fixed-seed hash: it must give the same value
+# in every worker process, which the built-in hash() does not guarantee
+_partition_hash = make_fnv_function(0x5EED)
+
+
+# ----------------------- WORKERS ------------------------------------------ #
+
+def _count(keys: list, positions: list, function: callable,
+           partitions: int) -> list:
+    """
+    Count one slice of the input.
+
+    :param keys:        keys of the slice, in input order
+    :param positions:   position of each key in the whole input
+    :param function:    hash function of the counting HashMap
+    :param partitions:  number of key partitions
+    :return:            list with one list per partition of
+                        (key, (count, last position)) tuples
+    """
+    counts = HashMap(11, function)
+    counts.increment_many(keys)
+
+    # Later positions overwrite earlier ones, leaving the last occurrence
+    last = HashMap(11, function)
+    last.put_many(zip(keys, positions))
+
+    pairs = as_list(counts.get_keys_and_values())
+    positions = as_list(last.get_many([key for key, _ in pairs]))
+    parts = [[] for _ in range(partitions)]
+    for (key, count), position in zip(pairs, positions):
+        parts[_partition_hash(str(key)) % partitions].append(
+            (key, (count, position)))
+    return parts
+
+
+def _count_items(items: list, start: int, function: callable,
+                 partitions: int) -> list:
+    """Count a slice of a DynamicArray that begins at index start."""
+    return _count(items, range(start, start + len(items)), function,
+                  partitions)
+
+
+def _count_file_range(path: str, start: int, end: int, slice_number: int,
+                      function: callable, partitions: int) -> list:
+    """
+    Count the lines of a file that begin within bytes [start, end).
+    Positions are (slice_number, line in slice), which sort in file order.
+    """
+    keys = []
+    with open(path, 'rb') as file:
+        # A line straddling start belongs to the previous range
+        if start > 0:
+            file.seek(start - 1)
+            file.readline()
+
+        while file.tell() < end:
+            line = file.readline()
+            if not line:
+                break
+            keys.append(line.rstrip(b'\r\n').decode('utf-8'))
+
+    positions = [(slice_number, index) for index in range(len(keys))]
+    return _count(keys, positions, function, partitions)
+
+
+def _combine(current: tuple, incoming: tuple) -> tuple:
+    """Add two (count, last position) values of the same key."""
+    return current[0] + incoming[0], max(current[1], incoming[1])
+
+
+def _reduce_partition(parts: list, function: callable) -> tuple:
+    """
+    Merge one partition from every slice and find its mode candidates.
+
+    :param parts:       lists of (key, (count, last position)) tuples
+    :param function:    hash function of the merging HashMap
+    :return:            (highest count, list of (last position, key) for
+                        the keys with that count)
+    """
+    totals = HashMap(11, function)
+    for part in parts:
+        totals.merge(part, _combine)
+
+    max_frequency = 0
+    candidates = []
+    for key, (count, position) in as_list(totals.get_keys_and_values()):
+        if count > max_frequency:
+            max_frequency = count
+            candidates = [(position, key)]
+        elif count == max_frequency:
+            candidates.append((position, key))
+    return max_frequency, candidates
+
+
+# ----------------------- DRIVER ------------------------------------------- #
+
+def _file_ranges(path: str, count: int) -> list:
+    """Split a file into count byte ranges of about equal size."""
+    size = os.path.getsize(path)
+    bounds = [size * index // count for index in range(count + 1)]
+    return [(bounds[index], bounds[index + 1]) for index in range(count)
+            if bounds[index] < bounds[index + 1]]
+
+
+def parallel_find_mode(source, workers: int = None,
+                       function: callable = hash_function_1,
+                       executor: ProcessPoolExecutor = None) -> tuple:
+    """
+    Calculates the mode(s) and their frequency like find_mode, counting
+    in parallel worker processes.
+
+    :param source:      DynamicArray of keys, or path of a text file with
+                        one key per line
+    :param workers:     number of processes (None: one per CPU)
+    :param function:    hash function of the counting HashMaps; must be a
+                        module-level function so it can be sent to workers
+    :param executor:    existing ProcessPoolExecutor to run on, instead of
+                        starting and stopping one per call
+    :return:            tuple of the modes (DynamicArray) and their
+                        frequency (integer), in that order
+    """
+    workers = workers or os.cpu_count() or 1
+    is_file = isinstance(source, str)
+
+    # Small inputs are not worth the process start-up and pickling
+    if not is_file and (workers == 1 or source.length() == 0
+                        or source.length() < MIN_PARALLEL_ITEMS):
+        return find_mode(source)
+
+    slices = workers * SLICES_PER_WORKER
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+
+    try:
+        # Count slices, each split into one part per partition
+        if is_file:
+            futures = [executor.submit(_count_file_range, source, start, end,
+                                       number, function, workers)
+                       for number, (start, end)
+                       in enumerate(_file_ranges(source, slices))]
+        else:
+            items = as_list(source)
+            step = -(-len(items) // slices)
+            futures = [executor.submit(_count_items, items[start:start + step],
+                                       start, function, workers)
+                       for start in range(0, len(items), step)]
+        counted = [future.result() for future in futures]
+
+        # Merge every partition across slices
+        futures = [executor.submit(_reduce_partition,
+                                   [parts[partition] for parts in counted],
+                                   function)
+                   for partition in range(workers)]
+        results = [future.result() for future in futures]
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+    max_frequency = max((frequency for frequency, _ in results), default=0)
+    candidates = sorted(candidate for frequency, partition in results
+                        if frequency == max_frequency
+                        for candidate in partition)
+
+    # find_mode lists tied modes in the order they reached the frequency,
+    # which is the order of their last occurrence
+    return DynamicArray([key for _, key in candidates]), max_frequency
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+
+if __name__ == "__main__":
+    print("\nparallel_find_mode - example")
+    print("----------------------------")
+    da = DynamicArray(['key' + str(i % 5000) if i % 3 else 'hot' + str(i % 2)
+                       for i in range(300000)])
+    modes, frequency = parallel_find_mode(da, workers=4)
+    expected = find_mode(da)
+    print(modes, frequency, str(modes) == str(expected[0])
+          and frequency == expected[1])
@@ -0,0 +1,93 @@
+# Course: CS261 - Data Structures
+# Assignment: 6 - HashMap Implementation
+# Description: Prime capacities shared by every HashMap. next_prime keeps the
+#              exact results of the original HashMap._next_prime (smallest odd
+#              prime at or above the request), but answers the usual doubling
+#              resizes from a precomputed table and tests anything else with
+#              a deterministic Miller-Rabin instead of trial division.
+
+# Each prime is the smallest odd prime at or above twice the previous one,
+# starting from the default capacity of 11: the capacities a map visits as
+# put() keeps doubling it
+PRIME_CAPACITIES = (
+    11, 23, 47, 97, 197, 397, 797, 1597, 3203, 6421, 12853, 25717, 51437,
+    102877, 205759, 411527, 823117, 1646237, 3292489, 6584983, 13169977,
+    26339969, 52679969, 105359939, 210719881, 421439783, 842879579,
+    1685759167, 3371518343, 6743036717, 13486073473, 26972146961, 53944293929,
+    107888587883, 215777175787, 431554351609, 863108703229, 1726217406467,
+    3452434812973, 6904869625999, 13809739252051, 27619478504183,
+    55238957008387, 110477914016779, 220955828033581, 441911656067171,
+    883823312134381, 1767646624268779, 3535293248537579, 7070586497075177,
+    14141172994150357, 28282345988300791, 56564691976601587,
+    113129383953203213, 226258767906406483, 452517535812813007,
+    905035071625626043, 1810070143251252131, 3620140286502504283,
+    7240280573005008577,
+)
+
+# next_prime(2 * p) for every p in the table, answered without any testing
+_DOUBLED = {2 * prime: following for prime, following
+            in zip(PRIME_CAPACITIES, PRIME_CAPACITIES[1:])}
+
+# Miller-Rabin with these bases is exact for every n < 3.3 * 10 ** 24
+_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def is_prime(number: int) -> bool:
+    """
+    Determine if given integer is a prime number and return boolean.
+
+    :param number:  integer to test
+    :return:        True if number is prime
+    """
+    if number < 2:
+        return False
+
+    for prime in _WITNESSES:
+        if number % prime == 0:
+            return number == prime
+
+    # No factor up to 37, so anything below 41 ** 2 is prime
+    if number < 41 * 41:
+        return True
+
+    # Write number - 1 as d * 2 ** s with d odd
+    d = number - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for witness in _WITNESSES:
+        x = pow(witness, d, number)
+        if x == 1 or x == number - 1:
+            continue
+
+        for _ in range(s - 1):
+            x = x * x % number
+            if x == number - 1:
+                break
+        else:
+            return False
+
+    return True
+
+
+def next_prime(capacity: int) -> int:
+    """
+    Return the smallest odd prime at or above capacity (3 for anything
+    up to 3, so 2 is never returned).
+
+    :param capacity:    requested capacity
+    :return:            prime capacity
+    """
+    doubled = _DOUBLED.get(capacity)
+    if doubled is not None:
+        return doubled
+
+    if capacity % 2 == 0:
+        capacity += 1
+
+    while not is_prime(capacity):
+        capacity += 2
+
+    return capacity
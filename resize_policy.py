@@ -0,0 +1,81 @@
+# Course: CS261 - Data Structures
+# Assignment: 6 - HashMap Implementation
+# Description: Load factor policy shared by both HashMaps. A ResizePolicy
+#              decides when a table grows, by how much, and whether (and how
+#              far) it shrinks again after removals.
+
+
+class ResizePolicy:
+    """
+    Thresholds that drive resizing of a HashMap.
+
+    The table grows by growth_factor once size / capacity reaches grow_at.
+    If shrink_at is set, it shrinks once size / capacity drops below
+    shrink_at, to a capacity where the load is back to
+    grow_at / growth_factor (the load just after a growth), but never below
+    min_capacity. shrink_at must stay below that post-growth load so a
+    resize in one direction never immediately triggers the other.
+    """
+
+    __slots__ = ('grow_at', 'shrink_at', 'growth_factor', 'min_capacity')
+
+    def __init__(self,
+                 grow_at: float = 1.0,
+                 shrink_at: float = None,
+                 growth_factor: float = 2,
+                 min_capacity: int = 11) -> None:
+        """
+        Initialize policy.
+
+        :param grow_at:         load factor at which put() grows the table
+        :param shrink_at:       load factor below which remove() shrinks the
+                                table (None disables shrinking)
+        :param growth_factor:   factor the capacity is multiplied by on growth
+        :param min_capacity:    capacity a shrink never goes below
+        """
+        if grow_at <= 0 or growth_factor <= 1:
+            raise ValueError("grow_at must be positive and growth_factor > 1")
+        if shrink_at is not None and \
+                not 0 <= shrink_at < grow_at / growth_factor:
+            raise ValueError("shrink_at must be below grow_at / growth_factor")
+
+        self.grow_at = grow_at
+        self.shrink_at = shrink_at
+        self.growth_factor = growth_factor
+        self.min_capacity = min_capacity
+
+    def __repr__(self) -> str:
+        """Return a constructor-like description of the policy."""
+        return (f"ResizePolicy(grow_at={self.grow_at}, "
+                f"shrink_at={self.shrink_at}, "
+                f"growth_factor={self.growth_factor}, "
+                f"min_capacity={self.min_capacity})")
+
+    def grown_capacity(self, capacity: int) -> int:
+        """
+        Return the capacity requested when a table of the given capacity
+        grows (before rounding up to a prime or power of two). Always
+        larger than capacity, however small the growth factor.
+        """
+        return max(capacity + 1, int(capacity * self.growth_factor))
+
+    def capacity_for(self, count: int) -> int:
+        """
+        Return the smallest capacity at which count keys can be added
+        without put() reaching the grow_at load factor.
+        """
+        return int((count - 1) // self.grow_at) + 1
+
+    def should_shrink(self, size: int, capacity: int) -> bool:
+        """Return True if a table with this size and capacity should shrink."""
+        return (self.shrink_at is not None
+                and capacity > self.min_capacity
+                and size < self.shrink_at * capacity)
+
+    def shrunk_capacity(self, size: int) -> int:
+        """
+        Return the capacity requested when a table holding size keys
+        shrinks (before rounding up to a prime or power of two).
+        """
+        return max(self.min_capacity,
+                   int(size * self.growth_factor / self.grow_at) + 1)
@@ -0,0 +1,427 @@
+# Course: CS261 - Data Structures
+# Assignment: 6 - HashMap Implementation
+# Description: Copy-on-write Separate Chaining HashMap for read-mostly maps.
+#              Every version of the table is an immutable MapSnapshot: its
+#              buckets hang off a persistent 32-way trie, and its chains are
+#              never modified once published. Readers use the current
+#              snapshot without taking any lock. Writers, serialized by one
+#              lock, build the next version by copying only the trie path
+#              and the chain prefix that lead to the changed key, share
+#              everything else with the previous version, and publish it
+#              with a single reference assignment.
+
+from threading import Lock
+
+from a6_include import (DynamicArray, LinkedList, SLNode, as_list,
+                        hash_function_1)
+from hash_engine import HashEngine
+from primes import next_prime
+from resize_policy import ResizePolicy
+
+# Children per trie node, as a power of two
+TRIE_BITS = 5
+TRIE_WIDTH = 1 << TRIE_BITS
+_TRIE_MASK = TRIE_WIDTH - 1
+
+
+# ----------------------- PERSISTENT STRUCTURES ---------------------------- #
+
+def _build_trie(buckets: list) -> tuple:
+    """
+    Build a trie over a list of buckets (None for an empty bucket).
+
+    :param buckets: buckets in index order
+    :return:        tuple of the root node and the shift of its level
+    """
+    level, shift = buckets, -TRIE_BITS
+    while True:
+        nodes = []
+        for start in range(0, max(len(level), 1), TRIE_WIDTH):
+            node = tuple(level[start:start + TRIE_WIDTH])
+            node += (None,) * (TRIE_WIDTH - len(node))
+
+            # Subtrees without any bucket are left out entirely
+            nodes.append(None if node.count(None) == TRIE_WIDTH else node)
+        level, shift = nodes, shift + TRIE_BITS
+        if len(level) == 1:
+            return level[0], shift
+
+
+def _assoc(node: tuple, index: int, shift: int, bucket) -> tuple:
+    """
+    Return a copy of a trie with the bucket at index replaced. Only the
+    nodes on the path to index are copied; all others are shared.
+    """
+    children = list(node) if node is not None else [None] * TRIE_WIDTH
+    slot = (index >> shift) & _TRIE_MASK
+    if shift == 0:
+        children[slot] = bucket
+    else:
+        children[slot] = _assoc(children[slot], index, shift - TRIE_BITS,
+                                bucket)
+    return tuple(children)
+
+
+def _chain_put(bucket: LinkedList, key: str, hash: int,
+               value: object) -> tuple:
+    """
+    Return a chain with key set to value, and whether the key is new. The
+    nodes before the key are copied and the rest of the old chain is
+    shared; a new key is linked in front of the whole old chain.
+    """
+    prefix = []
+    for node in bucket if bucket is not None else ():
+        if node.hash == hash and node.key == key:
+            head = SLNode(key, value, node.next, hash)
+            for copied in reversed(prefix):
+                head = SLNode(copied.key, copied.value, head, copied.hash)
+            return LinkedList.from_chain(head, bucket.length()), False
+        prefix.append(node)
+
+    head = prefix[0] if prefix else None
+    return LinkedList.from_chain(SLNode(key, value, head, hash),
+                                 len(prefix) + 1), True
+
+
+def _chain_remove(bucket: LinkedList, key: str, hash: int) -> tuple:
+    """
+    Return a chain without key (None if it becomes empty) and the removed
+    node, or the unchanged bucket and None if the key is absent.
+    """
+    prefix = []
+    for node in bucket if bucket is not None else ():
+        if node.hash == hash and node.key == key:
+            if bucket.length() == 1:
+                return None, node
+            head = node.next
+            for copied in reversed(prefix):
+                head = SLNode(copied.key, copied.value, head, copied.hash)
+            return LinkedList.from_chain(head, bucket.length() - 1), node
+        prefix.append(node)
+    return bucket, None
+
+
+class MapSnapshot:
+    """
+    Immutable version of a SnapshotHashMap. All methods only read, so a
+    snapshot can be used by any number of threads without locking, and it
+    keeps answering the same way however the map changes afterwards.
+    """
+
+    __slots__ = ('_root', '_shift', '_capacity', '_size', '_hash_function')
+
+    def __init__(self, root: tuple, shift: int, capacity: int, size: int,
+                 hash_function: HashEngine) -> None:
+        """
+        Initialize a snapshot over an existing trie.
+
+        :param root:            root node of the bucket trie
+        :param shift:           index shift of the root level
+        :param capacity:        number of buckets
+        :param size:            number of key/value pairs
+        :param hash_function:   HashEngine of the map
+        """
+        self._root = root
+        self._shift = shift
+        self._capacity = capacity
+        self._size = size
+        self._hash_function = hash_function
+
+    def _bucket(self, index: int) -> LinkedList:
+        """Return the bucket at index, or None if it is empty."""
+        node, shift = self._root, self._shift
+        while node is not None and shift >= 0:
+            node = node[(index >> shift) & _TRIE_MASK]
+            shift -= TRIE_BITS
+        return node
+
+    def _buckets(self, node: tuple = None, shift: int = None):
+        """Yield every non-empty bucket, in index order."""
+        if shift is None:
+            node, shift = self._root, self._shift
+        if node is None:
+            return
+        for child in node:
+            if child is None:
+                continue
+            if shift == 0:
+                yield child
+            else:
+                yield from self._buckets(child, shift - TRIE_BITS)
+
+    def _find(self, key: str) -> SLNode:
+        """Return the node of key, or None if it is not present."""
+        hash = self._hash_function(str(key))
+        bucket = self._bucket(hash % self._capacity)
+        return bucket.contains(key, hash) if bucket is not None else None
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value associated with key, or None if not present.
+
+        :param key:     string type key whose value we seek to retrieve
+        """
+        node = self._find(key)
+        return node.value if node is not None else None
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if key is present, False otherwise.
+
+        :param key:     string type key who we are inquiring about
+        """
+        return self._find(key) is not None
+
+    def get_size(self) -> int:
+        """Return the number of key/value pairs."""
+        return self._size
+
+    def get_capacity(self) -> int:
+        """Return the number of buckets."""
+        return self._capacity
+
+    def table_load(self) -> float:
+        """Return the load factor (pairs per bucket)."""
+        return self._size / self._capacity
+
+    def empty_buckets(self) -> int:
+        """Return the number of buckets without any pair."""
+        return self._capacity - sum(1 for _ in self._buckets())
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns all key/value pairs, in bucket order.
+
+        :return:    DynamicArray of (key, value) tuples
+        """
+        return DynamicArray([(node.key, node.value)
+                             for bucket in self._buckets()
+                             for node in bucket])
+
+
+# ----------------------- MAP ---------------------------------------------- #
+
+class SnapshotHashMap:
+    """
+    Separate Chaining HashMap whose readers never lock. Reads go to the
+    current MapSnapshot; snapshot() hands one out for a series of reads
+    that must all see the same version. Writes take the writer lock, build
+    a new snapshot sharing every untouched bucket, trie node and chain
+    tail with the previous one, and publish it atomically, so an update
+    costs memory in proportion to what it touches rather than to the whole
+    table. Growing the table still rebuilds every chain, as a resize does.
+    """
+
+    __slots__ = ('_current', '_lock', '_hash_function', '_policy')
+
+    def __init__(self,
+                 capacity: int = 11,
+                 function: callable = hash_function_1,
+                 policy: ResizePolicy = None) -> None:
+        """
+        Initialize an empty map.
+
+        :param capacity:    initial number of buckets (rounded to a prime)
+        :param function:    hash function
+        :param policy:      resize thresholds (default: grow at load 1,
+                            like hash_map_sc.HashMap)
+        """
+        self._policy = policy if policy is not None \
+            else ResizePolicy(grow_at=1)
+        self._hash_function = HashEngine(function)
+        self._lock = Lock()
+        self._current = self._rebuilt((), next_prime(capacity))
+
+    def _rebuilt(self, nodes, capacity: int) -> MapSnapshot:
+        """Return a snapshot holding copies of the given nodes."""
+        heads = [None] * capacity
+        lengths = [0] * capacity
+        for node in nodes:
+            index = node.hash % capacity
+            heads[index] = SLNode(node.key, node.value, heads[index],
+                                  node.hash)
+            lengths[index] += 1
+
+        buckets = [LinkedList.from_chain(head, length) if head else None
+                   for head, length in zip(heads, lengths)]
+        root, shift = _build_trie(buckets)
+        return MapSnapshot(root, shift, capacity, sum(lengths),
+                           self._hash_function)
+
+    def _nodes(self, snapshot: MapSnapshot):
+        """Yield every node of a snapshot."""
+        for bucket in snapshot._buckets():
+            yield from bucket
+
+    def snapshot(self) -> MapSnapshot:
+        """Return the current version, which never changes afterwards."""
+        return self._current
+
+    # ------------------------ Lock-free reads --------------------------- #
+
+    def get(self, key: str) -> object:
+        """
+        Returns the value associated with key, or None if not present.
+
+        :param key:     string type key whose value we seek to retrieve
+        """
+        return self._current.get(key)
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Returns True if key is present, False otherwise.
+
+        :param key:     string type key who we are inquiring about
+        """
+        return self._current.contains_key(key)
+
+    def get_size(self) -> int:
+        """Return the number of key/value pairs."""
+        return self._current.get_size()
+
+    def get_capacity(self) -> int:
+        """Return the number of buckets."""
+        return self._current.get_capacity()
+
+    def table_load(self) -> float:
+        """Return the load factor (pairs per bucket)."""
+        return self._current.table_load()
+
+    def empty_buckets(self) -> int:
+        """Return the number of buckets without any pair."""
+        return self._current.empty_buckets()
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns all key/value pairs of the current version.
+
+        :return:    DynamicArray of (key, value) tuples
+        """
+        return self._current.get_keys_and_values()
+
+    # ------------------------ Copy-on-write updates --------------------- #
+
+    def _put(self, snapshot: MapSnapshot, key: str,
+             value: object) -> MapSnapshot:
+        """Return the version after setting key in snapshot."""
+        hash = self._hash_function(str(key))
+        index = hash % snapshot._capacity
+        bucket, added = _chain_put(snapshot._bucket(index), key, hash, value)
+        snapshot = MapSnapshot(
+            _assoc(snapshot._root, index, snapshot._shift, bucket),
+            snapshot._shift, snapshot._capacity,
+            snapshot._size + added, self._hash_function)
+
+        if snapshot.table_load() >= self._policy.grow_at:
+            snapshot = self._rebuilt(
+                self._nodes(snapshot),
+                next_prime(self._policy.grown_capacity(snapshot._capacity)))
+        return snapshot
+
+    def _remove(self, snapshot: MapSnapshot, key: str) -> tuple:
+        """Return the version after removing key, and the removed node."""
+        hash = self._hash_function(str(key))
+        index = hash % snapshot._capacity
+        old_bucket = snapshot._bucket(index)
+        bucket, removed = _chain_remove(old_bucket, key, hash)
+        if removed is None:
+            return snapshot, None
+        return MapSnapshot(
+            _assoc(snapshot._root, index, snapshot._shift, bucket),
+            snapshot._shift, snapshot._capacity, snapshot._size - 1,
+            self._hash_function), removed
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Adds or updates a key/value pair and publishes the new version.
+
+        :param key:     string type key
+        :param value:   value associated with the key
+        """
+        with self._lock:
+            self._current = self._put(self._current, key, value)
+
+    def remove(self, key: str) -> None:
+        """
+        Removes key and its value, if present.
+
+        :param key:     string type key that we seek to remove
+        """
+        with self._lock:
+            self._current = self._remove(self._current, key)[0]
+
+    def pop(self, key: str, default: object = None) -> object:
+        """
+        Removes key and returns its value, or default if it is not present.
+
+        :param key:     string type key that we seek to remove
+        :param default: value returned if the key is not present
+        """
+        with self._lock:
+            self._current, removed = self._remove(self._current, key)
+        return removed.value if removed is not None else default
+
+    def put_many(self, pairs) -> None:
+        """
+        Adds or updates every (key, value) pair and publishes them as one
+        version, so readers see either none or all of the batch.
+
+        :param pairs:   iterable or DynamicArray of (key, value) tuples
+        """
+        with self._lock:
+            snapshot = self._current
+            for key, value in as_list(pairs):
+                snapshot = self._put(snapshot, key, value)
+            self._current = snapshot
+
+    def remove_many(self, keys) -> None:
+        """
+        Removes every key that is present, publishing one version.
+
+        :param keys:    iterable or DynamicArray of keys
+        """
+        with self._lock:
+            snapshot = self._current
+            for key in as_list(keys):
+                snapshot = self._remove(snapshot, key)[0]
+            self._current = snapshot
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Rebuilds the table with new_capacity buckets, rounded to a prime
+        and grown as put() would if the pairs do not fit.
+
+        :param new_capacity:    integer describing the new number of buckets
+        """
+        if new_capacity < 1:
+            return
+
+        with self._lock:
+            snapshot = self._current
+            grow_at = self._policy.grow_at
+            new_capacity = next_prime(new_capacity)
+            while snapshot._size > 0 and \
+                    (snapshot._size - 1) / new_capacity >= grow_at:
+                new_capacity = next_prime(
+                    self._policy.grown_capacity(new_capacity))
+            self._current = self._rebuilt(self._nodes(snapshot), new_capacity)
+
+    def clear(self) -> None:
+        """Publishes an empty version with the current capacity."""
+        with self._lock:
+            self._current = self._rebuilt((), self._current._capacity)
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+
+if __name__ == "__main__":
+    print("\nSnapshotHashMap - example")
+    print("-------------------------")
+    m = SnapshotHashMap()
+    m.put_many([('host', 'localhost'), ('port', 8080), ('debug', False)])
+    before = m.snapshot()
+    m.put('port', 9090)
+    m.remove('debug')
+    print(before.get('port'), before.get('debug'), before.get_size())
+    print(m.get('port'), m.get('debug'), m.get_size())
@@ -0,0 +1,42 @@
+import itertools
+import unittest
+from a6_include import *
+from hash_map_oa import HashMap
+
+
+class TestSeededHashFunctions(unittest.TestCase):
+    def test_siphash_reference_vectors(self):
+        # Key 00 01 .. 0f and messages 00 01 .. (n - 1), from the SipHash paper
+        k0 = int.from_bytes(bytes(range(8)), 'little')
+        k1 = int.from_bytes(bytes(range(8, 16)), 'little')
+        self.assertEqual(siphash(k0, k1, b''), 0x726fdb47dd0e0e31)
+        self.assertEqual(siphash(k0, k1, bytes(range(8))), 0x93f5f5799a932462)
+        self.assertEqual(siphash(k0, k1, bytes(range(15))), 0xa129ca6149be45e5)
+
+    def test_seeded_functions(self):
+        for make in (make_siphash_function, make_fnv_function):
+            function = make(261)
+            self.assertEqual(function('key'), make(261)('key'))
+            self.assertNotEqual(function('key'), make(262)('key'))
+            self.assertNotEqual(make()('key'), make()('key'))
+            self.assertLess(function('ñandú'), 1 << 64)
+            # Keys differing only in trailing zero bytes stay distinct
+            self.assertNotEqual(function('a'), function('a\x00'))
+
+    def test_permutations_do_not_collide(self):
+        keys = [''.join(p) for p in itertools.permutations('abcdef')]
+        self.assertEqual(len({hash_function_1(key) for key in keys}), 1)
+        for make in (make_siphash_function, make_fnv_function):
+            function = make(7)
+            self.assertEqual(len({function(key) for key in keys}), len(keys))
+
+    def test_usable_as_map_function(self):
+        m = HashMap(11, make_fnv_function(3))
+        for i in range(200):
+            m.put('str' + str(i), i)
+        self.assertEqual(m.get('str150'), 150)
+        self.assertEqual(m.get_size(), 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
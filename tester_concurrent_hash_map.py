@@ -0,0 +1,92 @@
+import unittest
+from threading import Thread
+import hash_map_oa
+from a6_include import hash_function_2
+from concurrent_hash_map import *
+
+
+class TestConcurrentHashMap(unittest.TestCase):
+    def test_basic_operations(self):
+        for map_class in (hash_map_sc.HashMap, hash_map_oa.HashMap):
+            m = ConcurrentHashMap(function=hash_function_1, shards=8,
+                                  map_class=map_class)
+            for i in range(300):
+                m.put('key' + str(i), i)
+            m.put('key7', 'seven')
+            self.assertEqual(m.get_size(), 300)
+            self.assertEqual(sum(m.shard_sizes()), 300)
+            self.assertEqual(m.get('key7'), 'seven')
+            self.assertIsNone(m.get('missing'))
+            self.assertTrue(m.contains_key('key299'))
+
+            m.remove('key299')
+            m.remove('missing')
+            self.assertFalse(m.contains_key('key299'))
+            self.assertEqual(m.pop('key298'), 298)
+            self.assertEqual(m.pop('key298', 'gone'), 'gone')
+            self.assertEqual(m.setdefault('new', 1), 1)
+            self.assertEqual(m.setdefault('new', 2), 1)
+            self.assertEqual(m.update('new', lambda value: value + 10), 11)
+            self.assertEqual(m.increment('count', 3), 3)
+            self.assertEqual(m.get_size(), 300)
+            self.assertEqual(
+                sorted(key for key, _ in as_list(m.get_keys_and_values())),
+                sorted(['key' + str(i) for i in range(298)]
+                       + ['new', 'count']))
+            self.assertLessEqual(m.table_load(), 1)
+
+            m.clear()
+            self.assertEqual(m.get_size(), 0)
+            self.assertEqual(m.empty_buckets(), m.get_capacity())
+
+    def test_shards(self):
+        self.assertEqual(ConcurrentHashMap(shards=10).get_shard_count(), 16)
+        self.assertEqual(ConcurrentHashMap(shards=1).get_shard_count(), 1)
+        with self.assertRaises(ValueError):
+            ConcurrentHashMap(shards=0)
+
+        # Keys spread over every shard, and each shard grows on its own
+        m = ConcurrentHashMap(64, shards=4, function=hash_function_2)
+        for i in range(2000):
+            m.put('key' + str(i), i)
+        sizes = m.shard_sizes()
+        self.assertTrue(all(size > 200 for size in sizes))
+        capacities = [shard.get_capacity() for shard in m._shards]
+        self.assertTrue(all(capacity >= size
+                            for capacity, size in zip(capacities, sizes)))
+
+    def test_batch_operations(self):
+        m = ConcurrentHashMap(shards=4)
+        m.put_many(DynamicArray([('k' + str(i), i) for i in range(100)]))
+        self.assertEqual(m.get_size(), 100)
+        self.assertEqual(as_list(m.get_many(['k5', 'x', 'k99'])),
+                         [5, None, 99])
+        m.remove_many(['k' + str(i) for i in range(50)] + ['x'])
+        self.assertEqual(m.get_size(), 50)
+        self.assertIsNone(m.get('k0'))
+        self.assertEqual(m.get('k50'), 50)
+
+    def test_threads(self):
+        m = ConcurrentHashMap(shards=8)
+
+        def work(thread: int) -> None:
+            for i in range(2000):
+                m.increment('count' + str(i % 50))
+                m.put('t' + str(thread) + '_' + str(i), i)
+                if i % 2:
+                    m.remove('t' + str(thread) + '_' + str(i - 1))
+
+        threads = [Thread(target=work, args=(thread,)) for thread in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # No increment or insert is lost
+        self.assertEqual([m.get('count' + str(i)) for i in range(50)],
+                         [160] * 50)
+        self.assertEqual(m.get_size(), 50 + 4 * 1000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import random
+import unittest
+from collections import Counter
+from hash_map_sc import find_mode
+from frequency_counter import *
+
+
+class TestFrequencyCounter(unittest.TestCase):
+    def test_mode_matches_find_mode(self):
+        rng = random.Random(261)
+        for _ in range(20):
+            values = [rng.randrange(30) for _ in range(rng.randrange(1, 300))]
+            expected_keys, expected_count = find_mode(DynamicArray(values))
+
+            counter = FrequencyCounter(chunk_size=7)
+            counter.update(value for value in values)
+            keys, count = counter.mode()
+            self.assertEqual(count, expected_count)
+            self.assertEqual(as_list(keys), as_list(expected_keys))
+            self.assertEqual(counter.total(), len(values))
+
+    def test_top_k(self):
+        rng = random.Random(7)
+        values = ['w' + str(int(rng.paretovariate(1.2))) for _ in range(5000)]
+        counter = FrequencyCounter(k=5, chunk_size=100)
+        counter.update(DynamicArray(values))
+
+        expected = Counter(values)
+        self.assertEqual(counter.distinct(), len(expected))
+        top = counter.top_k()
+        self.assertEqual(len(top), 5)
+        self.assertEqual([count for _, count in top],
+                         [count for _, count in expected.most_common(5)])
+        for key, count in top:
+            self.assertEqual(expected[key], count)
+        self.assertEqual(counter.top_k(2), top[:2])
+        self.assertEqual(counter.count('w1'), expected['w1'])
+        self.assertEqual(counter.count('absent'), 0)
+
+    def test_add(self):
+        counter = FrequencyCounter(k=2)
+        counter.add('a')
+        counter.add('b', 3)
+        self.assertEqual(counter.add('a', 2), 3)
+        keys, count = counter.mode()
+        self.assertEqual((as_list(keys), count), (['b', 'a'], 3))
+        self.assertEqual(sorted(counter.top_k()), [('a', 3), ('b', 3)])
+
+    def test_approximate_mode(self):
+        # Five heavy keys among many keys seen once
+        def stream():
+            for i in range(30000):
+                yield 'heavy' + str(i % 5) if i % 3 == 0 else 'light' + str(i)
+
+        counter = FrequencyCounter(k=5, chunk_size=1000, max_distinct=2000,
+                                   seed=261)
+        counter.update(stream())
+        self.assertTrue(counter.is_approximate())
+        self.assertIsNone(counter.distinct())
+        self.assertEqual(counter.total(), 30000)
+
+        top = counter.top_k()
+        self.assertEqual(sorted(key for key, _ in top),
+                         ['heavy' + str(i) for i in range(5)])
+        for _, count in top:
+            # Never below the true count, and within the error bound
+            self.assertGreaterEqual(count, 2000)
+            self.assertLessEqual(count, 2000 + 1e-4 * 30000)
+
+        keys, count = counter.mode()
+        self.assertGreaterEqual(count, 2000)
+        self.assertTrue(as_list(keys)[0].startswith('heavy'))
+        self.assertGreaterEqual(counter.count('light1'), 1)
+
+    def test_count_min_sketch(self):
+        sketch = CountMinSketch.from_error(0.01, 0.01, seed=1)
+        self.assertEqual((sketch.width, sketch.depth), (272, 5))
+        rng = random.Random(3)
+        values = [rng.randrange(2000) for _ in range(20000)]
+        for value in values:
+            sketch.add(value)
+
+        expected = Counter(values)
+        over = 0
+        for value, count in expected.items():
+            estimate = sketch.estimate(value)
+            self.assertGreaterEqual(estimate, count)
+            over += estimate - count > 0.01 * sketch.total
+        self.assertLessEqual(over, 0.01 * len(expected) + 5)
+
+        with self.assertRaises(ValueError):
+            CountMinSketch(0, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
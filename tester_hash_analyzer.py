@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+from hash_analyzer import *
+
+
+class TestHashAnalyzer(unittest.TestCase):
+    def test_load_keys(self):
+        self.assertEqual(load_keys(['b', 'a', 'b', 3]), ['b', 'a', '3'])
+        self.assertEqual(load_keys(range(10), limit=4), ['0', '1', '2', '3'])
+
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False,
+                                         encoding='utf-8') as file:
+            file.write('alpha\nbeta\nalpha\n')
+        try:
+            self.assertEqual(load_keys(file.name), ['alpha', 'beta'])
+        finally:
+            os.remove(file.name)
+
+    def test_chi_squared(self):
+        self.assertEqual(chi_squared([5, 5, 5, 5]), 0)
+        self.assertEqual(chi_squared([20, 0, 0, 0]), 60)
+        self.assertAlmostEqual(chi_squared_p_value(0, 10), 1, places=3)
+        self.assertLess(chi_squared_p_value(60, 3), 1e-6)
+        # The median of chi-squared is close to its degrees of freedom
+        self.assertAlmostEqual(chi_squared_p_value(999.3, 1000), 0.5,
+                               places=2)
+
+    def test_bucket_counts(self):
+        counts = bucket_counts(['ab', 'ba', 'c'], hash_function_1, 7)
+        self.assertEqual(sum(counts), 3)
+        self.assertEqual(counts[hash_function_1('ab') % 7], 2)
+
+    def test_expected_probes(self):
+        hit, miss = expected_probes(0.0)
+        self.assertEqual((hit, miss), (1, 1))
+        hit, miss = expected_probes(0.5)
+        self.assertLess(hit, miss)
+
+    def test_analyze_detects_poor_function(self):
+        keys = ['key' + str(i) for i in range(2000)]
+        poor = analyze(keys, hash_function_1, loads=(0.25,))
+        good = analyze(keys, make_fnv_function(261), loads=(0.25,))
+
+        self.assertEqual(poor['keys'], 2000)
+        self.assertEqual(good['distinct_hashes'], 2000)
+        self.assertLess(poor['distinct_hashes'], 2000)
+        self.assertLess(poor['p_value'], 0.001)
+        self.assertGreater(good['p_value'], 0.001)
+        self.assertGreater(poor['chains']['max_chain'],
+                           good['chains']['max_chain'])
+
+        row = good['probes'][0]
+        self.assertAlmostEqual(row['load'], 0.25, places=2)
+        self.assertLess(abs(row['mean_probes'] - row['expected_hit']), 0.2)
+        self.assertGreater(poor['probes'][0]['mean_probes'],
+                           row['mean_probes'])
+        self.assertLess(abs(row['mean_miss_probes'] - row['expected_miss']),
+                        0.3)
+        self.assertGreater(good['keys_per_sec'], 0)
+
+    def test_absent_keys(self):
+        keys = ['key' + str(i) for i in range(100)]
+        absent = absent_keys(keys)
+        self.assertEqual(len(absent), 100)
+        self.assertEqual(len(set(absent)), 100)
+        self.assertFalse(set(absent) & set(keys))
+        self.assertEqual(absent, absent_keys(keys))
+
+    def test_probe_report_power_of_two(self):
+        # Probes come from the map's own loop, so triangular probing over a
+        # bit mask is measured correctly
+        keys = ['key' + str(i) for i in range(2000)]
+        row = probe_report(keys, make_fnv_function(261), (0.49,),
+                           power_of_two=True)[0]
+        self.assertEqual(row['capacity'], 4096)
+        self.assertLess(abs(row['mean_probes'] - row['expected_hit']), 0.2)
+        self.assertLess(abs(row['mean_miss_probes'] - row['expected_miss']),
+                        0.3)
+
+    def test_analyze_empty_sample(self):
+        report = analyze([], hash_function_2)
+        self.assertEqual(report['keys'], 0)
+        self.assertEqual(report['chi_squared'], 0)
+        self.assertEqual(report['probes'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
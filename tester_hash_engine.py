@@ -0,0 +1,74 @@
+import unittest
+import hash_engine
+from hash_engine import *
+from hash_engine import _chunks, _numpy_hash_1, _numpy_hash_2
+
+KEYS = ['', 'a', 'key1', 'str12', 'str21', 'some key', 'ñandú', '键值',
+        'x' * 300, 'tab\tand\x00null']
+
+
+class TestHashEngine(unittest.TestCase):
+    def test_fast_functions_match(self):
+        for key in KEYS:
+            self.assertEqual(fast_hash_function_1(key), hash_function_1(key))
+            self.assertEqual(fast_hash_function_2(key), hash_function_2(key))
+
+    def test_engine_matches_and_caches(self):
+        engine = HashEngine(hash_function_2, cache_size=8)
+        for key in KEYS:
+            self.assertEqual(engine(key), hash_function_2(key))
+        engine('key1')
+        self.assertGreaterEqual(engine.cache_info().hits, 1)
+        self.assertLessEqual(engine.cache_info().currsize, 8)
+
+    def test_engine_custom_function(self):
+        engine = HashEngine(len, cache_size=0)
+        self.assertEqual(engine('abcd'), 4)
+        self.assertIsNone(engine.cache_info())
+
+    def test_hash_many(self):
+        keys = ['str' + str(i) for i in range(500)] + KEYS
+        for function in (hash_function_1, hash_function_2):
+            engine = HashEngine(function)
+            self.assertEqual(engine.hash_many(keys), [function(k) for k in keys])
+
+    def test_mixed_engine(self):
+        keys = ['str' + str(i) for i in range(500)] + KEYS
+        engine = HashEngine(hash_function_1, mix=True)
+        expected = [fold_hash(hash_function_1(k)) for k in keys]
+        self.assertEqual([engine(k) for k in keys], expected)
+        self.assertEqual(engine.hash_many(keys), expected)
+        # Bijective, so the clustered sums stay distinct and spread out
+        sums = range(1000)
+        self.assertEqual(len({fold_hash(h) for h in sums}), 1000)
+        self.assertEqual(len({fold_hash(h) & 63 for h in sums}), 64)
+
+    @unittest.skipIf(np is None, "NumPy not installed")
+    def test_numpy_kernels(self):
+        keys = ['str' + str(i) for i in range(500)] + KEYS
+        self.assertEqual(_numpy_hash_1(keys), [hash_function_1(k) for k in keys])
+        self.assertEqual(_numpy_hash_2(keys), [hash_function_2(k) for k in keys])
+
+    def test_chunks_bound_cells(self):
+        keys = ['str' + str(i) for i in range(500)]
+        keys[250] = 'x' * 900
+        keys.append('y' * 3000)
+        limit = hash_engine.NUMPY_MAX_CELLS
+        hash_engine.NUMPY_MAX_CELLS = 1000
+        try:
+            ranges = list(_chunks(keys))
+            self.assertEqual([key for start, end in ranges
+                              for key in keys[start:end]], keys)
+            for start, end in ranges:
+                width = max(len(key) for key in keys[start:end])
+                self.assertTrue((end - start) * width <= 1000
+                                or end - start == 1)
+            for function in (hash_function_1, hash_function_2):
+                self.assertEqual(HashEngine(function).hash_many(keys),
+                                 [function(key) for key in keys])
+        finally:
+            hash_engine.NUMPY_MAX_CELLS = limit
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import random
+import unittest
+from hash_map_columnar import *
+import hash_map_oa
+
+
+class TestColumnarHashMap(unittest.TestCase):
+    def test_matches_oa_map(self):
+        self.m = ColumnarHashMap(53, hash_function_1)
+        reference = hash_map_oa.HashMap(53, hash_function_1)
+        for i in range(150):
+            self.m.put('str' + str(i), i * 100)
+            reference.put('str' + str(i), i * 100)
+            self.assertEqual(self.m.get_capacity(), reference.get_capacity())
+            self.assertEqual(self.m.empty_buckets(), reference.empty_buckets())
+        for i in range(160):
+            self.assertEqual(self.m.get('str' + str(i)),
+                             reference.get('str' + str(i)))
+
+    def test_slots(self):
+        self.m = ColumnarHashMap(11, hash_function_1)
+        with self.assertRaises(AttributeError):
+            self.m.extra = 1
+
+    def test_random_operations(self):
+        self.m = ColumnarHashMap(11, hash_function_2, tombstone_limit=0.2)
+        expected = {}
+        rng = random.Random(9)
+        for step in range(3000):
+            key = 'key' + str(rng.randrange(300))
+            if rng.random() < 0.55:
+                self.m.put(key, step)
+                expected[key] = step
+            else:
+                self.m.remove(key)
+                expected.pop(key, None)
+            self.assertEqual(self.m.get_size(), len(expected))
+            self.assertLessEqual(self.m.tombstone_count(),
+                                 0.2 * self.m.get_capacity())
+        for i in range(300):
+            key = 'key' + str(i)
+            self.assertEqual(self.m.contains_key(key), key in expected)
+            self.assertEqual(self.m.get(key), expected.get(key))
+        self.assertEqual(sorted((e.key, e.value) for e in self.m),
+                         sorted(expected.items()))
+
+    def test_resize_and_clear(self):
+        self.m = ColumnarHashMap(11, hash_function_2)
+        for i in range(1, 6):
+            self.m.put(str(i), str(i * 10))
+        self.m.resize_table(2)
+        self.assertEqual(self.m.get_capacity(), 11)
+        self.m.resize_table(12)
+        self.assertEqual(self.m.get_capacity(), 13)
+        self.assertEqual(self.m.get_keys_and_values().length(), 5)
+        self.m.clear()
+        self.assertEqual(self.m.get_size(), 0)
+        self.assertIsNone(self.m.get('1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
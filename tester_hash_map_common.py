@@ -0,0 +1,230 @@
+from a6_include import DynamicArray, as_list, hash_function_1, hash_function_2
+from resize_policy import ResizePolicy
+
+
+class HashMapTests:
+    """
+    Tests shared by both HashMap implementations. A TestCase mixes this in
+    and sets the class attributes below.
+    """
+
+    # HashMap class under test and its InstrumentedHashMap subclass
+    map_class = None
+    instrumented_class = None
+
+    # Highest load factor of the default resize policy
+    grow_at = 1.0
+
+    # Capacity after put_many() of 200 keys into an empty map
+    batch_capacity = None
+
+    def test_resize_reuses_stored_hash(self):
+        calls = []
+
+        def counting_hash(key):
+            calls.append(key)
+            return hash_function_2(key)
+
+        self.m = self.map_class(11, counting_hash)
+        for i in range(40):
+            self.m.put('key' + str(i), i)
+        calls.clear()
+        self.m._hash_function.cache_clear()
+        self.m.resize_table(400)
+        self.assertEqual(calls, [])
+        for i in range(40):
+            self.assertEqual(self.m.get('key' + str(i)), i)
+
+    def test_batch_operations(self):
+        self.m = self.map_class(11, hash_function_2)
+        pairs = [('key' + str(i), i) for i in range(200)]
+        self.m.put_many(DynamicArray(pairs))
+        # One resize straight to the final capacity
+        self.assertEqual(self.m.get_capacity(), self.batch_capacity)
+        self.m.put_many((key, -value) for key, value in pairs[:10])
+        self.assertEqual(self.m.get_size(), 200)
+        self.assertEqual(self.m.get('key9'), -9)
+
+        # Into a non-empty map, only the new keys count towards the growth
+        counted = self.instrumented_class(11, hash_function_2)
+        counted.put_many(pairs[:50])
+        resizes = counted.statistics()['resizes']
+        counted.put_many(pairs)
+        self.assertEqual(counted.statistics()['resizes'], resizes + 1)
+        self.assertEqual(counted.get_size(), 200)
+
+        # Every pair is looked up once, by the insert itself
+        counted = self.instrumented_class(11, hash_function_2)
+        counted.put_many(pairs[:100])
+        stats = counted.statistics()
+        self.assertEqual((stats['lookups'], stats['misses']), (100, 100))
+        counted.reserve(200)
+        counted.reset_statistics()
+        counted.put_many(pairs[:100])
+        stats = counted.statistics()
+        self.assertEqual((stats['lookups'], stats['hits']), (100, 100))
+        self.assertEqual(stats['resizes'], 0)
+
+        values = self.m.get_many(['key15', 'missing', 'key199'])
+        self.assertEqual([values[i] for i in range(3)], [15, None, 199])
+        found = self.m.contains_many(DynamicArray(['key0', 'key200']))
+        self.assertEqual([found[i] for i in range(2)], [True, False])
+
+        self.m.remove_many('key' + str(i) for i in range(0, 200, 2))
+        self.assertEqual(self.m.get_size(), 100)
+        self.assertFalse(self.m.contains_key('key0'))
+        self.assertEqual(self.m.get('key11'), 11)
+
+        counts = self.m.increment_many(['key11', 'new', 'new', 'key11'], 2)
+        self.assertEqual([counts[i] for i in range(4)], [13, 2, 4, 15])
+        self.assertEqual(self.m.get('new'), 4)
+        self.assertEqual(self.m.get_size(), 101)
+
+        other = self.map_class(11, hash_function_1)
+        other.put('new', 10)
+        other.put('other', 1)
+        self.m.merge(other, lambda current, incoming: current + incoming)
+        self.assertEqual(self.m.get('new'), 14)
+        self.assertEqual(self.m.get('other'), 1)
+        self.m.merge([('other', 'replaced'), ('last', None)])
+        self.assertEqual(self.m.get('other'), 'replaced')
+        self.assertTrue(self.m.contains_key('last'))
+        self.assertEqual(self.m.get_size(), 103)
+
+    def test_batch_operations_during_migration(self):
+        self.m = self.map_class(11, hash_function_2, incremental_resize=True)
+        count = 0
+        while count < 1000 or self.m._old_buckets is None:
+            self.m.put('key' + str(count), count)
+            count += 1
+
+        # Batches advance the migration a step per key, never finish it
+        values = self.m.get_many(['key0', 'key5', 'missing'])
+        self.assertEqual(as_list(values), [0, 5, None])
+        found = self.m.contains_many(['key1', 'missing'])
+        self.assertEqual(as_list(found), [True, False])
+        self.m.remove_many(['key2', 'key3'])
+        counts = self.m.increment_many(['key4', 'new'])
+        self.assertEqual(as_list(counts), [5, 1])
+        self.m.put_many([('key6', 'six'), ('other', 7)])
+        self.m.merge([('key7', 'seven')])
+        self.assertIsNotNone(self.m._old_buckets)
+
+        self.assertEqual(self.m.get_size(), count)
+        self.assertEqual(self.m.get('key6'), 'six')
+        self.assertEqual(self.m.get('key7'), 'seven')
+        self.assertFalse(self.m.contains_key('key2'))
+        self.assertEqual(self.m.get('key%d' % (count - 1)), count - 1)
+
+    def test_reserve(self):
+        self.m = self.map_class(11, hash_function_2)
+        self.m.put('key', 1)
+        self.m.reserve(1000)
+        capacity = self.m.get_capacity()
+        for i in range(999):
+            self.m.put('str' + str(i), i)
+        # Loading up to the reserved count never resizes
+        self.assertEqual(self.m.get_capacity(), capacity)
+        self.assertEqual(self.m.get('key'), 1)
+        self.m.reserve(10)
+        self.assertEqual(self.m.get_capacity(), capacity)
+
+        self.m = self.map_class(11, hash_function_2, expected_size=1000)
+        capacity = self.m.get_capacity()
+        for i in range(1000):
+            self.m.put('str' + str(i), i)
+        self.assertEqual(self.m.get_capacity(), capacity)
+        self.assertEqual(self.m.get_size(), 1000)
+
+    def test_power_of_two(self):
+        self.m = self.map_class(20, hash_function_1, power_of_two=True)
+        self.assertEqual(self.m.get_capacity(), 32)
+        for i in range(300):
+            self.m.put('str' + str(i), i)
+        capacity = self.m.get_capacity()
+        self.assertEqual(capacity & (capacity - 1), 0)
+        for i in range(0, 300, 3):
+            self.m.remove('str' + str(i))
+        self.assertEqual(self.m.get_size(), 200)
+        for i in range(300):
+            self.assertEqual(self.m.get('str' + str(i)),
+                             None if i % 3 == 0 else i)
+        self.m.resize_table(1000)
+        self.assertEqual(self.m.get_capacity(), 1024)
+        self.assertEqual(self.m.get('str299'), 299)
+
+    def test_resize_policy_shrinks(self):
+        policy = ResizePolicy(grow_at=self.grow_at,
+                              shrink_at=self.grow_at / 5)
+        for incremental in (False, True):
+            self.m = self.map_class(11, hash_function_2,
+                                    incremental_resize=incremental,
+                                    policy=policy)
+            for i in range(2000):
+                self.m.put('str' + str(i), i)
+            grown = self.m.get_capacity()
+            for i in range(1990):
+                self.m.remove('str' + str(i))
+            self.assertEqual(self.m.get_size(), 10)
+            self.assertLess(self.m.get_capacity(), grown // 10)
+            self.assertGreaterEqual(self.m.get_capacity(), 11)
+            for i in range(1990, 2000):
+                self.assertEqual(self.m.get('str' + str(i)), i)
+
+    def test_resize_policy_growth(self):
+        self.m = self.map_class(11, hash_function_1,
+                                policy=ResizePolicy(grow_at=0.25,
+                                                    growth_factor=4))
+        for i in range(100):
+            self.m.put('str' + str(i), i)
+            self.assertLess((self.m.get_size() - 1) / self.m.get_capacity(),
+                            0.25)
+        self.m.remove_many('str' + str(i) for i in range(100))
+        # Shrinking is off by default
+        self.assertGreater(self.m.get_capacity(), 400)
+
+    def test_resize_policy_small_factor(self):
+        # int(11 * 1.05) is 11: growth must still add capacity
+        for incremental in (False, True):
+            self.m = self.map_class(11, hash_function_2,
+                                    incremental_resize=incremental,
+                                    policy=ResizePolicy(grow_at=self.grow_at,
+                                                        growth_factor=1.05))
+            for i in range(100):
+                self.m.put('str' + str(i), i)
+            self.assertEqual(self.m.get_size(), 100)
+            self.assertLessEqual((self.m.get_size() - 1)
+                                 / self.m.get_capacity(), self.grow_at)
+            for i in range(100):
+                self.assertEqual(self.m.get('str' + str(i)), i)
+
+    def test_single_pass_updates(self):
+        for incremental in (False, True):
+            self.m = self.map_class(11, hash_function_1,
+                                    incremental_resize=incremental)
+            for i in range(100):
+                self.assertEqual(self.m.increment('key' + str(i % 7)),
+                                 i // 7 + 1)
+            self.assertEqual(self.m.get('key0'), 15)
+            self.assertEqual(self.m.increment('key0', -5), 10)
+
+            self.assertEqual(self.m.setdefault('key1'), 15)
+            self.assertEqual(self.m.setdefault('new', []), [])
+            self.m.setdefault('new', []).append(1)
+            self.assertEqual(self.m.get('new'), [1])
+
+            self.assertEqual(self.m.update('key2', lambda v: v * 2), 28)
+            self.assertEqual(self.m.update('other', str.upper, 'abc'), 'ABC')
+            self.assertEqual(self.m.get_size(), 9)
+
+            self.assertEqual(self.m.pop('key3'), 14)
+            self.assertIsNone(self.m.pop('key3'))
+            self.assertEqual(self.m.pop('key3', 'gone'), 'gone')
+            self.assertFalse(self.m.contains_key('key3'))
+            self.assertEqual(self.m.get_size(), 8)
+
+            # The key is hashed once per call
+            self.m._hash_function.cache_clear()
+            self.m.increment('key4')
+            self.assertEqual(self.m._hash_function.cache_info().misses, 1)
+
@@ -0,0 +1,93 @@
+import random
+import unittest
+from hash_map_cuckoo import *
+
+
+class TestCuckooHashMap(unittest.TestCase):
+    def test_put_get(self):
+        self.m = CuckooHashMap(53, seed=1)
+        for i in range(500):
+            self.m.put('str' + str(i), i)
+            self.assertLessEqual(self.m.table_load(), CuckooHashMap.MAX_LOAD)
+        self.assertEqual(self.m.get_size(), 500)
+        for i in range(500):
+            self.assertEqual(self.m.get('str' + str(i)), i)
+        self.assertIsNone(self.m.get('str500'))
+        self.assertLessEqual(len(self.m._stash), self.m._stash_size)
+
+    def test_anagram_keys(self):
+        # Every permutation collides under hash_function_1
+        keys = ['abcdef'[i:] + 'abcdef'[:i] for i in range(6)]
+        keys += [key[::-1] for key in keys]
+        self.m = CuckooHashMap(11, seed=2)
+        for key in keys:
+            self.m.put(key, key.upper())
+        self.assertEqual(self.m.get_size(), len(set(keys)))
+        for key in keys:
+            self.assertEqual(self.m.get(key), key.upper())
+
+    def test_stash_stays_bounded(self):
+        # Like 'abba' and 'baab', 'xyyx' keys whose letters have the same
+        # sum share both hash_function_1 and hash_function_2, so no seed
+        # separates them
+        total = 2 * ord('m')
+        keys = [x + y + y + x for x in map(chr, range(ord('a'), ord('z') + 1))
+                for y in [chr(total - ord(x))] if 'a' <= y <= 'z']
+        keys += ['str' + str(i) for i in range(200)]
+        self.m = CuckooHashMap(11, seed=5)
+        for key in keys:
+            self.m.put(key, key)
+            self.assertLessEqual(len(self.m._stash), 4)
+        self.assertEqual(self.m._stash_size, 4)
+        self.assertEqual(self.m.get_size(), len(keys))
+        self.assertLessEqual(self.m.table_load(), CuckooHashMap.MAX_LOAD)
+        self.assertGreater(self.m.table_load(), CuckooHashMap.MAX_LOAD / 4)
+        for key in keys:
+            self.assertEqual(self.m.get(key), key)
+        self.m.remove('ayya')
+        self.assertFalse(self.m.contains_key('ayya'))
+        self.assertTrue(self.m.contains_key('yaay'))
+
+    def test_slots(self):
+        self.m = CuckooHashMap(11, seed=6)
+        with self.assertRaises(AttributeError):
+            self.m.extra = 1
+        with self.assertRaises(AttributeError):
+            CuckooEntry('k', 'v', 0, 0).extra = 1
+
+    def test_random_operations(self):
+        self.m = CuckooHashMap(11, seed=3)
+        expected = {}
+        rng = random.Random(8)
+        for step in range(3000):
+            key = 'str' + str(rng.randrange(300))
+            if rng.random() < 0.6:
+                self.m.put(key, step)
+                expected[key] = step
+            else:
+                self.m.remove(key)
+                expected.pop(key, None)
+            self.assertEqual(self.m.get_size(), len(expected))
+        for i in range(300):
+            key = 'str' + str(i)
+            self.assertEqual(self.m.contains_key(key), key in expected)
+            self.assertEqual(self.m.get(key), expected.get(key))
+        pairs = self.m.get_keys_and_values()
+        self.assertEqual(sorted(pairs[i] for i in range(pairs.length())),
+                         sorted(expected.items()))
+
+    def test_resize_and_clear(self):
+        self.m = CuckooHashMap(11, seed=4)
+        for i in range(1, 6):
+            self.m.put(str(i), str(i * 10))
+        self.m.resize_table(100)
+        self.assertEqual(self.m.get_capacity(), 101)
+        self.assertEqual(self.m.get('3'), '30')
+        self.assertEqual(self.m.empty_buckets(), 96)
+        self.m.clear()
+        self.assertEqual(self.m.get_size(), 0)
+        self.assertIsNone(self.m.get('3'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,15 @@
+import random
 import unittest
-import unittest
+from resize_policy import ResizePolicy
+from tester_hash_map_common import HashMapTests
 from hash_map_oa import *
 
-class TestHashMapOA(unittest.TestCase):
+class TestHashMapOA(HashMapTests, unittest.TestCase):
+    map_class = HashMap
+    instrumented_class = InstrumentedHashMap
+    grow_at = 0.5
+    batch_capacity = 401
+
     def test_put(self):
         self.m = HashMap(53, hash_function_1)
         for i in range(150):
@@ -20,5 +27,156 @@ class TestHashMapOA(unittest.TestCase):
             elif i == 149:
                 print(self.m.empty_buckets(), round(self.m.table_load(), 2), self.m.get_size(), self.m.get_capacity())
 
+    def test_resize_reuses_entries(self):
+        self.m = HashMap(7, hash_function_1)
+        for i in range(20):
+            self.m.put('str' + str(i), i)
+        before = {id(entry) for entry in self.m}
+        self.m.resize_table(100)
+        self.assertEqual({id(entry) for entry in self.m}, before)
+        self.assertEqual(self.m.get_size(), 20)
+
+    def test_incremental_resize(self):
+        self.m = HashMap(11, hash_function_2, incremental_resize=True)
+        expected = {}
+        rng = random.Random(261)
+        for step in range(3000):
+            key = 'key' + str(step)
+            self.m.put(key, step)
+            expected[key] = step
+            if rng.random() < 0.3:
+                removed = 'key' + str(rng.randrange(step + 1))
+                self.m.remove(removed)
+                expected.pop(removed, None)
+            probe = 'key' + str(rng.randrange(step + 2))
+            self.assertEqual(self.m.get(probe), expected.get(probe))
+            self.assertEqual(self.m.contains_key(probe), probe in expected)
+            self.assertEqual(self.m.get_size(), len(expected))
+        pairs = self.m.get_keys_and_values()
+        self.assertEqual(sorted(pairs[i] for i in range(pairs.length())),
+                         sorted(expected.items()))
+
+    def test_tombstone_accounting(self):
+        self.m = HashMap(101, hash_function_2, tombstone_limit=None)
+        for i in range(40):
+            self.m.put('key' + str(i), i)
+        for i in range(10):
+            self.m.remove('key' + str(i))
+        self.m.remove('missing')
+        self.assertEqual(self.m.tombstone_count(), 10)
+        self.assertEqual(self.m.empty_buckets(), 101 - 30 - 10)
+        self.assertEqual(round(self.m.occupied_load(), 2), round(40 / 101, 2))
+
+    def test_tombstone_compaction(self):
+        self.m = HashMap(101, hash_function_2, tombstone_limit=0.2)
+        for round_number in range(50):
+            for i in range(30):
+                self.m.put('key' + str(round_number) + '_' + str(i), i)
+            for i in range(30):
+                self.m.remove('key' + str(round_number) + '_' + str(i))
+                self.assertLessEqual(self.m.tombstone_count(),
+                                     0.2 * self.m.get_capacity())
+        self.assertEqual(self.m.get_size(), 0)
+        self.assertEqual(self.m.get_capacity(), 101)
+        self.assertFalse(self.m.contains_key('key0_0'))
+
+    def test_put_after_remove_keeps_single_entry(self):
+        # 'ab' and 'ba' collide under hash_function_1
+        self.m = HashMap(11, hash_function_1)
+        self.m.put('ab', 1)
+        self.m.put('ba', 2)
+        self.m.remove('ab')
+        self.m.put('ba', 3)
+        self.assertEqual(self.m.get_size(), 1)
+        self.assertEqual(self.m.get('ba'), 3)
+        self.assertEqual(self.m.get_keys_and_values().length(), 1)
+        self.m.put('ab', 4)
+        self.assertEqual(self.m.tombstone_count(), 0)
+
+    def test_random_operations(self):
+        self.m = HashMap(11, hash_function_1)
+        expected = {}
+        rng = random.Random(6)
+        for step in range(3000):
+            key = 'str' + str(rng.randrange(300))
+            if rng.random() < 0.6:
+                self.m.put(key, step)
+                expected[key] = step
+            else:
+                self.m.remove(key)
+                expected.pop(key, None)
+            self.assertEqual(self.m.get_size(), len(expected))
+        for key, value in expected.items():
+            self.assertEqual(self.m.get(key), value)
+
+    def test_resize_policy_limit(self):
+        # Quadratic probing reaches only half of a prime table
+        with self.assertRaises(ValueError):
+            HashMap(11, hash_function_1, policy=ResizePolicy(grow_at=0.75))
+        with self.assertRaises(ValueError):
+            HashMap(11, hash_function_1, power_of_two=True,
+                    policy=ResizePolicy(grow_at=1.5))
+
+        # Triangular probing reaches every slot of a power-of-two table
+        self.m = HashMap(8, hash_function_1, power_of_two=True,
+                         policy=ResizePolicy(grow_at=1.0))
+        for i in range(100):
+            self.m.put('str' + str(i), i)
+        self.assertEqual(self.m.get_capacity(), 128)
+        for i in range(100):
+            self.assertEqual(self.m.get('str' + str(i)), i)
+
+    def test_statistics(self):
+        self.m = InstrumentedHashMap(11, hash_function_1, tombstone_limit=0.1)
+        # 'a', 'l' and 'w' share home slot 9
+        self.m.put('a', 1)
+        self.m.put('l', 2)
+        self.assertEqual(self.m.get('l'), 2)
+        self.assertIsNone(self.m.get('w'))
+        self.m.remove('a')
+
+        stats = self.m.statistics()
+        self.assertEqual(stats['length_histogram'], {1: 2, 2: 2, 3: 1})
+        self.assertEqual((stats['hits'], stats['misses']), (2, 3))
+        self.assertAlmostEqual(stats['hit_ratio'], 0.4)
+        self.assertEqual(stats['max_length'], 3)
+        self.assertEqual(stats['tombstones'], 1)
+        self.assertEqual((stats['size'], stats['capacity']), (1, 11))
+
+        # A second tombstone exceeds the limit and compacts the table
+        self.m.remove('l')
+        self.assertEqual(self.m.statistics()['compactions'], 1)
+
+        self.m.reset_statistics()
+        for i in range(100):
+            self.m.put('str' + str(i), i)
+        stats = self.m.statistics()
+        self.assertEqual(stats['misses'], 100)
+        self.assertEqual(stats['resizes'], 5)
+        self.assertEqual([entry[:2] for entry in stats['resize_history']],
+                         [(11, 23), (23, 47), (47, 97), (97, 197), (197, 397)])
+        self.assertEqual(sum(stats['resize_us_histogram'].values()), 5)
+
+        self.assertEqual(self.m.get_many(['str1', 'nope']).length(), 2)
+        self.assertEqual(self.m.statistics()['lookups'], 102)
+
+        # During a migration, lookups count the slots of both tables
+        self.m = InstrumentedHashMap(11, hash_function_2,
+                                     incremental_resize=True)
+        count = 0
+        while count < 200 or self.m._old_buckets is None:
+            self.m.put('key' + str(count), count)
+            count += 1
+        self.m.reset_statistics()
+        for i in range(count):
+            self.m.get('key' + str(i))
+        stats = self.m.statistics()
+        self.assertEqual((stats['hits'], stats['misses']), (count, 0))
+        self.assertGreaterEqual(stats['max_length'], 2)
+
+        # Plain maps carry no instrumentation
+        self.assertFalse(hasattr(HashMap(11, hash_function_1), '_stats'))
+        self.assertIsNone(HashMap(11, hash_function_1)._probes)
+
 if __name__ == '__main__':
     unittest.main()
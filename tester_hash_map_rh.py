@@ -0,0 +1,94 @@
+import random
+import unittest
+from a6_include import make_fnv_function
+from hash_map_rh import *
+
+
+class TestRobinHoodHashMap(unittest.TestCase):
+    def check_invariant(self, m):
+        # Every entry is reachable: no empty slot between it and its home
+        capacity = m.get_capacity()
+        for index in range(capacity):
+            entry = m._buckets[index]
+            if entry is None:
+                continue
+            home = entry.hash % capacity
+            slot = home
+            while slot != index:
+                self.assertIsNotNone(m._buckets[slot])
+                slot = (slot + 1) % capacity
+
+    def test_put_get_high_load(self):
+        # Only a hash with few repeated values lets the table fill up this
+        # far: hash_function_2 gives these keys 200 distinct values, whose
+        # clusters now grow the table early to bound probe lengths
+        self.m = RobinHoodHashMap(53, make_fnv_function(261))
+        for i in range(1000):
+            self.m.put('str' + str(i), i)
+            self.assertLessEqual(self.m.table_load(), 0.9)
+        self.assertEqual(self.m.get_size(), 1000)
+        self.assertGreater(self.m.table_load(), 0.45)
+        for i in range(1000):
+            self.assertEqual(self.m.get('str' + str(i)), i)
+        self.assertIsNone(self.m.get('str1000'))
+        self.check_invariant(self.m)
+
+    def test_probe_length_bounded(self):
+        # hash_function_1 sums characters, so these words share few hash
+        # values; displacement must still stay within 2 * log2(capacity)
+        rng = random.Random(261)
+        self.m = RobinHoodHashMap(11, hash_function_1)
+        for _ in range(2000):
+            word = ''.join(rng.choices('abcdefghijklmnopqrstuvwxyz',
+                                       k=rng.randint(3, 9)))
+            self.m.put(word, word)
+            self.assertLessEqual(self.m.max_probe_length(),
+                                 2 * self.m.get_capacity().bit_length())
+        self.check_invariant(self.m)
+
+    def test_invalid_max_load(self):
+        for max_load in (0, -0.5, 1, 1.5):
+            with self.assertRaises(ValueError):
+                RobinHoodHashMap(11, hash_function_1, max_load)
+        self.m = RobinHoodHashMap(11, hash_function_1, 0.5)
+        with self.assertRaises(AttributeError):
+            self.m.extra = None
+
+    def test_random_operations(self):
+        self.m = RobinHoodHashMap(11, hash_function_1)
+        expected = {}
+        rng = random.Random(7)
+        for step in range(4000):
+            key = 'str' + str(rng.randrange(400))
+            if rng.random() < 0.55:
+                self.m.put(key, step)
+                expected[key] = step
+            else:
+                self.m.remove(key)
+                expected.pop(key, None)
+            self.assertEqual(self.m.get_size(), len(expected))
+        self.check_invariant(self.m)
+        for i in range(400):
+            key = 'str' + str(i)
+            self.assertEqual(self.m.contains_key(key), key in expected)
+            self.assertEqual(self.m.get(key), expected.get(key))
+        self.assertEqual(self.m.empty_buckets(),
+                         self.m.get_capacity() - len(expected))
+
+    def test_resize_iter_clear(self):
+        self.m = RobinHoodHashMap(11, hash_function_2)
+        for i in range(1, 6):
+            self.m.put(str(i), str(i * 10))
+        self.m.resize_table(2)
+        self.assertEqual(self.m.get_capacity(), 11)
+        self.m.resize_table(40)
+        self.assertEqual(self.m.get_capacity(), 41)
+        self.assertEqual(sorted(entry.key for entry in self.m),
+                         ['1', '2', '3', '4', '5'])
+        self.m.clear()
+        self.assertEqual(self.m.get_size(), 0)
+        self.assertEqual(self.m.get_keys_and_values().length(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
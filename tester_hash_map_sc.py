@@ -1,7 +1,15 @@
+import itertools
+import random
 import unittest
+from tester_hash_map_common import HashMapTests
 from hash_map_sc import *
 
-class TestHashMapSC(unittest.TestCase):
+class TestHashMapSC(HashMapTests, unittest.TestCase):
+    map_class = HashMap
+    instrumented_class = InstrumentedHashMap
+    grow_at = 1.0
+    batch_capacity = 211
+
     def test_put(self):
         self.m = HashMap(53, hash_function_1)
         for i in range(150):
@@ -90,7 +98,143 @@ class TestHashMapSC(unittest.TestCase):
         mode, frequency = find_mode(da)
         print(f"Input: {da}\nMode : {mode}, Frequency: {frequency}")
 
+    def test_resize_reuses_nodes(self):
+        def node_ids(m):
+            return {id(node) for i in range(m.get_capacity()) for node in m._buckets[i]}
+
+        self.m = HashMap(7, hash_function_1)
+        for i in range(20):
+            self.m.put('str' + str(i), i)
+        before = node_ids(self.m)
+        self.m.resize_table(100)
+        self.assertEqual(node_ids(self.m), before)
+        self.assertEqual(self.m.get_size(), 20)
+
+    def test_incremental_resize(self):
+        self.m = HashMap(11, hash_function_2, incremental_resize=True)
+        expected = {}
+        rng = random.Random(261)
+        for step in range(3000):
+            key = 'key' + str(rng.randrange(800))
+            action = rng.random()
+            if action < 0.6:
+                self.m.put(key, step)
+                expected[key] = step
+            elif action < 0.8:
+                self.m.remove(key)
+                expected.pop(key, None)
+            else:
+                self.assertEqual(self.m.get(key), expected.get(key))
+                self.assertEqual(self.m.contains_key(key), key in expected)
+            self.assertEqual(self.m.get_size(), len(expected))
+        pairs = self.m.get_keys_and_values()
+        self.assertEqual(sorted(pairs[i] for i in range(pairs.length())),
+                         sorted(expected.items()))
+
+    def test_node_pool(self):
+        self.m = HashMap(53, hash_function_1, node_pool=10)
+        for i in range(30):
+            self.m.put('key' + str(i), i)
+        removed = self.m._buckets[self.m._hash_function('key3') % 53].contains('key3')
+        for i in range(20):
+            self.m.remove('key' + str(i))
+        self.assertEqual(len(self.m._node_pool), 10)
+        self.assertIsNone(removed.key)
+        self.m.put('new', 'value')
+        self.assertEqual(len(self.m._node_pool), 9)
+        self.assertEqual(self.m.get('new'), 'value')
+        self.assertEqual(self.m.get_size(), 11)
+        self.m.clear()
+        self.assertEqual(len(self.m._node_pool), 10)
+        self.assertEqual(self.m.get_size(), 0)
+        self.assertIsNone(self.m.get('new'))
+
+    def test_slots(self):
+        self.m = HashMap(11, hash_function_1)
+        with self.assertRaises(AttributeError):
+            self.m.extra = 1
+        with self.assertRaises(AttributeError):
+            SLNode('k', 'v').extra = 1
+
+    def test_treeify(self):
+        # Every permutation of the same digits collides under hash_function_1
+        keys = ['str' + ''.join(p) for p in itertools.permutations('1234')]
+        self.m = HashMap(53, hash_function_1, treeify=True)
+        for i, key in enumerate(keys):
+            self.m.put(key, i)
+        bucket = self.m._bucket_for(self.m._hash_function(keys[0]))
+        self.assertIsInstance(bucket, SortedBucket)
+        self.assertEqual(bucket.length(), 24)
+        for i, key in enumerate(keys):
+            self.assertEqual(self.m.get(key), i)
+        self.assertIsNone(self.m.get('str4444'))
+
+        # Survives a resize, then turns back into a chain when it shrinks
+        self.m.resize_table(200)
+        bucket = self.m._bucket_for(self.m._hash_function(keys[0]))
+        self.assertIsInstance(bucket, SortedBucket)
+        for key in keys[:18]:
+            self.m.remove(key)
+        bucket = self.m._bucket_for(self.m._hash_function(keys[0]))
+        self.assertIsInstance(bucket, LinkedList)
+        self.assertEqual(bucket.length(), 6)
+        self.assertEqual(self.m.get(keys[23]), 23)
+
+    def test_sorted_bucket(self):
+        bucket = SortedBucket()
+        for key, hash in (('b', 5), ('a', 5), (1, 3), ('1', 3), ('z', 1)):
+            bucket.insert(key, repr(key), hash)
+        self.assertEqual([node.key for node in bucket], ['z', 1, '1', 'a', 'b'])
+        self.assertEqual(bucket.contains('1', 3).value, "'1'")
+        self.assertEqual(bucket.contains(1, 3).value, '1')
+        self.assertIsNone(bucket.contains('a', 3))
+        self.assertTrue(bucket.remove(1))
+        self.assertIsNone(bucket.contains(1, 3))
+        self.assertEqual(bucket.contains('1').key, '1')
+        self.assertEqual(bucket.length(), 4)
+
+    def test_statistics(self):
+        self.m = InstrumentedHashMap(11, hash_function_1)
+        # 'a', 'l' and 'w' share bucket 9; new nodes go to the front
+        self.m.put('a', 1)
+        self.m.put('l', 2)
+        self.assertEqual(self.m.get('l'), 2)
+        self.assertIsNone(self.m.get('w'))
+        self.m.remove('a')
+
+        stats = self.m.statistics()
+        self.assertEqual(stats['length_histogram'], {0: 1, 1: 2, 2: 2})
+        self.assertEqual((stats['hits'], stats['misses']), (2, 3))
+        self.assertAlmostEqual(stats['hit_ratio'], 0.4)
+        self.assertEqual(stats['max_length'], 2)
+        self.assertEqual((stats['size'], stats['capacity']), (1, 11))
+
+        self.m.reset_statistics()
+        for i in range(100):
+            self.m.put('str' + str(i), i)
+        stats = self.m.statistics()
+        self.assertEqual(stats['misses'], 100)
+        self.assertEqual(stats['resizes'], 4)
+        self.assertEqual([entry[:2] for entry in stats['resize_history']],
+                         [(11, 23), (23, 47), (47, 97), (97, 197)])
+        self.assertEqual(sum(stats['resize_us_histogram'].values()), 4)
+
+        self.assertEqual(self.m.get_many(['str1', 'nope']).length(), 2)
+        self.assertEqual(self.m.statistics()['lookups'], 102)
+
+        # A treeified bucket counts its binary search comparisons (5 for
+        # 24 nodes) plus the final key check
+        self.m = InstrumentedHashMap(11, hash_function_1, treeify=True)
+        for key in itertools.permutations('abcd'):
+            self.m.put(''.join(key), 1)
+        self.m.reset_statistics()
+        self.m.get('abcd')
+        self.m.contains_key('dcba')
+        self.assertEqual(self.m.statistics()['length_histogram'], {6: 2})
 
+        # Plain maps carry no instrumentation
+        self.assertFalse(hasattr(HashMap(11, hash_function_1), '_stats'))
+        self.assertIsNone(HashMap(11, hash_function_1)._probes)
 
 if __name__ == '__main__':
     unittest.main()
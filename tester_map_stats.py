@@ -0,0 +1,42 @@
+import unittest
+from map_stats import *
+
+
+class TestMapStats(unittest.TestCase):
+    def test_lookups(self):
+        stats = MapStats()
+        for length, found in ((1, True), (1, True), (3, False), (2, True)):
+            stats.record_lookup(length, found)
+
+        snapshot = stats.snapshot(size=5)
+        self.assertEqual(snapshot['length_histogram'], {1: 2, 2: 1, 3: 1})
+        self.assertEqual(snapshot['lookups'], 4)
+        self.assertEqual(snapshot['hit_ratio'], 0.75)
+        self.assertEqual(snapshot['mean_length'], 1.75)
+        self.assertEqual(snapshot['max_length'], 3)
+        self.assertEqual(snapshot['size'], 5)
+
+        stats.reset()
+        self.assertEqual(stats.snapshot()['lookups'], 0)
+        self.assertEqual(stats.snapshot()['hit_ratio'], 0.0)
+
+    def test_resizes(self):
+        times = iter([0.0, 0.00025])
+        stats = MapStats(clock=lambda: next(times))
+        start = stats.clock()
+        stats.record_resize(11, 23, stats.clock() - start)
+        stats.record_resize(23, 23, 0.001)
+        stats.record_resize(23, 47, 0.0000005)
+
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot['resizes'], 2)
+        self.assertEqual(snapshot['compactions'], 1)
+        self.assertEqual(snapshot['resize_us_histogram'], {10: 1, 1000: 1})
+        self.assertAlmostEqual(snapshot['resize_total_seconds'], 0.0002505)
+        # Snapshots are copies
+        snapshot['resize_history'].clear()
+        self.assertEqual(len(stats.snapshot()['resize_history']), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
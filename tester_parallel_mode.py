@@ -0,0 +1,73 @@
+import os
+import random
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+import parallel_mode
+from parallel_mode import *
+
+
+class TestParallelMode(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = ProcessPoolExecutor(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def setUp(self):
+        # Use the pool even for the small inputs of these tests
+        self.min_items = parallel_mode.MIN_PARALLEL_ITEMS
+        parallel_mode.MIN_PARALLEL_ITEMS = 0
+
+    def tearDown(self):
+        parallel_mode.MIN_PARALLEL_ITEMS = self.min_items
+
+    def assertSameMode(self, result, expected):
+        self.assertEqual(as_list(result[0]), as_list(expected[0]))
+        self.assertEqual(result[1], expected[1])
+
+    def test_matches_find_mode(self):
+        rng = random.Random(261)
+        for distinct in (1, 5, 40, 500):
+            da = DynamicArray([rng.randrange(distinct) for _ in range(2000)])
+            self.assertSameMode(
+                parallel_find_mode(da, 2, executor=self.executor),
+                find_mode(da))
+
+        # Ties are reported in the order they reached the frequency
+        da = DynamicArray(['b', 'a', 'c', 'a', 'b', 'c', 'd'])
+        result = parallel_find_mode(da, 2, executor=self.executor)
+        self.assertEqual(as_list(result[0]), ['a', 'b', 'c'])
+        self.assertSameMode(result, find_mode(da))
+
+    def test_file_input(self):
+        rng = random.Random(7)
+        lines = ['word' + str(rng.randrange(60)) for _ in range(3000)]
+        lines[17] = ''
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False,
+                                         encoding='utf-8') as file:
+            file.write('\n'.join(lines) + '\n')
+        try:
+            for workers in (1, 2):
+                self.assertSameMode(
+                    parallel_find_mode(file.name, workers,
+                                       executor=self.executor),
+                    find_mode(DynamicArray(lines)))
+        finally:
+            os.remove(file.name)
+
+    def test_small_inputs(self):
+        self.assertSameMode(
+            parallel_find_mode(DynamicArray(), 2, executor=self.executor),
+            find_mode(DynamicArray()))
+
+        # Below the threshold no pool is needed
+        parallel_mode.MIN_PARALLEL_ITEMS = self.min_items
+        da = DynamicArray(['x', 'y', 'x'])
+        self.assertSameMode(parallel_find_mode(da, 4), (DynamicArray(['x']), 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
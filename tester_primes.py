@@ -0,0 +1,44 @@
+import unittest
+from primes import *
+
+
+def trial_division(number):
+    if number < 2:
+        return False
+    factor = 2
+    while factor * factor <= number:
+        if number % factor == 0:
+            return False
+        factor += 1
+    return True
+
+
+class TestPrimes(unittest.TestCase):
+    def test_is_prime_matches_trial_division(self):
+        for number in range(-5, 20000):
+            self.assertEqual(is_prime(number), trial_division(number), number)
+
+    def test_is_prime_large(self):
+        self.assertTrue(is_prime(2 ** 61 - 1))
+        self.assertFalse(is_prime((2 ** 31 - 1) * (2 ** 61 - 1)))
+        # Strong pseudoprime to bases 2 through 11
+        self.assertFalse(is_prime(3215031751))
+
+    def test_next_prime_semantics(self):
+        self.assertEqual(next_prime(2), 3)
+        self.assertEqual(next_prime(11), 11)
+        self.assertEqual(next_prime(20), 23)
+        self.assertEqual(next_prime(106), 107)
+        self.assertEqual(next_prime(2 ** 31), 2147483659)
+
+    def test_capacity_table(self):
+        for prime, following in zip(PRIME_CAPACITIES, PRIME_CAPACITIES[1:]):
+            self.assertTrue(is_prime(following))
+            # Nothing prime between the doubled value and the next entry
+            for number in range(2 * prime, following):
+                self.assertFalse(is_prime(number))
+            self.assertEqual(next_prime(2 * prime), following)
+
+
+if __name__ == '__main__':
+    unittest.main()
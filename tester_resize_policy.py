@@ -0,0 +1,37 @@
+import unittest
+from resize_policy import *
+
+
+class TestResizePolicy(unittest.TestCase):
+    def test_capacity_for(self):
+        self.assertEqual(ResizePolicy(grow_at=1.0).capacity_for(200), 200)
+        self.assertEqual(ResizePolicy(grow_at=0.5).capacity_for(200), 399)
+        self.assertEqual(ResizePolicy(grow_at=0.75).capacity_for(4), 5)
+
+    def test_shrink(self):
+        policy = ResizePolicy(grow_at=0.5, shrink_at=0.1, min_capacity=16)
+        self.assertFalse(policy.should_shrink(10, 100))
+        self.assertTrue(policy.should_shrink(9, 100))
+        self.assertFalse(policy.should_shrink(0, 16))
+        # Back to the load right after a growth, but not below the minimum
+        self.assertEqual(policy.shrunk_capacity(100), 401)
+        self.assertEqual(policy.shrunk_capacity(1), 16)
+        self.assertFalse(ResizePolicy().should_shrink(0, 1000))
+
+    def test_grown_capacity(self):
+        self.assertEqual(ResizePolicy().grown_capacity(11), 22)
+        # A small factor still grows a small table
+        self.assertEqual(ResizePolicy(growth_factor=1.05).grown_capacity(11),
+                         12)
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            ResizePolicy(grow_at=0.5, shrink_at=0.25)
+        with self.assertRaises(ValueError):
+            ResizePolicy(growth_factor=1)
+        with self.assertRaises(ValueError):
+            ResizePolicy(grow_at=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import random
+import unittest
+from threading import Thread
+from a6_include import hash_function_2
+from hash_map_sc import HashMap
+from snapshot_hash_map import *
+
+
+class TestSnapshotHashMap(unittest.TestCase):
+    def test_matches_hash_map(self):
+        rng = random.Random(261)
+        m, expected = SnapshotHashMap(), HashMap()
+        for _ in range(3000):
+            key = 'key' + str(rng.randrange(400))
+            if rng.random() < 0.7:
+                m.put(key, len(key))
+                expected.put(key, len(key))
+            else:
+                m.remove(key)
+                expected.remove(key)
+        self.assertEqual(m.get_size(), expected.get_size())
+        self.assertEqual(m.get_capacity(), expected.get_capacity())
+        self.assertEqual(m.empty_buckets(), expected.empty_buckets())
+        self.assertEqual(sorted(as_list(m.get_keys_and_values())),
+                         sorted(as_list(expected.get_keys_and_values())))
+        for i in range(400):
+            key = 'key' + str(i)
+            self.assertEqual(m.get(key), expected.get(key))
+            self.assertEqual(m.contains_key(key), expected.contains_key(key))
+
+        self.assertEqual(m.pop('key0', 'absent'), expected.get('key0')
+                         if expected.contains_key('key0') else 'absent')
+        m.resize_table(1)
+        self.assertGreaterEqual(m.get_capacity(), m.get_size())
+        m.clear()
+        self.assertEqual(m.get_size(), 0)
+        self.assertIsNone(m.get('key1'))
+
+    def test_snapshots(self):
+        m = SnapshotHashMap()
+        m.put_many(DynamicArray([('a', 1), ('b', 2), ('c', 3)]))
+        first = m.snapshot()
+        m.put('a', 10)
+        m.remove('b')
+        m.put_many([('k' + str(i), i) for i in range(100)])
+        m.clear()
+
+        # Older versions never change, across updates and resizes
+        self.assertEqual(first.get_size(), 3)
+        self.assertEqual([first.get(key) for key in 'abc'], [1, 2, 3])
+        self.assertEqual(first.get_capacity(), 11)
+        self.assertEqual(m.get_size(), 0)
+
+    def test_structural_sharing(self):
+        m = SnapshotHashMap(5000, function=hash_function_2)
+        m.put_many([('key' + str(i), i) for i in range(3000)])
+        before = m.snapshot()
+        m.put('key7', 'seven')
+        after = m.snapshot()
+
+        # One trie path is copied; every other subtree is shared
+        old_children, new_children = before._root, after._root
+        self.assertEqual(sum(old is not new for old, new
+                             in zip(old_children, new_children)), 1)
+        buckets = list(zip(before._buckets(), after._buckets()))
+        self.assertEqual(sum(old is not new for old, new in buckets), 1)
+        self.assertEqual(before.get('key7'), 7)
+        self.assertEqual(after.get('key7'), 'seven')
+
+    def test_concurrent_readers(self):
+        m = SnapshotHashMap()
+        m.put_many([('k' + str(i), 0) for i in range(50)])
+        errors = []
+
+        def read() -> None:
+            for _ in range(200):
+                snapshot = m.snapshot()
+                values = {snapshot.get('k' + str(i)) for i in range(50)}
+                if len(values) != 1:
+                    errors.append(values)
+
+        # Each batch replaces every value at once
+        readers = [Thread(target=read) for _ in range(4)]
+        for thread in readers:
+            thread.start()
+        for version in range(1, 100):
+            m.put_many([('k' + str(i), version) for i in range(50)])
+        for thread in readers:
+            thread.join()
+        self.assertEqual(errors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()